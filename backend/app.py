@@ -1,17 +1,31 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
 from flask_cors import CORS
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-from pymongo import MongoClient
-import time
+from selenium.common.exceptions import WebDriverException
+import google.generativeai as genai
 import os
 import json
-from typing import List, Dict
+import atexit
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List
 from teammate_matcher import TeammateMatcher
+from mongo_pool import MongoConnectionPool
+from match_cache import MatchScoreCache
+from participant_index import ParticipantIndexRegistry, search_text
+from scrape_jobs import ScrapeJobStore, ScrapeCancelled
+from ingest import summarize
+from snapshots import HackathonSnapshots
+from neighbor_index import NeighborStore, refresh_neighbors
+from team_formation import form_teams
+from scoring_engine import quick_score_weights_from_env
+from http_scraper import DevpostHttpScraper, AuthenticationFailed
+from scroll_loader import scroll_to_end, wait_for_initial_cards
+from dom_extractor import drain_cards, preload_known_ids, reported_total
+from delta_scrape import DeltaScrape
+from scrape_checkpoint import ScrapeCheckpoint
+from card_parser import extract_participants
+from driver_pool import ChromeDriverPool
+from chrome_profile import launch_chrome
 from dotenv import load_dotenv
-import google.generativeai as genai
 
 # Load environment variables from .env file
 load_dotenv()
@@ -24,8 +38,94 @@ MONGODB_URI = os.getenv("MONGODB_URI")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "devpost_data")
 COLLECTION_NAME = os.getenv("COLLECTION_NAME", "participants")
 
+# Shared connection pool (sizes/timeouts configurable via MONGODB_* env vars)
+mongo_pool = MongoConnectionPool.from_env(MONGODB_URI)
+
 # Gemini API configuration
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
+GEMINI_MAX_CONCURRENT_BATCHES = int(os.getenv('GEMINI_MAX_CONCURRENT_BATCHES', '4'))
+GEMINI_BATCH_TIMEOUT = float(os.getenv('GEMINI_BATCH_TIMEOUT', '60'))
+
+# Match score cache configuration
+MATCH_CACHE_SIZE = int(os.getenv('MATCH_CACHE_SIZE', '10000'))
+MATCH_CACHE_TTL_SECONDS = int(os.getenv('MATCH_CACHE_TTL_SECONDS', '86400'))
+MATCH_CACHE_PERSIST = os.getenv('MATCH_CACHE_PERSIST', 'false').lower() in ('1', 'true', 'yes')
+MATCH_CACHE_COLLECTION = os.getenv('MATCH_CACHE_COLLECTION', 'match_score_cache')
+
+# In-memory skill/interest/role indexes, rebuilt from MongoDB once older than this
+PARTICIPANT_INDEX_MAX_AGE_SECONDS = float(os.getenv('PARTICIPANT_INDEX_MAX_AGE_SECONDS', '600'))
+
+# find_teammates prefilter weights
+QUICK_SCORE_WEIGHTS = quick_score_weights_from_env()
+
+# Top-K prefilter candidates precomputed per participant after each ingest; the
+# all-pairs scoring is done in blocks of CHUNK_ROWS participants to bound memory
+TEAMMATE_NEIGHBORS_K = int(os.getenv('TEAMMATE_NEIGHBORS_K', '50'))
+TEAMMATE_NEIGHBORS_COLLECTION = os.getenv('TEAMMATE_NEIGHBORS_COLLECTION', 'teammate_neighbors')
+TEAMMATE_NEIGHBORS_CHUNK_ROWS = int(os.getenv('TEAMMATE_NEIGHBORS_CHUNK_ROWS', '512'))
+
+# Whole-hackathon team formation (/api/form-teams): the compatibility matrix holds
+# participants^2 float32s (~36MB at 3000, plus two chunk_rows x participants swap blocks),
+# at most MAX_CONCURRENT runs build one at a time, and the swap local search stops
+# after this many seconds/passes
+TEAM_FORMATION_MAX_PARTICIPANTS = int(os.getenv('TEAM_FORMATION_MAX_PARTICIPANTS', '3000'))
+TEAM_FORMATION_MAX_CONCURRENT = int(os.getenv('TEAM_FORMATION_MAX_CONCURRENT', '1'))
+TEAM_FORMATION_TIME_LIMIT_SECONDS = float(os.getenv('TEAM_FORMATION_TIME_LIMIT_SECONDS', '10'))
+TEAM_FORMATION_MAX_PASSES = int(os.getenv('TEAM_FORMATION_MAX_PASSES', '100'))
+
+# Candidates sent to Gemini by /api/search-teammates when ranked by profile similarity
+SEMANTIC_CANDIDATES = int(os.getenv('SEMANTIC_CANDIDATES', '30'))
+
+# Replaced hackathon snapshots stay readable this long before being dropped
+SNAPSHOT_RETIRE_GRACE_SECONDS = int(os.getenv('SNAPSHOT_RETIRE_GRACE_SECONDS', '300'))
+# Snapshots never published (ingest died before switching) are dropped once this old
+SNAPSHOT_STAGING_GRACE_SECONDS = int(os.getenv('SNAPSHOT_STAGING_GRACE_SECONDS', '3600'))
+
+# Background scrape jobs (run by scrape_worker.py)
+SCRAPE_JOBS_COLLECTION = os.getenv('SCRAPE_JOBS_COLLECTION', 'scrape_jobs')
+SCRAPE_WORKER_AUTOSTART = os.getenv('SCRAPE_WORKER_AUTOSTART', 'true').lower() in ('1', 'true', 'yes')
+
+# Scrape engine: 'selenium' scrolls the page in headless Chrome, 'http' fetches the
+# paginated listing directly with concurrent requests
+SCRAPE_ENGINE = os.getenv('SCRAPE_ENGINE', 'selenium').lower()
+SCRAPE_HTTP_CONCURRENCY = int(os.getenv('SCRAPE_HTTP_CONCURRENCY', '6'))
+SCRAPE_HTTP_MAX_RETRIES = int(os.getenv('SCRAPE_HTTP_MAX_RETRIES', '5'))
+
+# Selenium scrolling: longest wait for new cards per step, and unchanged steps before stopping
+SCRAPE_SCROLL_MAX_WAIT = float(os.getenv('SCRAPE_SCROLL_MAX_WAIT', '8'))
+SCRAPE_SCROLL_IDLE_ROUNDS = int(os.getenv('SCRAPE_SCROLL_IDLE_ROUNDS', '2'))
+
+# Selenium extraction: 'page_source' parses the finished page with BeautifulSoup,
+# 'browser' serializes cards in the page while scrolling and removes them from the DOM
+SCRAPE_EXTRACT_MODE = os.getenv('SCRAPE_EXTRACT_MODE', 'page_source').lower()
+# Most recent cards left in the DOM in 'browser' mode so the page keeps scrolling
+SCRAPE_DOM_KEEP_CARDS = int(os.getenv('SCRAPE_DOM_KEEP_CARDS', '20'))
+# Full scrapes with SCRAPE_ENGINE=http or SCRAPE_EXTRACT_MODE=browser checkpoint extracted
+# participants here and resume from them after a crash ('' disables checkpoints). HTTP
+# scrapes resume at the next ?page=N; Selenium ones re-scroll the listing from the top
+# (the infinite scroll cannot start mid-listing) but skip re-extracting known cards.
+# The default Selenium + page_source scrape does NOT checkpoint: it only has cards once
+# the whole listing has been scrolled.
+SCRAPE_CHECKPOINT_DIR = os.getenv('SCRAPE_CHECKPOINT_DIR', 'scrape_checkpoints')
+SCRAPE_CHECKPOINT_INTERVAL = float(os.getenv('SCRAPE_CHECKPOINT_INTERVAL', '30'))
+SCRAPE_CHECKPOINT_MAX_AGE_SECONDS = float(os.getenv('SCRAPE_CHECKPOINT_MAX_AGE_SECONDS', '21600'))
+# Delta re-scrapes stop after this many already-stored participants in a row
+SCRAPE_DELTA_KNOWN_RUN = int(os.getenv('SCRAPE_DELTA_KNOWN_RUN', '40'))
+# Processes used to parse very large page_source dumps (1 = parse in-process)
+SCRAPE_PARSE_PROCESSES = int(os.getenv('SCRAPE_PARSE_PROCESSES', '1'))
+
+# Lean browser profile: skip images, fonts, media and trackers while scrolling.
+# Experimental: not yet benchmarked against the default profile on a real listing
+SCRAPE_LEAN_BROWSER = os.getenv('SCRAPE_LEAN_BROWSER', 'false').lower() in ('1', 'true', 'yes')
+
+# Warm Chrome drivers kept by the scrape worker (0 = launch Chrome for every scrape)
+SCRAPE_DRIVER_POOL_SIZE = int(os.getenv('SCRAPE_DRIVER_POOL_SIZE', '1'))
+SCRAPE_DRIVER_MAX_USES = int(os.getenv('SCRAPE_DRIVER_MAX_USES', '20'))
+SCRAPE_DRIVER_MAX_AGE_SECONDS = float(os.getenv('SCRAPE_DRIVER_MAX_AGE_SECONDS', '3600'))
+# Seconds a scrape may go without progress before its driver is reclaimed; defaults to
+# the job heartbeat timeout so a stalled driver and a stalled job are given up together
+SCRAPE_DRIVER_LEASE_TIMEOUT = float(os.getenv('SCRAPE_DRIVER_LEASE_TIMEOUT',
+                                              os.getenv('SCRAPE_WORKER_HEARTBEAT_TIMEOUT', '300')))
 
 # Devpost cookies for authentication (loaded from environment variables)
 DEVPOST_COOKIES = [
@@ -37,27 +137,209 @@ DEVPOST_COOKIES = [
 ]
 
 
+participant_index = ParticipantIndexRegistry(
+    max_age_seconds=PARTICIPANT_INDEX_MAX_AGE_SECONDS,
+    profile_formatter=search_text
+)
+
+_matcher = None
+_matcher_lock = threading.Lock()
+_scrape_jobs = None
+_scrape_jobs_lock = threading.Lock()
+_snapshots = None
+_snapshots_lock = threading.Lock()
+_neighbor_store = None
+_neighbor_store_lock = threading.Lock()
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+_gemini_model = None
+_gemini_model_lock = threading.Lock()
+_team_formation_slots = threading.BoundedSemaphore(max(1, TEAM_FORMATION_MAX_CONCURRENT))
+
+
+def get_snapshots() -> HackathonSnapshots:
+    """Per-hackathon snapshot pointers backed by the shared pool"""
+    global _snapshots
+    if _snapshots is None:
+        with _snapshots_lock:
+            if _snapshots is None:
+                _snapshots = HackathonSnapshots(
+                    mongo_pool.client[DATABASE_NAME],
+                    base_collection_name=COLLECTION_NAME,
+                    retire_grace_seconds=SNAPSHOT_RETIRE_GRACE_SECONDS,
+                    staging_grace_seconds=SNAPSHOT_STAGING_GRACE_SECONDS
+                )
+    return _snapshots
+
+
+def get_gemini_model():
+    """Gemini model for endpoints that need no participant data (no MongoDB or matcher)"""
+    global _gemini_model
+    if _gemini_model is None:
+        with _gemini_model_lock:
+            if _gemini_model is None:
+                genai.configure(api_key=GEMINI_API_KEY)
+                _gemini_model = genai.GenerativeModel('gemini-2.5-flash')
+    return _gemini_model
+
+
+def get_neighbor_store() -> NeighborStore:
+    """Precomputed teammate neighbors backed by the shared pool"""
+    global _neighbor_store
+    if _neighbor_store is None:
+        with _neighbor_store_lock:
+            if _neighbor_store is None:
+                _neighbor_store = NeighborStore(
+                    mongo_pool.get_collection(DATABASE_NAME, TEAMMATE_NEIGHBORS_COLLECTION),
+                    k=TEAMMATE_NEIGHBORS_K,
+                    chunk_rows=TEAMMATE_NEIGHBORS_CHUNK_ROWS
+                )
+    return _neighbor_store
+
+
+def get_collection(hackathon: str = None):
+    """Collection serving a hackathon's participants (or the base collection)"""
+    if hackathon is not None:
+        return get_snapshots().collection_for(hackathon)
+    return mongo_pool.get_collection(DATABASE_NAME, COLLECTION_NAME)
+
+
+def get_scrape_jobs() -> ScrapeJobStore:
+    """Scrape job records backed by the shared pool"""
+    global _scrape_jobs
+    if _scrape_jobs is None:
+        with _scrape_jobs_lock:
+            if _scrape_jobs is None:
+                _scrape_jobs = ScrapeJobStore(mongo_pool.get_collection(DATABASE_NAME, SCRAPE_JOBS_COLLECTION))
+    return _scrape_jobs
+
+
+def get_driver_pool():
+    """Warm Chrome driver pool for scrapes, or None when disabled"""
+    global _driver_pool
+    if _driver_pool is None and SCRAPE_DRIVER_POOL_SIZE > 0:
+        with _driver_pool_lock:
+            if _driver_pool is None:
+                _driver_pool = ChromeDriverPool(
+                    lambda: launch_chrome(SCRAPE_LEAN_BROWSER),
+                    DEVPOST_COOKIES,
+                    size=SCRAPE_DRIVER_POOL_SIZE,
+                    max_uses=SCRAPE_DRIVER_MAX_USES,
+                    max_age_seconds=SCRAPE_DRIVER_MAX_AGE_SECONDS,
+                    lease_timeout=SCRAPE_DRIVER_LEASE_TIMEOUT
+                )
+    return _driver_pool
+
+
+def scrape_checkpoint_for(hackathon_name: str) -> ScrapeCheckpoint:
+    """Checkpoint file used by HTTP and browser-mode scrapes of a hackathon"""
+    return ScrapeCheckpoint(
+        ScrapeCheckpoint.path_for(SCRAPE_CHECKPOINT_DIR, hackathon_name),
+        interval_seconds=SCRAPE_CHECKPOINT_INTERVAL
+    )
+
+
+def get_matcher() -> TeammateMatcher:
+    """Long-lived TeammateMatcher reusing the shared pool and Gemini model"""
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                cache = MatchScoreCache(
+                    max_entries=MATCH_CACHE_SIZE,
+                    ttl_seconds=MATCH_CACHE_TTL_SECONDS,
+                    persistent_collection=(
+                        mongo_pool.get_collection(DATABASE_NAME, MATCH_CACHE_COLLECTION)
+                        if MATCH_CACHE_PERSIST else None
+                    )
+                )
+                _matcher = TeammateMatcher(
+                    GEMINI_API_KEY,
+                    client=mongo_pool.client,
+                    database_name=DATABASE_NAME,
+                    collection_name=COLLECTION_NAME,
+                    max_concurrent_batches=GEMINI_MAX_CONCURRENT_BATCHES,
+                    batch_timeout=GEMINI_BATCH_TIMEOUT,
+                    cache=cache,
+                    index_registry=participant_index,
+                    quick_score_weights=QUICK_SCORE_WEIGHTS,
+                    semantic_candidates=SEMANTIC_CANDIDATES,
+                    snapshots=get_snapshots(),
+                    neighbor_store=get_neighbor_store()
+                )
+    return _matcher
+
+
+@atexit.register
+def shutdown():
+    """Release pooled MongoDB connections on interpreter exit"""
+    global _matcher
+    _matcher = None
+    if _driver_pool is not None:
+        _driver_pool.close()
+    mongo_pool.close()
+
+
 class DevpostScraperService:
-    """Service to scrape Devpost participants using Selenium"""
+    """Service to scrape Devpost participants using Selenium or plain HTTP pagination"""
 
-    def __init__(self):
-        self.options = Options()
-        self.options.add_argument('--headless')
-        self.options.add_argument('--no-sandbox')
-        self.options.add_argument('--disable-dev-shm-usage')
-        self.options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
+    def __init__(self, engine: str = None, extract_mode: str = None, driver_pool: ChromeDriverPool = None,
+                 lean: bool = None):
+        """
+        Args:
+            engine: 'selenium' or 'http' (defaults to SCRAPE_ENGINE)
+            extract_mode: Selenium only: 'page_source' parses the whole page once scrolling
+                ends, 'browser' extracts cards in the page while scrolling and prunes them
+                from the DOM (defaults to SCRAPE_EXTRACT_MODE)
+            driver_pool: Warm, pre-authenticated drivers to lease instead of launching
+                Chrome for every scrape
+            lean: Block images, fonts and trackers while scrolling (defaults to SCRAPE_LEAN_BROWSER)
+        """
+        self.engine = engine or SCRAPE_ENGINE
+        self.extract_mode = extract_mode or SCRAPE_EXTRACT_MODE
+        self.driver_pool = driver_pool
+        self.lean = SCRAPE_LEAN_BROWSER if lean is None else lean
+
+    @staticmethod
+    def hackathon_name_from_url(hackathon_url: str) -> str:
+        """Extract hackathon name from URL"""
+        hackathon_name = hackathon_url.rstrip('/').split('/')[-1].replace('.devpost.com', '')
+        if 'devpost.com' not in hackathon_url:
+            hackathon_name = hackathon_url.split('//')[-1].split('.')[0]
+        return hackathon_name
 
-    def scrape_participants(self, hackathon_url: str, cookies: List[Dict]) -> tuple:
+    def scrape_participants(self, hackathon_url: str, cookies: List[Dict],
+                            progress_callback: Callable[[str, int], bool] = None,
+                            known_ids: Iterable[str] = None) -> tuple:
         """
         Scrape participants from a Devpost hackathon.
+
+        progress_callback, if given, is called with (phase, participants_loaded_so_far)
+        and may return False to cancel the scrape.
+
+        known_ids, if given, makes this a delta scrape: only the newest part of the
+        listing is read, stopping after SCRAPE_DELTA_KNOWN_RUN already-stored
+        participants in a row, so the result is partial and must be stored with
+        store_participants(..., partial=True). Selenium delta scrapes always extract
+        in the browser, since the stop condition needs cards while scrolling.
+
         Returns: (participants_list, hackathon_name, error_message)
         """
+        def report(phase: str, count: int = 0):
+            if lease is not None:
+                # Progress keeps the lease alive; abort if the pool already quit the driver
+                self.driver_pool.renew(lease)
+            if progress_callback is not None and progress_callback(phase, count) is False:
+                raise ScrapeCancelled('Scrape cancelled')
+
         driver = None
+        lease = None
+        discard_driver = False
+        checkpoint = None
+        delta = DeltaScrape(known_ids, SCRAPE_DELTA_KNOWN_RUN) if known_ids is not None else None
+        extract_in_browser = self.extract_mode == 'browser' or delta is not None
         try:
-            # Extract hackathon name from URL
-            hackathon_name = hackathon_url.rstrip('/').split('/')[-1].replace('.devpost.com', '')
-            if 'devpost.com' not in hackathon_url:
-                hackathon_name = hackathon_url.split('//')[-1].split('.')[0]
+            hackathon_name = self.hackathon_name_from_url(hackathon_url)
 
             # Construct participants URL
             if not hackathon_url.endswith('/participants'):
@@ -65,175 +347,148 @@ class DevpostScraperService:
             else:
                 participants_url = hackathon_url
 
-            driver = webdriver.Chrome(options=self.options)
-
-            # Navigate to base URL and set cookies
-            base_url = participants_url.split('/participants')[0]
-            driver.get(base_url)
-
-            for cookie in cookies:
-                if 'name' in cookie and 'value' in cookie:
-                    cookie_dict = {
-                        'name': cookie['name'],
-                        'value': cookie['value'],
-                        'domain': cookie.get('domain', '.devpost.com')
-                    }
-                    try:
-                        driver.add_cookie(cookie_dict)
-                    except:
-                        pass
+            if self.engine == 'http':
+                return self._scrape_over_http(participants_url, hackathon_name, cookies, report, delta)
 
-            # Navigate to participants page
+            report('launching')
+            if self.driver_pool is not None:
+                # Already running with the Devpost cookies set
+                lease = self.driver_pool.acquire()
+                driver = lease.driver
+            else:
+                driver = launch_chrome(self.lean)
+
+                # Navigate to base URL and set cookies
+                report('authenticating')
+                base_url = participants_url.split('/participants')[0]
+                driver.get(base_url)
+
+                for cookie in cookies:
+                    if 'name' in cookie and 'value' in cookie:
+                        cookie_dict = {
+                            'name': cookie['name'],
+                            'value': cookie['value'],
+                            'domain': cookie.get('domain', '.devpost.com')
+                        }
+                        try:
+                            driver.add_cookie(cookie_dict)
+                        except:
+                            pass
+
+            # Navigate to participants page and wait for the first cards to render
             driver.get(participants_url)
-            time.sleep(3)
+            wait_for_initial_cards(driver)
 
             # Check if authenticated
             if "Please log in" in driver.page_source:
                 return None, hackathon_name, "Authentication failed - cookies may be expired"
 
-            # Scroll to load all participants with improved logic
-            last_height = driver.execute_script("return document.body.scrollHeight")
-            participants_count = 0
-            no_change_count = 0
-            max_no_change = 3  # Allow 3 consecutive no-change attempts before stopping
-
+            # Scroll until no more participants load, waiting on the DOM rather than fixed sleeps
             print("Starting to scroll and load participants...")
-
-            while no_change_count < max_no_change:
-                # Scroll to bottom
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2.5)  # Increased wait time for slower networks
-
-                # Count participants
-                current_count = len(driver.find_elements(By.CLASS_NAME, "participant"))
-
-                if current_count > participants_count:
-                    print(f"Found {current_count} participants so far...")
-                    participants_count = current_count
-                    no_change_count = 0  # Reset counter when we find new participants
-                else:
-                    no_change_count += 1
-                    print(f"No new participants found (attempt {no_change_count}/{max_no_change})")
-
-                # Check if page height changed
-                new_height = driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height and no_change_count >= max_no_change:
-                    break
-                last_height = new_height
+            extracted = []
+            seen_ids = set()
+
+            # Full browser-extraction scrapes checkpoint to disk and resume after a crash
+            if extract_in_browser and delta is None and SCRAPE_CHECKPOINT_DIR:
+                checkpoint = scrape_checkpoint_for(hackathon_name)
+                checkpoint.url = participants_url
+                if checkpoint.load(max_age_seconds=SCRAPE_CHECKPOINT_MAX_AGE_SECONDS):
+                    print(f"↩️  Resuming {hackathon_name} with {len(checkpoint)} checkpointed participants")
+                    preload_known_ids(driver, checkpoint.known_ids())
+            elif not extract_in_browser and SCRAPE_CHECKPOINT_DIR:
+                print("ℹ️  page_source extraction does not checkpoint; an interrupted scrape restarts from scratch")
+
+            def drain(keep: int = SCRAPE_DOM_KEEP_CARDS):
+                # Pull newly loaded cards out of the page as records and prune them
+                records = drain_cards(driver, keep=keep)
+                if delta is not None:
+                    delta.observe(records)
+                if checkpoint is not None:
+                    checkpoint.add(records)
+                    checkpoint.maybe_save()
+                    return
+                for participant in records:
+                    participant_id = participant.get('participant_id')
+                    if participant_id and participant_id in seen_ids:
+                        continue
+                    seen_ids.add(participant_id)
+                    extracted.append(participant)
+
+            if delta is not None and delta.nothing_new(reported_total(driver)):
+                print("Participant count unchanged; only re-reading the first cards")
+                participants_count = 0
+            else:
+                participants_count = scroll_to_end(
+                    driver,
+                    progress=lambda count: report('scrolling', count),
+                    on_new_cards=drain if extract_in_browser else None,
+                    should_stop=(lambda: delta.done) if delta is not None else None,
+                    max_wait=SCRAPE_SCROLL_MAX_WAIT,
+                    idle_rounds=SCRAPE_SCROLL_IDLE_ROUNDS
+                )
 
             print(f"Finished scrolling. Total participants found: {participants_count}")
 
+            if extract_in_browser:
+                drain(keep=0)
+                if delta is not None:
+                    print(f"Delta scrape of {hackathon_name}: {delta.summary()}")
+                if checkpoint is not None:
+                    checkpoint.save()
+                    extracted = checkpoint.all()
+                for participant in extracted:
+                    participant['hackathon'] = hackathon_name
+                return extracted, hackathon_name, None
+
             # Parse the page
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            participants = self._extract_all_participants(soup, hackathon_name)
+            report('parsing', participants_count)
+            participants = extract_participants(driver.page_source, hackathon_name, processes=SCRAPE_PARSE_PROCESSES)
 
             return participants, hackathon_name, None
 
         except Exception as e:
+            discard_driver = isinstance(e, WebDriverException)
+            if checkpoint is not None:
+                # Keep what was extracted so a retry can resume
+                checkpoint.save()
             return None, hackathon_name if 'hackathon_name' in locals() else 'unknown', str(e)
 
         finally:
-            if driver:
+            if lease is not None:
+                self.driver_pool.release(lease, discard=discard_driver)
+            elif driver:
                 driver.quit()
 
-    def _extract_all_participants(self, soup: BeautifulSoup, hackathon_name: str) -> List[Dict]:
-        """Extract all participant data from the page"""
-        participants = []
-        participant_cards = soup.find_all('div', class_='participant')
-
-        for card in participant_cards:
-            participant_data = self._extract_participant_data(card)
-            if participant_data:
-                participant_data['hackathon'] = hackathon_name
-                participants.append(participant_data)
-
-        return participants
-
-    def _extract_participant_data(self, card) -> Dict:
-        """Extract participant information from a card element"""
-        data = {}
-
+    def _scrape_over_http(self, participants_url: str, hackathon_name: str, cookies: List[Dict],
+                          report: Callable, delta: DeltaScrape = None) -> tuple:
+        """Fetch the paginated participants listing without a browser"""
+        scraper = DevpostHttpScraper(
+            max_concurrency=SCRAPE_HTTP_CONCURRENCY,
+            max_retries=SCRAPE_HTTP_MAX_RETRIES
+        )
+
+        # Full scrapes checkpoint completed pages and resume from the next ?page=N
+        checkpoint = None
+        if delta is None and SCRAPE_CHECKPOINT_DIR:
+            checkpoint = scrape_checkpoint_for(hackathon_name)
+            checkpoint.url = participants_url
+            checkpoint.load(max_age_seconds=SCRAPE_CHECKPOINT_MAX_AGE_SECONDS)
+
+        report('fetching')
         try:
-            participant_id = card.get('data-participant-id')
-            if participant_id:
-                data['participant_id'] = participant_id
-
-            name_elem = card.find('div', class_='user-name')
-            if name_elem:
-                h5 = name_elem.find('h5')
-                if h5:
-                    data['name'] = h5.get_text().strip()
-
-            profile_link = card.find('a', class_='user-profile-link')
-            if profile_link:
-                data['profile_url'] = profile_link['href']
-
-            role_elem = card.find('span', class_='role')
-            if role_elem:
-                data['role'] = role_elem.get_text().strip()
-
-            stats = {}
-            projects_elem = card.find('li', class_='participant-software-count')
-            if projects_elem:
-                strong = projects_elem.find('strong')
-                if strong:
-                    stats['projects'] = int(strong.get_text().strip())
-
-            followers_elem = card.find('li', class_='participant-followers-count')
-            if followers_elem:
-                strong = followers_elem.find('strong')
-                if strong:
-                    stats['followers'] = int(strong.get_text().strip())
-
-            achievements_elem = card.find('li', class_='participant-achievements-count')
-            if achievements_elem:
-                strong = achievements_elem.find('strong')
-                if strong:
-                    stats['achievements'] = int(strong.get_text().strip())
-
-            if stats:
-                data['stats'] = stats
-
-            skills_section = card.find_all('span', class_='cp-tag')
-            if skills_section:
-                skills = []
-                for skill_tag in skills_section:
-                    skill_link = skill_tag.find('a')
-                    if skill_link:
-                        skills.append(skill_link.get_text().strip())
-                if skills:
-                    data['skills'] = skills
-
-            main_content = card.find('div', class_='main-content')
-            if main_content:
-                headers = main_content.find_all('h6')
-                for header in headers:
-                    header_text = header.get_text().strip().lower()
-
-                    if 'interest' in header_text:
-                        interests_list = header.find_next('ul')
-                        if interests_list:
-                            interests = []
-                            for li in interests_list.find_all('li'):
-                                interest_tag = li.find('span', class_='cp-tag')
-                                if interest_tag:
-                                    interest_link = interest_tag.find('a')
-                                    if interest_link:
-                                        interests.append(interest_link.get_text().strip())
-                            if interests:
-                                data['interests'] = interests
-
-            photo_elem = card.find('img', class_='user-photo')
-            if photo_elem and photo_elem.get('src'):
-                photo_url = photo_elem['src']
-                if photo_url.startswith('//'):
-                    photo_url = 'https:' + photo_url
-                data['photo_url'] = photo_url
-
-        except Exception as e:
-            print(f"Error extracting participant data: {e}")
+            participants = scraper.scrape(participants_url, cookies, lambda count: report('fetching', count), delta,
+                                          checkpoint)
+        except AuthenticationFailed as e:
+            return None, hackathon_name, str(e)
+        except Exception:
+            if checkpoint is not None:
+                # Keep the pages fetched so far so a retry can resume
+                checkpoint.save()
+            raise
 
-        return data
+        for participant in participants:
+            participant['hackathon'] = hackathon_name
+        return participants, hackathon_name, None
 
 
 @app.route('/')
@@ -244,18 +499,74 @@ def index():
         'message': 'Matcha Backend API is running',
         'endpoints': {
             'scrape': '/api/scrape',
+            'scrape_job': '/api/scrape/<job_id>',
             'find_teammates': '/api/find-teammates',
-            'stats': '/api/stats'
+            'find_teammates_stream': '/api/find-teammates/stream',
+            'search_teammates_stream': '/api/search-teammates/stream',
+            'form_teams': '/api/form-teams',
+            'stats': '/api/stats',
+            'health': '/api/health'
         }
     })
 
 
+@app.route('/api/health', methods=['GET'])
+def health():
+    """Readiness check that pings MongoDB through the shared pool"""
+    mongodb = mongo_pool.health_check()
+    status_code = 200 if mongodb['status'] == 'ok' else 503
+    return jsonify({
+        'status': mongodb['status'],
+        'mongodb': mongodb,
+        'gemini_configured': bool(GEMINI_API_KEY)
+    }), status_code
+
+
+def store_participants(hackathon_name: str, participants: List[Dict], partial: bool = False) -> Dict:
+    """
+    Publish a fresh scrape as a new snapshot of the hackathon (readers switch over
+    atomically once it is complete) and refresh its in-memory index.
+    Partial (delta) scrapes are upserted into the current snapshot instead and never
+    remove anyone. Returns inserted/updated/unchanged/removed counts.
+    """
+    snapshots = get_snapshots()
+    if partial:
+        counts = snapshots.apply_delta(hackathon_name, participants)
+    else:
+        counts = snapshots.publish(hackathon_name, participants)
+    print(f"Synced {hackathon_name}: {summarize(counts)}")
+
+    source = snapshots.collection_for(hackathon_name).name
+    version = snapshots.version_of(hackathon_name)
+    if not participant_index.apply_changes(hackathon_name, counts['changed_documents'], counts['removed_ids'],
+                                           source, version):
+        participant_index.get(hackathon_name, snapshots.collection_for(hackathon_name), version)
+
+    return summarize(counts)
+
+
+def refresh_teammate_neighbors(hackathon_name: str):
+    """
+    Recompute a hackathon's precomputed teammate neighbors after an ingest. Failures
+    only cost speed: until the neighbors match the data version, find_teammates
+    scores candidates live.
+    """
+    try:
+        refresh_neighbors(get_neighbor_store(), get_snapshots(), hackathon_name, QUICK_SCORE_WEIGHTS)
+    except Exception as e:
+        print(f"⚠️  Could not precompute teammate neighbors for {hackathon_name}: {e}")
+
+
 @app.route('/api/scrape', methods=['POST'])
 def scrape_and_store():
-    """Scrape hackathon participants and store in MongoDB"""
+    """
+    Queue a scrape of hackathon participants; poll /api/scrape/<job_id> for progress.
+    Send "mode": "delta" to only pick up new sign-ups for a hackathon already stored.
+    """
     try:
         data = request.get_json()
         hackathon_url = data.get('url', '').strip()
+        mode = data.get('mode', 'full')
 
         if not hackathon_url:
             return jsonify({'error': 'URL is required'}), 400
@@ -264,44 +575,43 @@ def scrape_and_store():
         if 'devpost.com' not in hackathon_url:
             return jsonify({'error': 'Invalid Devpost URL'}), 400
 
-        # Initialize scraper
-        scraper = DevpostScraperService()
+        if mode not in ('full', 'delta'):
+            return jsonify({'error': "mode must be 'full' or 'delta'"}), 400
 
-        # Scrape participants
-        participants, hackathon_name, error = scraper.scrape_participants(hackathon_url, DEVPOST_COOKIES)
+        # Concurrent requests for the same URL share one job
+        job = get_scrape_jobs().submit(
+            hackathon_url,
+            DevpostScraperService.hackathon_name_from_url(hackathon_url),
+            mode
+        )
 
-        if error:
-            return jsonify({'error': error}), 500
+        return jsonify(ScrapeJobStore.to_response(job)), 202 if job['created'] else 200
 
-        if not participants:
-            return jsonify({'error': 'No participants found'}), 404
-
-        # Store in MongoDB
-        client = MongoClient(MONGODB_URI)
-        db = client[DATABASE_NAME]
-        collection = db[COLLECTION_NAME]
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        # Clear entire MongoDB collection before inserting new data
-        collection.delete_many({})
-        print(f"Cleared entire MongoDB collection before inserting new data")
 
-        # Insert new data
-        if participants:
-            collection.insert_many(participants)
+@app.route('/api/scrape/<job_id>', methods=['GET'])
+def get_scrape_job(job_id):
+    """Status and progress of a scrape job"""
+    try:
+        job = get_scrape_jobs().get(job_id)
+        if not job:
+            return jsonify({'error': 'Scrape job not found'}), 404
+        return jsonify(ScrapeJobStore.to_response(job))
 
-        # Create indexes
-        collection.create_index('hackathon')
-        collection.create_index('participant_id')
-        collection.create_index('skills')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        client.close()
 
-        return jsonify({
-            'success': True,
-            'hackathon': hackathon_name,
-            'participants_count': len(participants),
-            'message': f'Successfully scraped and stored {len(participants)} participants!'
-        })
+@app.route('/api/scrape/<job_id>', methods=['DELETE'])
+def cancel_scrape_job(job_id):
+    """Cancel a queued or running scrape job"""
+    try:
+        job = get_scrape_jobs().cancel(job_id)
+        if not job:
+            return jsonify({'error': 'Scrape job not found'}), 404
+        return jsonify(ScrapeJobStore.to_response(job))
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -309,27 +619,28 @@ def scrape_and_store():
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
-    """Get statistics from MongoDB"""
-    try:
-        client = MongoClient(MONGODB_URI)
-        db = client[DATABASE_NAME]
-        collection = db[COLLECTION_NAME]
-
-        total = collection.count_documents({})
-
-        # Get hackathon breakdown
-        pipeline = [
-            {"$group": {"_id": "$hackathon", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}}
-        ]
-        hackathons = list(collection.aggregate(pipeline))
+    """
+    Participant statistics per hackathon, materialized at ingest time.
 
-        client.close()
-
-        return jsonify({
-            'total_participants': total,
-            'hackathons': [{'name': h['_id'], 'count': h['count']} for h in hackathons]
+    Served from an in-process cache keyed by the data version, which is also the
+    ETag: a request with a matching If-None-Match gets 304 without a body.
+    """
+    try:
+        snapshots = get_snapshots()
+        version = snapshots.stats.data_version()
+        etag = f"stats-{version}"
+        if request.if_none_match.contains(etag):
+            return Response(status=304, headers={'ETag': f'"{etag}"', 'Cache-Control': 'no-cache'})
+
+        version, hackathons = snapshots.stats.all(snapshots.sources)
+        response = jsonify({
+            'total_participants': sum(h['participant_count'] for h in hackathons),
+            'data_version': version,
+            'hackathons': [dict(h, count=h['participant_count']) for h in hackathons]
         })
+        response.set_etag(f"stats-{version}")
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -348,44 +659,34 @@ def find_teammates():
         if not hackathon:
             return jsonify({'error': 'Hackathon name is required'}), 400
 
-        client = MongoClient(MONGODB_URI)
-        db = client[DATABASE_NAME]
-        collection = db[COLLECTION_NAME]
+        collection = get_collection(hackathon)
 
         # Get the first participant from this hackathon
         current_user = collection.find_one({'hackathon': hackathon})
 
         if not current_user:
-            client.close()
             return jsonify({'error': 'No participants found for this hackathon'}), 404
 
         current_user_id = current_user.get('participant_id')
 
-        client.close()
-
         # Use Gemini to find matches
-        matcher = TeammateMatcher(GEMINI_API_KEY, MONGODB_URI)
-
-        try:
-            matches = matcher.find_teammates(
-                current_user_id=current_user_id,
-                hackathon=hackathon,
-                top_n=10
-            )
-
-            return jsonify({
-                'success': True,
-                'current_user': {
-                    'name': current_user.get('name'),
-                    'role': current_user.get('role') or current_user.get('tagline', ''),
-                    'skills': current_user.get('skills', []),
-                    'interests': current_user.get('interests', [])
-                },
-                'matches': matches
-            })
+        matcher = get_matcher()
+        matches = matcher.find_teammates(
+            current_user_id=current_user_id,
+            hackathon=hackathon,
+            top_n=10
+        )
 
-        finally:
-            matcher.close()
+        return jsonify({
+            'success': True,
+            'current_user': {
+                'name': current_user.get('name'),
+                'role': current_user.get('role') or current_user.get('tagline', ''),
+                'skills': current_user.get('skills', []),
+                'interests': current_user.get('interests', [])
+            },
+            'matches': matches
+        })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -408,39 +709,215 @@ def search_teammates():
         if not search_query:
             return jsonify({'error': 'Search query is required'}), 400
 
-        client = MongoClient(MONGODB_URI)
-        db = client [DATABASE_NAME]
-        collection = db[COLLECTION_NAME]
+        collection = get_collection(hackathon)
 
         # Get the first participant from this hackathon
         current_user = collection.find_one({'hackathon': hackathon})
 
         if not current_user:
-            client.close()
             return jsonify({'error': 'No participants found for this hackathon'}), 404
 
         current_user_id = current_user.get('participant_id')
 
-        client.close()
-
         # Use Gemini to find matches with custom search query
-        matcher = TeammateMatcher(GEMINI_API_KEY, MONGODB_URI)
+        matcher = get_matcher()
+        matches = matcher.find_teammates_with_query(
+            current_user_id=current_user_id,
+            hackathon=hackathon,
+            search_query=search_query,
+            top_n=10
+        )
 
+        return jsonify({
+            'success': True,
+            'matches': matches
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+def _sse_event(event: str, payload: Dict) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+def _sse_response(events: Iterator[Dict], extra_done: Dict = None) -> Response:
+    """
+    Stream matcher events to the client, reporting failures as a 'failed' event
+    (not 'error', which EventSource uses for dropped connections)
+    """
+
+    def generate():
         try:
-            matches = matcher.find_teammates_with_query(
-                current_user_id=current_user_id,
-                hackathon=hackathon,
-                search_query=search_query,
-                top_n=10
-            )
+            for event in events:
+                name = event.pop('event')
+                if name == 'done' and extra_done:
+                    event.update(extra_done)
+                yield _sse_event(name, event)
+        except Exception as e:
+            yield _sse_event('failed', {'error': str(e)})
 
-            return jsonify({
-                'success': True,
-                'matches': matches
-            })
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/find-teammates/stream', methods=['GET', 'POST'])
+def find_teammates_stream():
+    """Stream compatible teammates as each Gemini batch completes (Server-Sent Events)"""
+    try:
+        if not GEMINI_API_KEY:
+            return jsonify({'error': 'Gemini API key not configured'}), 500
+
+        # POST with a JSON body, or GET with query parameters for EventSource clients
+        data = request.get_json(silent=True) or request.args
+        hackathon = data.get('hackathon', '').strip()
+
+        if not hackathon:
+            return jsonify({'error': 'Hackathon name is required'}), 400
+
+        # Get the first participant from this hackathon
+        current_user = get_collection(hackathon).find_one({'hackathon': hackathon})
+
+        if not current_user:
+            return jsonify({'error': 'No participants found for this hackathon'}), 404
 
+        events = get_matcher().stream_teammates(
+            current_user_id=current_user.get('participant_id'),
+            hackathon=hackathon,
+            top_n=10
+        )
+
+        return _sse_response(events, extra_done={
+            'success': True,
+            'current_user': {
+                'name': current_user.get('name'),
+                'role': current_user.get('role') or current_user.get('tagline', ''),
+                'skills': current_user.get('skills', []),
+                'interests': current_user.get('interests', [])
+            }
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/search-teammates/stream', methods=['GET', 'POST'])
+def search_teammates_stream():
+    """Stream search results as each Gemini batch completes (Server-Sent Events)"""
+    try:
+        if not GEMINI_API_KEY:
+            return jsonify({'error': 'Gemini API key not configured'}), 500
+
+        data = request.get_json(silent=True) or request.args
+        hackathon = data.get('hackathon', '').strip()
+        search_query = data.get('search_query', '').strip()
+
+        if not hackathon:
+            return jsonify({'error': 'Hackathon name is required'}), 400
+
+        if not search_query:
+            return jsonify({'error': 'Search query is required'}), 400
+
+        # Get the first participant from this hackathon
+        current_user = get_collection(hackathon).find_one({'hackathon': hackathon})
+
+        if not current_user:
+            return jsonify({'error': 'No participants found for this hackathon'}), 404
+
+        events = get_matcher().stream_teammates_with_query(
+            current_user_id=current_user.get('participant_id'),
+            hackathon=hackathon,
+            search_query=search_query,
+            top_n=10
+        )
+
+        return _sse_response(events, extra_done={'success': True})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/form-teams', methods=['POST'])
+def form_hackathon_teams():
+    """
+    Split a hackathon's unmatched participants into teams of `team_size`, maximizing
+    the find_teammates compatibility within teams. Participants already on a team are
+    passed as `exclude_ids` (or the pool given as `participant_ids`); send
+    "summaries": true to have Gemini describe each team.
+    """
+    try:
+        data = request.get_json()
+        hackathon = data.get('hackathon', '').strip()
+        team_size = data.get('team_size', 4)
+        exclude_ids = data.get('exclude_ids') or []
+        participant_ids = data.get('participant_ids')
+        summaries = bool(data.get('summaries', False))
+
+        if not hackathon:
+            return jsonify({'error': 'Hackathon name is required'}), 400
+
+        if not isinstance(team_size, int) or not 2 <= team_size <= 10:
+            return jsonify({'error': 'team_size must be an integer from 2 to 10'}), 400
+
+        for name, ids in (('participant_ids', participant_ids), ('exclude_ids', exclude_ids)):
+            if ids is not None and not (isinstance(ids, list) and all(isinstance(i, str) for i in ids)):
+                return jsonify({'error': f'{name} must be a list of participant id strings'}), 400
+
+        if summaries and not GEMINI_API_KEY:
+            return jsonify({'error': 'Gemini API key not configured'}), 500
+
+        query = {'hackathon': hackathon}
+        if participant_ids is not None:
+            query['participant_id'] = {'$in': list(participant_ids)}
+        if exclude_ids:
+            query.setdefault('participant_id', {})['$nin'] = list(exclude_ids)
+
+        collection = get_collection(hackathon)
+        projection = {'_id': 0, **{field: 1 for field in TeammateMatcher.CANDIDATE_FIELDS}}
+        participants = list(collection.find(query, projection))
+
+        if len(participants) < 2:
+            return jsonify({'error': 'Not enough unmatched participants in this hackathon to form teams'}), 404
+
+        if len(participants) > TEAM_FORMATION_MAX_PARTICIPANTS:
+            return jsonify({'error': f'At most {TEAM_FORMATION_MAX_PARTICIPANTS} participants can be '
+                                     f'placed at once; narrow them down with participant_ids'}), 400
+
+        # Each run allocates its own participants^2 matrix; don't let concurrent requests stack them
+        if not _team_formation_slots.acquire(blocking=False):
+            return jsonify({'error': 'Teams are already being formed; try again shortly'}), 503
+        try:
+            result = form_teams(
+                participants,
+                team_size,
+                weights=QUICK_SCORE_WEIGHTS,
+                max_passes=TEAM_FORMATION_MAX_PASSES,
+                time_limit=TEAM_FORMATION_TIME_LIMIT_SECONDS
+            )
         finally:
-            matcher.close()
+            _team_formation_slots.release()
+        teams = result['teams']
+
+        team_summaries = [None] * len(teams)
+        if summaries:
+            team_summaries = get_matcher().summarize_teams([team['members'] for team in teams], hackathon)
+
+        return jsonify({
+            'success': True,
+            'hackathon': hackathon,
+            'team_size': team_size,
+            'participants_count': len(participants),
+            'teams': [dict(team, team=index + 1, score=round(team['score'], 2), summary=summary)
+                      for index, (team, summary) in enumerate(zip(teams, team_summaries))],
+            'objective': {key: round(value, 2) for key, value in result['objective'].items()},
+            'passes': result['passes'],
+            'swaps': result['swaps'],
+            'timings': result['timings']
+        })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -488,9 +965,7 @@ def generate_ideas():
 
         team_size = len(team_members)
 
-        # Create prompt for Gemini
-        genai.configure(api_key=GEMINI_API_KEY)
-        model = genai.GenerativeModel('gemini-2.5-flash')
+        model = get_gemini_model()
 
         prompt = f"""You are a hackathon project advisor. Generate 5 creative and feasible project ideas for a team with the following composition:
 
@@ -578,4 +1053,11 @@ Make sure the ideas are innovative, achievable within a hackathon timeframe, and
 
 
 if __name__ == '__main__':
+    # Start a local scrape worker once (not again in the debug reloader's child process)
+    if SCRAPE_WORKER_AUTOSTART and os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        import subprocess
+        import sys
+        worker = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scrape_worker.py')])
+        atexit.register(worker.terminate)
+
     app.run(debug=True, port=5000)
@@ -0,0 +1,120 @@
+"""
+Compare the default and lean Chrome profiles on a real participants page.
+
+For each profile it authenticates with the DEVPOST_* cookies, scrolls the page to the
+end with scroll_loader and reports scroll time, cards loaded, bytes transferred,
+requests made, JS heap and DOM node counts (via CDP), and the resident memory of the
+Chrome processes (peak while scrolling and at the end) via psutil.
+
+Until this has been run on a real listing and the results recorded, the lean
+profile (SCRAPE_LEAN_BROWSER / --lean) stays experimental.
+
+Usage:
+    python benchmark_browser.py https://hackutd-2025.devpost.com/participants
+    python benchmark_browser.py URL --runs 3
+"""
+from typing import Dict
+import argparse
+import os
+import time
+from dotenv import load_dotenv
+
+from chrome_profile import launch_chrome
+from scroll_loader import scroll_to_end, wait_for_initial_cards
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+load_dotenv()
+
+COOKIES = [
+    {'name': 'jwt', 'value': os.getenv('DEVPOST_JWT', '')},
+    {'name': 'remember_user_token', 'value': os.getenv('DEVPOST_REMEMBER_USER_TOKEN', '')},
+    {'name': '_devpost', 'value': os.getenv('DEVPOST_SESSION', '')},
+    {'name': 'aws-waf-token', 'value': os.getenv('DEVPOST_AWS_WAF_TOKEN', '')},
+    {'name': '_ga', 'value': os.getenv('DEVPOST_GA', '')},
+]
+
+_NETWORK_JS = """
+const entries = performance.getEntriesByType('resource');
+return [entries.length, entries.reduce((total, e) => total + (e.transferSize || 0), 0)];
+"""
+
+
+def chrome_rss_mb(driver) -> float:
+    """Resident memory of chromedriver's Chrome process tree, or NaN without psutil"""
+    if psutil is None:
+        return float('nan')
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes if p.is_running()) / 1024 / 1024
+    except (psutil.Error, AttributeError):
+        return float('nan')
+
+
+def run(url: str, lean: bool) -> Dict:
+    driver = launch_chrome(lean)
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})
+        driver.get(url.split('/participants')[0])
+        for cookie in COOKIES:
+            if cookie['value']:
+                driver.add_cookie({'name': cookie['name'], 'value': cookie['value'], 'domain': '.devpost.com'})
+
+        peak = {'rss_mb': 0.0}
+
+        def sample_rss(_count: int = 0):
+            # Once per scroll round; a process tree walk is negligible next to the scroll waits
+            rss = chrome_rss_mb(driver)
+            if rss > peak['rss_mb']:
+                peak['rss_mb'] = rss
+
+        start = time.perf_counter()
+        driver.get(url)
+        wait_for_initial_cards(driver)
+        cards = scroll_to_end(driver, progress=sample_rss)
+        elapsed = time.perf_counter() - start
+
+        sample_rss()
+        requests, transferred = driver.execute_script(_NETWORK_JS)
+        metrics = {m['name']: m['value'] for m in driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']}
+        return {
+            'seconds': elapsed,
+            'cards': cards,
+            'requests': requests,
+            'transferred_mb': transferred / 1024 / 1024,
+            'js_heap_mb': metrics.get('JSHeapUsedSize', 0) / 1024 / 1024,
+            'dom_nodes': int(metrics.get('Nodes', 0)),
+            'chrome_rss_mb': chrome_rss_mb(driver),
+            'peak_rss_mb': peak['rss_mb'] if psutil is not None else float('nan')
+        }
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('url', help='Hackathon participants URL')
+    parser.add_argument('--runs', type=int, default=1, help='Runs per profile (best time is reported)')
+    args = parser.parse_args()
+
+    results = {}
+    for label, lean in (('default', False), ('lean', True)):
+        runs = [run(args.url, lean) for _ in range(args.runs)]
+        results[label] = min(runs, key=lambda r: r['seconds'])
+
+    columns = ('seconds', 'cards', 'requests', 'transferred_mb', 'js_heap_mb', 'dom_nodes', 'chrome_rss_mb', 'peak_rss_mb')
+    print(f"\n{'':<16}" + ''.join(f"{label:>12}" for label in results))
+    for column in columns:
+        row = ''.join(f"{results[label][column]:>12,.1f}" if isinstance(results[label][column], float)
+                      else f"{results[label][column]:>12,}" for label in results)
+        print(f"{column:<16}{row}")
+    if psutil is None:
+        print("\n(psutil is missing: pip install -r requirements.txt to measure Chrome process memory)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark participant card extraction on saved participants pages.
+
+Compares the previous approach (a full html.parser tree of the whole page, then
+find_all over it) with card_parser.extract_participants (only div.participant subtrees
+with lxml when installed, the full html.parser tree otherwise), in-process and across a process pool, and checks that all of
+them return the same participants.
+
+Usage:
+    python benchmark_parser.py                              # bundled fixture, scaled to 2000 cards
+    python benchmark_parser.py --cards 10000 --processes 4
+    python benchmark_parser.py --html saved_page.html ...   # pages saved from driver.page_source
+"""
+from bs4 import BeautifulSoup
+from typing import Dict, List
+import argparse
+import os
+import re
+import time
+
+from card_parser import DEFAULT_PARSER, extract_participant_data, extract_participants, split_cards
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'participants_page.html')
+
+
+def legacy_extract(html: str) -> List[Dict]:
+    """The pre-card_parser path: parse the whole page, then scan it for cards"""
+    soup = BeautifulSoup(html, 'html.parser')
+    participants = []
+    for card in soup.find_all('div', class_='participant'):
+        data = extract_participant_data(card)
+        if data:
+            participants.append(data)
+    return participants
+
+
+def scale_page(html: str, cards: int) -> str:
+    """Repeat a page's cards (with fresh participant ids) until it holds `cards` of them"""
+    pieces = split_cards(html, 1 << 30)
+    if len(pieces) < 2:
+        return html
+
+    start = html.index(pieces[0])
+    # The last piece runs to the end of the page; cut it at the end of its card
+    last_card_end = pieces[-1].index('</div>\n\n') + len('</div>\n\n') if '</div>\n\n' in pieces[-1] else len(pieces[-1])
+    templates = pieces[:-1] + [pieces[-1][:last_card_end]]
+    tail = pieces[-1][last_card_end:]
+
+    body = []
+    for i in range(cards):
+        template = templates[i % len(templates)]
+        body.append(re.sub(r'data-participant-id="[^"]*"', f'data-participant-id="{i + 1}"', template, count=1))
+    return html[:start] + ''.join(body) + tail
+
+
+def measure(label: str, extract, html: str, repeat: int):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = extract(html)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<38} {best * 1000:9.1f} ms  {len(result) / best:12,.0f} cards/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--html', nargs='*', default=[FIXTURE], help='Saved participants pages')
+    parser.add_argument('--cards', type=int, default=2000, help='Scale each page to this many cards (0 = as saved)')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help='Process pool size')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (best is reported)')
+    args = parser.parse_args()
+
+    for path in args.html:
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        if args.cards:
+            html = scale_page(html, args.cards)
+
+        print(f"\n📄 {path} ({len(html) / 1024:,.0f} KiB)")
+        baseline = measure('full tree, html.parser (previous)', legacy_extract, html, args.repeat)
+        variants = {
+            f'strained, {DEFAULT_PARSER}': lambda page: extract_participants(page),
+            'full tree, html.parser (no lxml)': lambda page: extract_participants(page, parser='html.parser'),
+        }
+        if args.processes > 1:
+            variants[f'strained, {DEFAULT_PARSER}, {args.processes} processes'] = lambda page: extract_participants(
+                page, processes=args.processes, min_cards_per_process=1
+            )
+
+        for label, extract in variants.items():
+            result = measure(label, extract, html, args.repeat)
+            if result != baseline:
+                print(f"  ⚠️  {label} returned different participants than the previous parser")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
+from typing import List, Optional
+import bson
+import random
+import threading
+import time
+
+# Server errors worth retrying a chunk for: elections, shutdowns, timeouts, throttling
+TRANSIENT_ERROR_CODES = {6, 7, 89, 91, 189, 262, 9001, 10107, 11600, 11602, 13435, 13436, 16500}
+
+
+def is_transient(error: Exception) -> bool:
+    """True for errors after which re-sending the same (idempotent) chunk can succeed"""
+    if isinstance(error, ConnectionFailure):
+        return True
+    if isinstance(error, BulkWriteError):
+        details = error.details or {}
+        write_errors = details.get('writeErrors', [])
+        if details.get('writeConcernErrors') and not write_errors:
+            return True
+        return bool(write_errors) and all(e.get('code') in TRANSIENT_ERROR_CODES for e in write_errors)
+    if isinstance(error, OperationFailure):
+        return error.code in TRANSIENT_ERROR_CODES or error.has_error_label('RetryableWriteError')
+    return False
+
+
+class ThroughputReport:
+    """Live docs/sec and bytes/sec for a load, printed at most every `interval` seconds"""
+
+    def __init__(self, label: str = 'Loaded', interval: float = 2.0):
+        self.label = label
+        self.interval = interval
+        self.docs = 0
+        self.bytes = 0
+        self.started = time.perf_counter()
+        self._last_print = self.started
+        self._lock = threading.Lock()
+
+    def add(self, docs: int, size: int):
+        with self._lock:
+            self.docs += docs
+            self.bytes += size
+            now = time.perf_counter()
+            if now - self._last_print < self.interval:
+                return
+            self._last_print = now
+        print(f"  ⏩ {self.summary()}")
+
+    def summary(self) -> str:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return (f"{self.label} {self.docs:,} docs, {self.bytes / 1024 / 1024:,.1f} MB in {elapsed:.1f}s "
+                f"({self.docs / elapsed:,.0f} docs/s, {self.bytes / 1024 / 1024 / elapsed:,.1f} MB/s)")
+
+
+class BulkWriter:
+    """
+    Sends write operations to one collection in unordered bulk_write chunks.
+
+    Chunks of `chunk_size` operations are written by up to `workers` threads (the
+    MongoClient's connection pool is thread-safe), with at most two chunks per worker
+    in flight so memory stays bounded. A chunk that fails with a transient error is
+    re-sent after a backoff; operations must therefore be idempotent (upserts and
+    deletes keyed on the document's identity). The first permanent failure is raised
+    from add() or flush().
+    """
+
+    def __init__(self, collection, chunk_size: int = 1000, workers: int = 1, max_retries: int = 5,
+                 report: Optional[ThroughputReport] = None):
+        """
+        Args:
+            collection: pymongo collection to write to
+            chunk_size: Operations per bulk_write call
+            workers: Chunks written concurrently (1 writes inline)
+            max_retries: Attempts per chunk after a transient error
+            report: Optional throughput report fed after each written chunk
+        """
+        self.collection = collection
+        self.chunk_size = max(1, chunk_size)
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.report = report
+        self._chunk: List = []
+        self._chunk_bytes = 0
+        self._pending = set()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='bulk-write') \
+            if self.workers > 1 else None
+
+    def add(self, operation, document=None):
+        """Queue one operation; `document` (if any) is only used to measure bytes written"""
+        self._chunk.append(operation)
+        if document is not None and self.report is not None:
+            self._chunk_bytes += len(bson.encode(document))
+        if len(self._chunk) >= self.chunk_size:
+            self._submit()
+
+    def _write_chunk(self, chunk: List, size: int):
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.collection.bulk_write(chunk, ordered=False)
+                break
+            except Exception as e:
+                if attempt == self.max_retries or not is_transient(e):
+                    raise
+                backoff = min(30.0, 0.5 * 2 ** attempt) * (1 + random.random() * 0.25)
+                print(f"⏳ Bulk write of {len(chunk)} ops failed ({type(e).__name__}), retrying in {backoff:.1f}s")
+                time.sleep(backoff)
+        if self.report is not None:
+            self.report.add(len(chunk), size)
+
+    def _submit(self):
+        chunk, size = self._chunk, self._chunk_bytes
+        self._chunk, self._chunk_bytes = [], 0
+        if not chunk:
+            return
+        if self._executor is None:
+            self._write_chunk(chunk, size)
+            return
+
+        while len(self._pending) >= 2 * self.workers:
+            self._collect(wait(self._pending, return_when=FIRST_COMPLETED).done)
+        self._pending.add(self._executor.submit(self._write_chunk, chunk, size))
+
+    def _collect(self, done):
+        for future in done:
+            self._pending.discard(future)
+            future.result()
+
+    def flush(self):
+        """Write any queued operations and wait for every chunk in flight"""
+        self._submit()
+        if self._pending:
+            self._collect(wait(self._pending).done)
+
+    def close(self):
+        """Stop the worker threads (after flush(), or abandoning queued work on error)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.close()
+
@@ -0,0 +1,286 @@
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+import re
+
+try:
+    from lxml import etree
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    etree = None
+    DEFAULT_PARSER = 'html.parser'
+
+# Only participant cards are built into the tree; the rest of the page is skipped.
+# Worth it with lxml only: html.parser still tokenizes everything and the per-tag
+# strainer checks make it slower than building the full tree.
+CARD_STRAINER = SoupStrainer('div', class_='participant')
+
+# Opening tag of a card (class list containing exactly `participant`, not participant-*)
+_CARD_START = re.compile(r'<div\b[^>]*\bclass\s*=\s*["\'][^"\']*(?<![\w-])participant(?![\w-])', re.IGNORECASE)
+
+
+def extract_participant_data(card) -> Dict:
+    """Extract participant information from a card element"""
+    data = {}
+
+    try:
+        participant_id = card.get('data-participant-id')
+        if participant_id:
+            data['participant_id'] = participant_id
+
+        name_elem = card.find('div', class_='user-name')
+        if name_elem:
+            h5 = name_elem.find('h5')
+            if h5:
+                data['name'] = h5.get_text().strip()
+
+        profile_link = card.find('a', class_='user-profile-link')
+        if profile_link:
+            data['profile_url'] = profile_link['href']
+
+        role_elem = card.find('span', class_='role')
+        if role_elem:
+            data['role'] = role_elem.get_text().strip()
+
+        stats = {}
+        for field, class_name in (('projects', 'participant-software-count'),
+                                  ('followers', 'participant-followers-count'),
+                                  ('achievements', 'participant-achievements-count')):
+            stat_elem = card.find('li', class_=class_name)
+            if stat_elem:
+                strong = stat_elem.find('strong')
+                if strong:
+                    stats[field] = int(strong.get_text().strip())
+
+        if stats:
+            data['stats'] = stats
+
+        skills = []
+        for skill_tag in card.find_all('span', class_='cp-tag'):
+            skill_link = skill_tag.find('a')
+            if skill_link:
+                skills.append(skill_link.get_text().strip())
+        if skills:
+            data['skills'] = skills
+
+        main_content = card.find('div', class_='main-content')
+        if main_content:
+            for header in main_content.find_all('h6'):
+                if 'interest' not in header.get_text().strip().lower():
+                    continue
+                interests_list = header.find_next('ul')
+                if interests_list:
+                    interests = []
+                    for li in interests_list.find_all('li'):
+                        interest_tag = li.find('span', class_='cp-tag')
+                        if interest_tag:
+                            interest_link = interest_tag.find('a')
+                            if interest_link:
+                                interests.append(interest_link.get_text().strip())
+                    if interests:
+                        data['interests'] = interests
+
+        photo_elem = card.find('img', class_='user-photo')
+        if photo_elem and photo_elem.get('src'):
+            photo_url = photo_elem['src']
+            if photo_url.startswith('//'):
+                photo_url = 'https:' + photo_url
+            data['photo_url'] = photo_url
+
+    except Exception as e:
+        print(f"Error extracting participant data: {e}")
+
+    return data
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if etree is not None:
+    # Same lookups as extract_participant_data, compiled once and run by libxml2
+    _X_CARDS = etree.XPath(f"//div[{_has_class('participant')}]")
+    _X_NAME = etree.XPath(f"(.//div[{_has_class('user-name')}])[1]//h5")
+    _X_PROFILE = etree.XPath(f"(.//a[{_has_class('user-profile-link')}])[1]")
+    _X_ROLE = etree.XPath(f"(.//span[{_has_class('role')}])[1]")
+    _X_STATS = [
+        (field, etree.XPath(f"(.//li[{_has_class(class_name)}])[1]//strong"))
+        for field, class_name in (('projects', 'participant-software-count'),
+                                  ('followers', 'participant-followers-count'),
+                                  ('achievements', 'participant-achievements-count'))
+    ]
+    _X_TAG_LINK = etree.XPath(f".//span[{_has_class('cp-tag')}]")
+    _X_FIRST_LINK = etree.XPath("(.//a)[1]")
+    _X_MAIN = etree.XPath(f"(.//div[{_has_class('main-content')}])[1]")
+    _X_HEADERS = etree.XPath(".//h6")
+    _X_ITEMS = etree.XPath(".//li")
+    _X_FIRST_TAG = etree.XPath(f"(.//span[{_has_class('cp-tag')}])[1]")
+    _X_PHOTO = etree.XPath(f"(.//img[{_has_class('user-photo')}])[1]")
+
+
+def _text(element) -> str:
+    return ''.join(element.itertext()).strip()
+
+
+def _first(xpath, element):
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def _find_next(element, tag: str):
+    """First `tag` after `element` in document order, like bs4's find_next (stops at the first hit)"""
+    found = next(element.iterdescendants(tag), None)
+    node = element
+    while found is None and node is not None:
+        for sibling in node.itersiblings():
+            found = next(sibling.iter(tag), None)
+            if found is not None:
+                break
+        node = node.getparent()
+    return found
+
+
+def _link_texts(tags) -> List[str]:
+    texts = []
+    for tag in tags:
+        link = _first(_X_FIRST_LINK, tag)
+        if link is not None:
+            texts.append(_text(link))
+    return texts
+
+
+def _extract_lxml(card) -> Dict:
+    """extract_participant_data for an lxml element"""
+    data = {}
+
+    try:
+        participant_id = card.get('data-participant-id')
+        if participant_id:
+            data['participant_id'] = participant_id
+
+        h5 = _first(_X_NAME, card)
+        if h5 is not None:
+            data['name'] = _text(h5)
+
+        profile_link = _first(_X_PROFILE, card)
+        if profile_link is not None:
+            data['profile_url'] = profile_link.attrib['href']
+
+        role_elem = _first(_X_ROLE, card)
+        if role_elem is not None:
+            data['role'] = _text(role_elem)
+
+        stats = {}
+        for field, xpath in _X_STATS:
+            strong = _first(xpath, card)
+            if strong is not None:
+                stats[field] = int(_text(strong))
+        if stats:
+            data['stats'] = stats
+
+        skills = _link_texts(_X_TAG_LINK(card))
+        if skills:
+            data['skills'] = skills
+
+        main_content = _first(_X_MAIN, card)
+        if main_content is not None:
+            for header in _X_HEADERS(main_content):
+                if 'interest' not in _text(header).lower():
+                    continue
+                interests_list = _find_next(header, 'ul')
+                if interests_list is not None:
+                    tags = [tag for tag in (_first(_X_FIRST_TAG, li) for li in _X_ITEMS(interests_list))
+                            if tag is not None]
+                    interests = _link_texts(tags)
+                    if interests:
+                        data['interests'] = interests
+
+        photo_elem = _first(_X_PHOTO, card)
+        if photo_elem is not None and photo_elem.get('src'):
+            photo_url = photo_elem.get('src')
+            if photo_url.startswith('//'):
+                photo_url = 'https:' + photo_url
+            data['photo_url'] = photo_url
+
+    except Exception as e:
+        print(f"Error extracting participant data: {e}")
+
+    return data
+
+
+def parse_cards(html: str, parser: str = None) -> List:
+    """Parse the `div.participant` subtrees of a page (just those, with lxml)"""
+    parser = parser or DEFAULT_PARSER
+    soup = BeautifulSoup(html, parser, parse_only=CARD_STRAINER if parser == 'lxml' else None)
+    return soup.find_all('div', class_='participant')
+
+
+def _extract_lxml_page(html: str) -> Optional[List[Dict]]:
+    """Straight lxml + XPath, several times faster than walking bs4 trees; None if lxml can't take it"""
+    try:
+        root = etree.fromstring(html, etree.HTMLParser())
+    except ValueError:
+        # e.g. an XML encoding declaration in a str
+        return None
+    cards = _X_CARDS(root) if root is not None else []
+    return [data for data in map(_extract_lxml, cards) if data]
+
+
+def _extract_chunk(args) -> List[Dict]:
+    html, parser = args
+    if parser == 'lxml' and etree is not None and html.strip():
+        participants = _extract_lxml_page(html)
+        if participants is not None:
+            return participants
+    return [data for data in map(extract_participant_data, parse_cards(html, parser)) if data]
+
+
+def split_cards(html: str, chunks: int) -> List[str]:
+    """
+    Split a page into roughly equal pieces at card boundaries, so each piece can be
+    parsed on its own. Every card lands whole in exactly one piece.
+    """
+    starts = [match.start() for match in _CARD_START.finditer(html)]
+    if chunks <= 1 or len(starts) < 2:
+        return [html]
+
+    per_chunk = -(-len(starts) // chunks)
+    bounds = starts[::per_chunk] + [len(html)]
+    return [html[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+def extract_participants(html: str, hackathon_name: Optional[str] = None, parser: str = None,
+                         processes: int = 1, min_cards_per_process: int = 500) -> List[Dict]:
+    """
+    Extract every participant card from a participants page.
+
+    Args:
+        html: Page HTML (e.g. driver.page_source)
+        hackathon_name: Stored on each participant when given
+        parser: BeautifulSoup parser; lxml when installed, else html.parser
+        processes: Parse pieces of the page in this many processes for very large pages
+        min_cards_per_process: Fewer cards than this per process are parsed in-process
+
+    Returns:
+        Participant dicts in page order
+    """
+    parser = parser or DEFAULT_PARSER
+
+    pieces = [html]
+    if processes > 1:
+        card_count = sum(1 for _ in _CARD_START.finditer(html))
+        processes = min(processes, card_count // max(1, min_cards_per_process))
+        if processes > 1:
+            pieces = split_cards(html, processes)
+
+    if len(pieces) == 1:
+        participants = _extract_chunk((html, parser))
+    else:
+        with ProcessPoolExecutor(max_workers=len(pieces)) as pool:
+            participants = [data for chunk in pool.map(_extract_chunk, [(piece, parser) for piece in pieces])
+                            for data in chunk]
+
+    if hackathon_name is not None:
+        for participant in participants:
+            participant['hackathon'] = hackathon_name
+    return participants
@@ -0,0 +1,73 @@
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Lean profile: content the scrapers never look at. Card HTML and stylesheets still
+# load (the infinite scroll needs the real layout), and photo_url is read from the
+# <img src> attribute, which is there whether or not the image is fetched.
+BLOCKED_URL_PATTERNS = [
+    # Images
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.avif',
+    # Fonts
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*fonts.googleapis.com*', '*fonts.gstatic.com*',
+    # Media
+    '*.mp4', '*.webm', '*.mp3',
+    # Analytics and trackers
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+    '*connect.facebook.com*', '*hotjar.com*', '*segment.io*', '*segment.com*', '*mixpanel.com*',
+    '*intercom.io*', '*intercomcdn.com*', '*newrelic.com*', '*nr-data.net*', '*quantserve.com*',
+    '*scorecardresearch.com*', '*ads-twitter.com*', '*linkedin.com/px*', '*bat.bing.com*',
+]
+
+# Chrome content settings: 2 = block
+LEAN_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.managed_default_content_settings.media_stream': 2,
+}
+
+
+def chrome_options(lean: bool = False) -> Options:
+    """Headless Chrome options used for scraping; `lean` skips images and other heavy content"""
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument(f'user-agent={USER_AGENT}')
+
+    if lean:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--disable-remote-fonts')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-background-networking')
+        options.add_argument('--mute-audio')
+        options.add_experimental_option('prefs', LEAN_PREFS)
+    return options
+
+
+def block_heavy_requests(driver):
+    """Block fonts, media and trackers (and any images the prefs let through) via CDP"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except (WebDriverException, AttributeError) as e:
+        # Non-Chromium drivers have no CDP; content settings still apply
+        print(f"⚠️  Could not enable request blocking: {e}")
+
+
+def launch_chrome(lean: bool = False):
+    """
+    Start a headless Chrome for scraping, with the lean profile if requested.
+
+    The lean profile is experimental: it has not been benchmarked against the default
+    profile on a real listing yet (benchmark_browser.py), so its effect on scroll time,
+    memory and card loading is unverified.
+    """
+    if lean:
+        print("⚠️  Using the experimental lean Chrome profile (unbenchmarked; check that cards still load)")
+    driver = webdriver.Chrome(options=chrome_options(lean))
+    if lean:
+        block_heavy_requests(driver)
+    return driver
@@ -0,0 +1,63 @@
+from typing import Dict, Iterable, Optional
+import re
+
+# "1,234 participants" as shown above the listing
+_REPORTED_TOTAL = re.compile(r'([\d,]+)\s+participants?\b', re.IGNORECASE)
+_TAGS = re.compile(r'<[^>]+>')
+
+
+def reported_total_in_html(html: str) -> Optional[int]:
+    """Participant total shown on a listing page's HTML, if any"""
+    match = _REPORTED_TOTAL.search(_TAGS.sub(' ', html or ''))
+    if not match:
+        return None
+    digits = match.group(1).replace(',', '')
+    return int(digits) if digits else None
+
+
+class DeltaScrape:
+    """
+    Stop condition for re-scraping a hackathon that is already stored.
+
+    The listing shows the newest sign-ups first, so a re-scrape only has to read
+    until it reaches participants it already has: once `stop_after` known ids in a
+    row have been seen, the rest of the listing is assumed unchanged. If the page
+    reports exactly as many participants as are known, there is nothing new to load.
+    Participants are fed in listing order through observe().
+    """
+
+    def __init__(self, known_ids: Iterable[str], stop_after: int = 40):
+        """
+        Args:
+            known_ids: participant_ids already stored for the hackathon
+            stop_after: Consecutive known participants that end the scrape
+        """
+        self.known_ids = set(known_ids)
+        self.stop_after = max(1, stop_after)
+        self.run = 0
+        self.new = 0
+        self.known_seen = 0
+
+    def observe(self, participants: Iterable[Dict]):
+        """Record participants in listing order"""
+        for participant in participants:
+            participant_id = participant.get('participant_id')
+            if not participant_id:
+                continue
+            if participant_id in self.known_ids:
+                self.run += 1
+                self.known_seen += 1
+            else:
+                self.run = 0
+                self.new += 1
+
+    @property
+    def done(self) -> bool:
+        return self.run >= self.stop_after
+
+    def nothing_new(self, reported_total: Optional[int]) -> bool:
+        """True when the page's participant total matches what is already stored"""
+        return reported_total is not None and reported_total == len(self.known_ids)
+
+    def summary(self) -> str:
+        return f"{self.new} new, {self.known_seen} already known"
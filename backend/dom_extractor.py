@@ -0,0 +1,144 @@
+from selenium.common.exceptions import WebDriverException
+from typing import Dict, List, Optional
+
+# Marks cards whose records were already returned
+EXTRACTED_ATTR = 'data-matcha-extracted'
+
+# Serializes cards not yet extracted into the same fields as
+# card_parser.extract_participant_data, then removes extracted cards from
+# the DOM except the last `keep`, so the page stays scrollable for infinite scroll.
+# window.__matchaPruned counts removed cards so loaders can still see the total.
+# Cards whose id is in window.__matchaKnownIds (see preload_known_ids) are pruned
+# without being returned.
+_DRAIN_CARDS_JS = """
+const cardClass = arguments[0], keep = arguments[1], marker = arguments[2];
+const text = (el) => el ? el.textContent.trim() : null;
+const toInt = (el) => {
+    const value = el ? parseInt(el.textContent.trim(), 10) : NaN;
+    return Number.isNaN(value) ? null : value;
+};
+const tagLinks = (tags) => {
+    const values = [];
+    for (const tag of tags) {
+        const link = tag.querySelector('a');
+        if (link) values.push(link.textContent.trim());
+    }
+    return values;
+};
+
+const extract = (card) => {
+    const data = {};
+    const participantId = card.getAttribute('data-participant-id');
+    if (participantId) data.participant_id = participantId;
+
+    const nameElem = card.querySelector('div.user-name');
+    const h5 = nameElem ? nameElem.querySelector('h5') : null;
+    if (h5) data.name = text(h5);
+
+    const profileLink = card.querySelector('a.user-profile-link');
+    if (profileLink && profileLink.getAttribute('href') !== null) data.profile_url = profileLink.getAttribute('href');
+
+    const role = card.querySelector('span.role');
+    if (role) data.role = text(role);
+
+    const stats = {};
+    for (const [field, cls] of [['projects', 'participant-software-count'],
+                                ['followers', 'participant-followers-count'],
+                                ['achievements', 'participant-achievements-count']]) {
+        const item = card.querySelector('li.' + cls);
+        const value = item ? toInt(item.querySelector('strong')) : null;
+        if (value !== null) stats[field] = value;
+    }
+    if (Object.keys(stats).length) data.stats = stats;
+
+    const skills = tagLinks(card.querySelectorAll('span.cp-tag'));
+    if (skills.length) data.skills = skills;
+
+    const main = card.querySelector('div.main-content');
+    if (main) {
+        for (const header of main.querySelectorAll('h6')) {
+            if (!text(header).toLowerCase().includes('interest')) continue;
+            const list = Array.from(card.querySelectorAll('ul')).find(
+                (ul) => header.compareDocumentPosition(ul) & Node.DOCUMENT_POSITION_FOLLOWING
+            );
+            if (!list) continue;
+            const tags = [];
+            for (const li of list.querySelectorAll('li')) {
+                const tag = li.querySelector('span.cp-tag');
+                if (tag) tags.push(tag);
+            }
+            const interests = tagLinks(tags);
+            if (interests.length) data.interests = interests;
+        }
+    }
+
+    const photo = card.querySelector('img.user-photo');
+    if (photo && photo.getAttribute('src')) {
+        let photoUrl = photo.getAttribute('src');
+        if (photoUrl.startsWith('//')) photoUrl = 'https:' + photoUrl;
+        data.photo_url = photoUrl;
+    }
+    return data;
+};
+
+const cards = Array.from(document.querySelectorAll('div.' + cardClass));
+const records = [];
+const known = window.__matchaKnownIds;
+for (const card of cards) {
+    if (card.hasAttribute(marker)) continue;
+    if (known && known.has(card.getAttribute('data-participant-id'))) {
+        // Already extracted before a resume; prune without serializing
+        card.setAttribute(marker, '1');
+        continue;
+    }
+    try {
+        const record = extract(card);
+        if (Object.keys(record).length) records.push(record);
+    } catch (e) {}
+    card.setAttribute(marker, '1');
+}
+
+const removable = cards.slice(0, Math.max(0, cards.length - keep));
+for (const card of removable) card.remove();
+window.__matchaPruned = (window.__matchaPruned || 0) + removable.length;
+return records;
+"""
+
+
+def drain_cards(driver, card_class: str = 'participant', keep: int = 20) -> List[Dict]:
+    """
+    Extract participant records from cards loaded since the last call, in the page,
+    and prune them from the DOM so Chrome's memory stays flat while scrolling.
+
+    Args:
+        driver: Selenium WebDriver on the participants page
+        card_class: CSS class of one card
+        keep: Most recent cards left in place so the page can still be scrolled
+
+    Returns:
+        Participant dicts with the same fields as card_parser.extract_participant_data
+    """
+    return driver.execute_script(_DRAIN_CARDS_JS, card_class, keep, EXTRACTED_ATTR) or []
+
+
+def preload_known_ids(driver, participant_ids: List[str]):
+    """
+    Tell drain_cards which participants are already extracted (e.g. restored from a
+    checkpoint) so their cards are pruned without being serialized again. Must be
+    called after navigating to the participants page.
+    """
+    driver.execute_script("window.__matchaKnownIds = new Set(arguments[0]);", list(participant_ids))
+
+
+_REPORTED_TOTAL_JS = """
+const match = document.body.innerText.match(/([\\d,]+)\\s+participants?\\b/i);
+return match ? parseInt(match[1].replace(/,/g, ''), 10) : null;
+"""
+
+
+def reported_total(driver) -> Optional[int]:
+    """Participant total shown on the page (e.g. "1,234 participants"), if any"""
+    try:
+        return driver.execute_script(_REPORTED_TOTAL_JS)
+    except WebDriverException:
+        return None
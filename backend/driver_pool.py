@@ -0,0 +1,269 @@
+from selenium.common.exceptions import WebDriverException
+from typing import Callable, Dict, List
+from contextlib import contextmanager
+import threading
+import time
+
+
+class DriverLeaseTimeout(Exception):
+    """Raised when no pooled driver frees up within the acquire timeout"""
+
+
+class DriverReclaimed(Exception):
+    """Raised in a scrape whose driver was reclaimed after its lease timed out"""
+
+
+class PooledDriver:
+    """A pooled WebDriver and its bookkeeping"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+        self.leased_at = None
+        # Set when the pool takes the driver back from a lease that ran too long
+        self.reclaimed = False
+
+
+class ChromeDriverPool:
+    """
+    Pre-started, pre-authenticated headless Chrome drivers shared by scrapes.
+
+    Drivers are launched in the background and bootstrapped with the Devpost cookies
+    (which are set on .devpost.com, so they cover every hackathon subdomain), so a
+    scrape can navigate straight to the participants page. Leases are health-checked
+    before being handed out; drivers are recycled after `max_uses` scrapes or
+    `max_age_seconds`, and a lease not renewed for `lease_timeout` (scrapes renew it
+    as they make progress) is assumed stuck and quit by a background reaper, which
+    frees its slot and marks the lease `reclaimed` so the scrape holding it can abort.
+    """
+
+    def __init__(self, driver_factory: Callable, cookies: List[Dict], bootstrap_url: str = 'https://devpost.com',
+                 size: int = 1, max_uses: int = 20, max_age_seconds: float = 3600,
+                 lease_timeout: float = 300, acquire_timeout: float = 120):
+        """
+        Args:
+            driver_factory: Returns a new WebDriver
+            cookies: List of cookie dictionaries with 'name' and 'value' keys
+            bootstrap_url: Page opened to set the cookies on
+            size: Maximum number of drivers (idle + leased)
+            max_uses: Scrapes served by a driver before it is replaced
+            max_age_seconds: Age after which an idle driver is replaced
+            lease_timeout: Seconds a lease may go without renew() before it is reclaimed
+            acquire_timeout: Seconds acquire() waits for a free driver
+        """
+        self.driver_factory = driver_factory
+        self.cookies = cookies
+        self.bootstrap_url = bootstrap_url
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_age_seconds = max_age_seconds
+        self.lease_timeout = lease_timeout
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: List[PooledDriver] = []
+        self._leased: List[PooledDriver] = []
+        self._starting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._reaper = None
+
+    def _total(self) -> int:
+        return len(self._idle) + len(self._leased) + self._starting
+
+    def _launch(self) -> PooledDriver:
+        """Start a driver and set the auth cookies on it"""
+        driver = self.driver_factory()
+        try:
+            driver.get(self.bootstrap_url)
+            for cookie in self.cookies:
+                if cookie.get('name') and cookie.get('value'):
+                    try:
+                        driver.add_cookie({
+                            'name': cookie['name'],
+                            'value': cookie['value'],
+                            'domain': cookie.get('domain', '.devpost.com')
+                        })
+                    except WebDriverException as e:
+                        print(f"Failed to add cookie {cookie['name']}: {e}")
+        except Exception:
+            self._quit(driver)
+            raise
+        return PooledDriver(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _healthy(self, pooled: PooledDriver) -> bool:
+        if time.monotonic() - pooled.created_at > self.max_age_seconds:
+            return False
+        try:
+            return pooled.driver.execute_script('return 1') == 1
+        except WebDriverException:
+            return False
+
+    def _warm(self):
+        """Launch drivers in the background until the pool is full"""
+        def launch_one():
+            try:
+                pooled = self._launch()
+            except Exception as e:
+                print(f"⚠️  Could not start a pooled Chrome driver: {e}")
+                pooled = None
+            with self._cond:
+                self._starting -= 1
+                if pooled is not None:
+                    if self._closed:
+                        self._quit(pooled.driver)
+                    else:
+                        self._idle.append(pooled)
+                self._cond.notify_all()
+
+        with self._cond:
+            missing = 0 if self._closed else self.size - self._total()
+            self._starting += max(0, missing)
+        for _ in range(max(0, missing)):
+            threading.Thread(target=launch_one, name='chrome-warmup', daemon=True).start()
+
+    def start(self):
+        """Pre-start drivers so the first scrape doesn't wait for Chrome"""
+        self._start_reaper()
+        self._warm()
+
+    def _start_reaper(self):
+        """Check leases on a daemon thread, so a stuck lease is reclaimed even if nobody calls acquire()"""
+        with self._cond:
+            if self._reaper is not None or self._closed:
+                return
+            self._reaper = threading.Thread(target=self._reap_loop, name='chrome-lease-reaper', daemon=True)
+        self._reaper.start()
+
+    def _reap_loop(self):
+        interval = max(1.0, min(60.0, self.lease_timeout / 4))
+        with self._cond:
+            while not self._closed:
+                self._reap_expired_leases()
+                self._cond.wait(interval)
+
+    def _reap_expired_leases(self):
+        """Quit drivers whose lease ran past lease_timeout (call with the lock held)"""
+        now = time.monotonic()
+        for pooled in [p for p in self._leased if now - p.leased_at > self.lease_timeout]:
+            self._leased.remove(pooled)
+            pooled.reclaimed = True
+            print(f"⚠️  Reclaiming a Chrome driver whose lease saw no progress for {now - pooled.leased_at:.0f}s")
+            threading.Thread(target=self._quit, args=(pooled.driver,), daemon=True).start()
+
+    def acquire(self) -> PooledDriver:
+        """Lease a healthy driver, starting one if the pool has room"""
+        self._start_reaper()
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError('Driver pool is closed')
+                self._reap_expired_leases()
+
+                pooled = self._idle.pop() if self._idle else None
+                if pooled is not None:
+                    # Counted as leased while it is health-checked so the slot stays taken
+                    pooled.leased_at = time.monotonic()
+                    self._leased.append(pooled)
+                elif self._total() < self.size:
+                    self._starting += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DriverLeaseTimeout(f'No Chrome driver free after {self.acquire_timeout:.0f}s')
+                    self._cond.wait(min(remaining, 5))
+                    continue
+
+            if pooled is not None:
+                if self._healthy(pooled):
+                    return pooled
+                with self._cond:
+                    if pooled in self._leased:
+                        self._leased.remove(pooled)
+                self._quit(pooled.driver)
+                continue
+
+            try:
+                pooled = self._launch()
+            except Exception:
+                with self._cond:
+                    self._starting -= 1
+                    self._cond.notify_all()
+                raise
+            with self._cond:
+                self._starting -= 1
+                pooled.leased_at = time.monotonic()
+                self._leased.append(pooled)
+            return pooled
+
+    @staticmethod
+    def check_lease(pooled: PooledDriver):
+        """Raise DriverReclaimed if the pool has taken this lease's driver back"""
+        if pooled.reclaimed:
+            raise DriverReclaimed('Chrome driver was reclaimed after its lease timed out')
+
+    def renew(self, pooled: PooledDriver):
+        """Restart a lease's timeout because its scrape is making progress; raises DriverReclaimed if too late"""
+        with self._cond:
+            self.check_lease(pooled)
+            pooled.leased_at = time.monotonic()
+
+    def release(self, pooled: PooledDriver, discard: bool = False):
+        """Return a leased driver, replacing it if it is worn out or broken"""
+        with self._cond:
+            if pooled not in self._leased:
+                # Already reclaimed after its lease timed out
+                return
+            self._leased.remove(pooled)
+            pooled.uses += 1
+            recycle = discard or self._closed or pooled.uses >= self.max_uses
+
+        if not recycle:
+            try:
+                # Drop the participants page (and its DOM) while idle
+                pooled.driver.get('about:blank')
+            except WebDriverException:
+                recycle = True
+
+        with self._cond:
+            if not recycle:
+                self._idle.append(pooled)
+            self._cond.notify_all()
+
+        if recycle:
+            self._quit(pooled.driver)
+            self._warm()
+
+    @contextmanager
+    def lease(self):
+        """Context manager around acquire()/release()"""
+        pooled = self.acquire()
+        discard = False
+        try:
+            yield pooled.driver
+        except WebDriverException:
+            discard = True
+            raise
+        finally:
+            self.release(pooled, discard=discard)
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return {'idle': len(self._idle), 'leased': len(self._leased), 'starting': self._starting, 'size': self.size}
+
+    def close(self):
+        """Quit every driver; leased drivers are quit when released"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for pooled in idle:
+            self._quit(pooled.driver)
@@ -0,0 +1,168 @@
+from datetime import datetime, timezone
+from pymongo import ReturnDocument
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import time
+
+# Id of the document holding the data-version counter in the stats collection
+_VERSION_ID = '_data_version'
+
+
+class HackathonStatsStore:
+    """
+    Per-hackathon statistics materialized at ingest time.
+
+    refresh() aggregates one hackathon (participant count, top skills and interests,
+    role distribution, project/achievement histograms) into a document of the stats
+    collection and bumps a data-version counter stored alongside them. Readers get the
+    stats of every hackathon from an in-process cache that is rebuilt only when the
+    version changes; the version doubles as the ETag of /api/stats.
+    """
+
+    def __init__(self, db, collection_name: str = 'hackathon_stats', top_n: int = 15,
+                 histogram_max: int = 10, version_cache_seconds: float = 1.0):
+        """
+        Args:
+            db: pymongo database holding the participant collections
+            collection_name: Collection of materialized stats documents
+            top_n: Skills/interests/roles kept per hackathon
+            histogram_max: Project/achievement counts at or above this share the last bucket
+            version_cache_seconds: How long the data version is cached in-process
+        """
+        self.collection = db[collection_name]
+        self.top_n = top_n
+        self.histogram_max = histogram_max
+        self.version_cache_seconds = version_cache_seconds
+        self._version: Tuple[float, int] = (0.0, -1)
+        self._cache: Optional[Tuple[int, List[Dict]]] = None
+        self._lock = threading.Lock()
+
+    def _pipeline(self, hackathon: str) -> List[Dict]:
+        def top(field: str) -> List[Dict]:
+            return [
+                {'$unwind': f'${field}'},
+                {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}},
+                {'$sort': {'count': -1, '_id': 1}},
+                {'$limit': self.top_n}
+            ]
+
+        def histogram(field: str) -> List[Dict]:
+            return [
+                {'$group': {'_id': {'$min': [{'$ifNull': [f'$stats.{field}', 0]}, self.histogram_max]},
+                            'count': {'$sum': 1}}},
+                {'$sort': {'_id': 1}}
+            ]
+
+        return [
+            {'$match': {'hackathon': hackathon}},
+            {'$facet': {
+                'count': [{'$count': 'n'}],
+                'skills': top('skills'),
+                'interests': top('interests'),
+                'roles': [
+                    {'$group': {'_id': '$role', 'count': {'$sum': 1}}},
+                    {'$sort': {'count': -1, '_id': 1}},
+                    {'$limit': self.top_n}
+                ],
+                'projects': histogram('projects'),
+                'achievements': histogram('achievements')
+            }}
+        ]
+
+    def _bucket(self, value: int) -> str:
+        return f"{value}+" if value >= self.histogram_max else str(value)
+
+    def compute(self, hackathon: str, collection) -> Dict:
+        """Aggregate the stats of one hackathon from the collection serving it"""
+        result = next(collection.aggregate(self._pipeline(hackathon)), {})
+        count = result.get('count') or [{'n': 0}]
+
+        # Missing and empty roles are both unspecified
+        roles: Dict[str, int] = {}
+        for r in result.get('roles', []):
+            name = r['_id'] or 'Unspecified'
+            roles[name] = roles.get(name, 0) + r['count']
+
+        return {
+            'participant_count': count[0]['n'],
+            'top_skills': [{'name': r['_id'], 'count': r['count']} for r in result.get('skills', [])],
+            'top_interests': [{'name': r['_id'], 'count': r['count']} for r in result.get('interests', [])],
+            'roles': [{'name': name, 'count': n}
+                      for name, n in sorted(roles.items(), key=lambda item: item[1], reverse=True)],
+            'projects_histogram': [{'bucket': self._bucket(r['_id']), 'count': r['count']}
+                                   for r in result.get('projects', [])],
+            'achievements_histogram': [{'bucket': self._bucket(r['_id']), 'count': r['count']}
+                                       for r in result.get('achievements', [])]
+        }
+
+    def refresh(self, hackathon: str, collection) -> Dict:
+        """Recompute a hackathon's stats after an ingest and bump the data version"""
+        stats = self.compute(hackathon, collection)
+        self.collection.replace_one(
+            {'_id': hackathon},
+            dict(stats, hackathon=hackathon, updated_at=datetime.now(timezone.utc)),
+            upsert=True
+        )
+        self.bump_version()
+        return stats
+
+    def bump_version(self) -> int:
+        """Invalidate every cached view of the stats (call after any ingest)"""
+        doc = self.collection.find_one_and_update(
+            {'_id': _VERSION_ID},
+            {'$inc': {'version': 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        with self._lock:
+            self._version = (0.0, -1)
+        return doc['version']
+
+    def data_version(self) -> int:
+        """Current data version (cached for version_cache_seconds)"""
+        now = time.monotonic()
+        with self._lock:
+            expires, version = self._version
+            if expires > now:
+                return version
+
+        doc = self.collection.find_one({'_id': _VERSION_ID}, {'version': 1})
+        version = doc['version'] if doc else 0
+        with self._lock:
+            self._version = (now + self.version_cache_seconds, version)
+        return version
+
+    def all(self, sources: Callable[[], Iterable[Tuple[str, object]]] = None) -> Tuple[int, List[Dict]]:
+        """
+        (data_version, stats of every hackathon), served from memory until the version changes.
+
+        Args:
+            sources: Returns (hackathon, collection) pairs for every hackathon with
+                data; those without stats yet (e.g. loaded before stats existed) are
+                materialized. Only called when the cache is rebuilt.
+        """
+        version = self.data_version()
+        with self._lock:
+            if self._cache is not None and self._cache[0] == version:
+                return self._cache
+
+        stats = {doc['_id']: doc for doc in self.collection.find({'_id': {'$ne': _VERSION_ID}}, {'updated_at': 0})}
+        for hackathon, collection in (sources() if sources is not None else ()):
+            if hackathon not in stats:
+                print(f"📊 Materializing stats for {hackathon}")
+                stats[hackathon] = dict(self.compute(hackathon, collection), _id=hackathon, hackathon=hackathon)
+                self.collection.replace_one(
+                    {'_id': hackathon},
+                    dict(stats[hackathon], updated_at=datetime.now(timezone.utc)),
+                    upsert=True
+                )
+
+        entries = sorted(
+            (dict({k: v for k, v in doc.items() if k not in ('_id', 'hackathon')}, name=hackathon)
+             for hackathon, doc in stats.items()),
+            key=lambda entry: entry['participant_count'],
+            reverse=True
+        )
+        with self._lock:
+            self._cache = (version, entries)
+        return self._cache
@@ -0,0 +1,319 @@
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, List, Optional
+from card_parser import DEFAULT_PARSER, extract_participants
+from delta_scrape import DeltaScrape, reported_total_in_html
+from scrape_checkpoint import ScrapeCheckpoint
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+import random
+import requests
+import threading
+import time
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# Responses worth retrying after backing off
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class AuthenticationFailed(Exception):
+    """Raised when Devpost serves the login wall instead of the participant list"""
+
+
+class ListingPageEmpty(Exception):
+    """Raised when a listing page that should hold participants parses to none (markup change, captcha, ...)"""
+
+
+class AdaptiveThrottle:
+    """
+    Limits in-flight requests and spacing between them, adapting to the server.
+
+    Every 429/5xx halves the number of concurrent requests and grows a shared delay
+    (or honours Retry-After); each success adds a slot back and shrinks the delay,
+    so a scrape slows down while Devpost is pushing back and recovers afterwards.
+    """
+
+    def __init__(self, max_concurrency: int, base_delay: float = 0.5, max_delay: float = 30.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.limit = self.max_concurrency
+        self.delay = 0.0
+        self._in_flight = 0
+        self._next_request_at = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            wait_for = self._next_request_at - time.monotonic()
+            self._next_request_at = max(self._next_request_at, time.monotonic()) + self.delay
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+    def release(self):
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def succeeded(self):
+        with self._cond:
+            self.limit = min(self.max_concurrency, self.limit + 1)
+            self.delay = self.delay / 2 if self.delay > 0.05 else 0.0
+            self._cond.notify_all()
+
+    def throttled(self, retry_after: Optional[float] = None) -> float:
+        """Record a pushback and return how long the caller should sleep before retrying"""
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+            self.delay = min(self.max_delay, max(self.base_delay, self.delay * 2))
+            backoff = retry_after if retry_after is not None else self.delay
+            self._next_request_at = max(self._next_request_at, time.monotonic() + backoff)
+            return backoff
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class DevpostHttpScraper:
+    """
+    Fetch a Devpost participants listing page by page over HTTP instead of scrolling
+    it in Chrome.
+
+    The listing is paginated with ?page=N (the infinite scroll just loads those pages),
+    so pages are requested concurrently over one pooled session carrying the Devpost
+    cookies, and each page goes through card_parser, the same extraction the Selenium
+    scrapers use. Pages are requested ahead speculatively until one comes back
+    without cards, but never past the last page linked from the pagination nav. A
+    page without cards before that page (or an empty page 1 on a listing that reports
+    participants) raises ListingPageEmpty, since it means a captcha, a login wall or a
+    markup change rather than the end of the listing.
+    """
+
+    def __init__(self, max_concurrency: int = 6, max_retries: int = 5,
+                 timeout: float = 30.0, max_pages: int = 1000, user_agent: str = DEFAULT_USER_AGENT):
+        """
+        Args:
+            max_concurrency: Upper bound on simultaneous page requests
+            max_retries: Attempts per page on 429/5xx/connection errors before giving up
+            timeout: Per-request timeout in seconds
+            max_pages: Safety cap on pages fetched for one hackathon
+            user_agent: User-Agent header sent with every request
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.user_agent = user_agent
+
+    def _session(self, cookies: List[Dict]) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': self.user_agent,
+            'Accept': 'text/html,application/xhtml+xml'
+        })
+        for cookie in cookies:
+            if cookie.get('name') and cookie.get('value'):
+                session.cookies.set(cookie['name'], cookie['value'])
+        return session
+
+    @staticmethod
+    def page_url(participants_url: str, page: int) -> str:
+        """Participants listing URL for one page"""
+        parts = urlparse(participants_url)
+        query = parse_qs(parts.query)
+        query['page'] = [str(page)]
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+    @staticmethod
+    def _last_page_hint(html: str) -> Optional[int]:
+        """Highest page number linked from the pagination nav, if the page has one"""
+        nav = BeautifulSoup(html, DEFAULT_PARSER, parse_only=SoupStrainer(class_='pagination'))
+        pages = []
+        for link in nav.select('.pagination a[href]'):
+            page = parse_qs(urlparse(link['href']).query).get('page')
+            if page and page[0].isdigit():
+                pages.append(int(page[0]))
+        return max(pages) if pages else None
+
+    def _get(self, session: requests.Session, url: str, throttle: AdaptiveThrottle) -> Optional[requests.Response]:
+        """GET with adaptive backoff; returns None for pages that do not exist"""
+        for attempt in range(self.max_retries + 1):
+            throttle.acquire()
+            try:
+                response = session.get(url, timeout=self.timeout)
+            except requests.RequestException as e:
+                response = None
+                error = e
+            finally:
+                throttle.release()
+
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                throttle.succeeded()
+                return response
+
+            if attempt == self.max_retries:
+                if response is None:
+                    raise error
+                response.raise_for_status()
+
+            backoff = throttle.throttled(_retry_after_seconds(response) if response is not None else None)
+            status = response.status_code if response is not None else type(error).__name__
+            print(f"⏳ {url} returned {status}, retrying in {backoff:.1f}s")
+            time.sleep(backoff * (1 + random.random() * 0.25) * (attempt + 1))
+
+    def _fetch_page(self, session: requests.Session, participants_url: str, page: int,
+                    throttle: AdaptiveThrottle):
+        """Fetch and parse one listing page; returns (participants, html)"""
+        response = self._get(session, self.page_url(participants_url, page), throttle)
+        if response is None:
+            return [], None
+
+        if page == 1 and 'Please log in' in response.text:
+            raise AuthenticationFailed('Authentication failed - cookies may be expired')
+
+        return extract_participants(response.text), response.text
+
+    def scrape(self, participants_url: str, cookies: List[Dict],
+               progress_callback: Callable[[int], None] = None, delta: DeltaScrape = None,
+               checkpoint: ScrapeCheckpoint = None) -> List[Dict]:
+        """
+        Fetch every participant on a hackathon's participants listing.
+
+        Args:
+            participants_url: The hackathon's /participants URL
+            cookies: List of cookie dictionaries with 'name' and 'value' keys
+            progress_callback: Called with the number of participants fetched so far;
+                exceptions it raises abort the scrape
+            delta: For re-scrapes, stops requesting pages once it has seen enough
+                already-known participants (pages are checked in listing order)
+            checkpoint: Loaded checkpoint to resume from and record into: pages before
+                its next_page are not fetched again (page 1 always is, for the login
+                check and pagination), and each completed run of pages is added to it.
+                The caller saves it if the scrape fails.
+
+        Returns:
+            Participant dicts in listing order, de-duplicated by participant_id
+            (resumed participants first when resuming from a checkpoint)
+        """
+        session = self._session(cookies)
+        throttle = AdaptiveThrottle(self.max_concurrency)
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='devpost-page')
+
+        try:
+            resume_from = checkpoint.next_page if checkpoint is not None else 1
+            if resume_from > 1:
+                print(f"↩️  Resuming at page {resume_from} with {len(checkpoint)} checkpointed participants")
+            # Pages before this one are recorded in the checkpoint
+            checkpointed_page = resume_from - 1
+
+            first_page, html = self._fetch_page(session, participants_url, 1, throttle)
+            pages = {1: first_page}
+            loaded = len(first_page) + (len(checkpoint) if resume_from > 1 else 0)
+            if progress_callback is not None:
+                progress_callback(loaded)
+
+            hint = self._last_page_hint(html) if html is not None else None
+            if not first_page:
+                reported = reported_total_in_html(html)
+                if reported or (hint is not None and hint > 1):
+                    raise ListingPageEmpty(
+                        f"No participant cards on page 1, but the listing reports "
+                        f"{f'{reported:,} participants' if reported else f'{hint} pages'}"
+                    )
+
+            last_page = 1 if not first_page else self.max_pages
+            if hint is not None:
+                last_page = min(last_page, hint)
+
+            observed_page = 0
+            if delta is not None:
+                if delta.nothing_new(reported_total_in_html(html)):
+                    print("Participant count unchanged; only re-reading the first page")
+                    last_page = 1
+                delta.observe(first_page)
+                observed_page = 1
+                if delta.done:
+                    last_page = 1
+
+            next_page = max(2, resume_from)
+            pending = {}
+            while pending or next_page <= last_page:
+                while next_page <= last_page and len(pending) < self.max_concurrency:
+                    future = executor.submit(self._fetch_page, session, participants_url, next_page, throttle)
+                    pending[future] = next_page
+                    next_page += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page = pending.pop(future)
+                    participants, _ = future.result()
+                    if not participants:
+                        if hint is not None and page <= min(hint, last_page):
+                            # The pagination nav says this page exists, so it should hold cards
+                            raise ListingPageEmpty(f"No participant cards on page {page} of {hint}")
+                        # Past the end of the listing; stop requesting further pages
+                        last_page = min(last_page, page - 1)
+                        continue
+                    pages[page] = participants
+                    loaded += len(participants)
+
+                if delta is not None:
+                    # Pages finish out of order; only count known runs across consecutive pages
+                    while not delta.done and observed_page + 1 in pages and observed_page + 1 <= last_page:
+                        observed_page += 1
+                        delta.observe(pages[observed_page])
+                    if delta.done and observed_page < last_page:
+                        print(f"Reached known participants on page {observed_page} ({delta.summary()})")
+                        last_page = observed_page
+
+                if checkpoint is not None:
+                    while checkpointed_page + 1 in pages and checkpointed_page + 1 <= last_page:
+                        checkpointed_page += 1
+                        checkpoint.add(pages[checkpointed_page])
+                    checkpoint.advance(checkpointed_page + 1)
+                    checkpoint.maybe_save()
+
+                if progress_callback is not None:
+                    progress_callback(loaded)
+
+            # Cards can shift between pages if someone joins mid-scrape
+            results = []
+            seen = set()
+            for page in sorted(pages):
+                if page > last_page:
+                    continue
+                for participant in pages[page]:
+                    participant_id = participant.get('participant_id')
+                    if participant_id and participant_id in seen:
+                        continue
+                    seen.add(participant_id)
+                    results.append(participant)
+
+            if checkpoint is not None:
+                checkpoint.add(results)
+                checkpoint.save()
+                results = checkpoint.all()
+
+            print(f"Fetched {len(results)} participants from {last_page} page(s)")
+            return results
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            session.close()
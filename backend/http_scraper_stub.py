@@ -0,0 +1,263 @@
+"""
+Exercise DevpostHttpScraper against a local stub of the Devpost participants listing.
+
+An http.server thread serves ?page=N listings built from the bundled fixture's cards
+(with fresh participant ids per page), optionally failing pages with 429/5xx first.
+Each scenario runs the real scraper against it and checks what was returned and
+which pages were requested:
+
+    pagination       pages are fetched until one comes back without cards
+    last-page hint   no page past the highest one linked from the pagination nav
+    backoff          429 (with Retry-After) and 5xx responses are retried
+    delta            a re-scrape stops at the first run of already-stored participants
+    unchanged total  a re-scrape reads only page 1 when the reported total matches
+    resume           a checkpointed scrape skips the pages it already recorded
+    empty page       a card-less page before the hinted last page raises ListingPageEmpty
+    empty first page a card-less page 1 on a listing reporting participants raises too
+    login wall       an expired session raises AuthenticationFailed
+
+Usage:
+    python http_scraper_stub.py
+    python http_scraper_stub.py --serve --pages 20   # just serve a listing for manual runs
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlparse
+import argparse
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+from delta_scrape import DeltaScrape
+from http_scraper import AuthenticationFailed, DevpostHttpScraper, ListingPageEmpty
+from scrape_checkpoint import ScrapeCheckpoint
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'participants_page.html')
+
+
+class StubListing:
+    """
+    A fake participants listing: `pages` pages of `per_page` cards, newest first.
+
+    Args:
+        pages: Pages holding cards; later pages come back empty
+        per_page: Cards per page (the fixture's cards are repeated as needed)
+        last_page_hint: Highest page linked from the pagination nav (None for no nav)
+        reported_total: "N participants" shown above the listing (None to omit it)
+        failures: page -> statuses to answer with (in order) before serving it
+        login_wall: Serve the login page instead of the listing
+        blank_pages: Pages served without their cards (as after a markup change or captcha)
+    """
+
+    def __init__(self, pages: int, per_page: int = 5, last_page_hint: Optional[int] = None,
+                 reported_total: Optional[int] = None, failures: Dict[int, List[int]] = None,
+                 login_wall: bool = False, blank_pages: Iterable[int] = ()):
+        with open(FIXTURE, encoding='utf-8') as f:
+            html = f.read()
+        list_start = html.index('<div class="participant"')
+        list_end = html.index('      </div>\n      <nav')
+        self._head = html[:list_start]
+        self._cards = re.findall(r'<div class="participant".*?\n</div>\n', html[list_start:list_end], re.S)
+        self._tail = '      </div>\n' + html[html.rindex('</nav>') + len('</nav>'):]
+
+        self.pages = pages
+        self.per_page = per_page
+        self.last_page_hint = last_page_hint
+        self.reported_total = reported_total
+        self.failures = {page: list(statuses) for page, statuses in (failures or {}).items()}
+        self.login_wall = login_wall
+        self.blank_pages = set(blank_pages)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def participant_ids(self, page: int) -> List[str]:
+        if not 1 <= page <= self.pages:
+            return []
+        first = (page - 1) * self.per_page
+        return [str(100000 + first + i) for i in range(self.per_page)]
+
+    def render(self, page: int) -> str:
+        if self.login_wall:
+            return '<html><body><h1>Please log in to continue</h1></body></html>'
+        cards = [
+            re.sub(r'data-participant-id="[^"]*"', f'data-participant-id="{participant_id}"',
+                   self._cards[i % len(self._cards)], count=1)
+            for i, participant_id in enumerate(self.participant_ids(page))
+        ] if page not in self.blank_pages else []
+        total = f'<p class="participants-count">{self.reported_total:,} participants</p>\n' \
+            if self.reported_total is not None else ''
+        nav = ''
+        if self.last_page_hint is not None:
+            links = ''.join(f'<a href="/participants?page={n}">{n}</a>' for n in range(2, self.last_page_hint + 1))
+            nav = f'      <nav class="pagination" role="navigation"><span class="current">1</span>{links}</nav>\n'
+        return self._head + total + '\n'.join(cards) + nav + self._tail
+
+    def respond(self, page: int):
+        """(status, headers, body) for a request of `page`, recording it"""
+        with self._lock:
+            pending = self.failures.get(page)
+            status = pending.pop(0) if pending else 200
+            self.requests.append((page, status))
+        if status == 429:
+            return status, {'Retry-After': '0'}, b'Too Many Requests'
+        if status != 200:
+            return status, {}, b'Server Error'
+        return status, {'Content-Type': 'text/html; charset=utf-8'}, self.render(page).encode('utf-8')
+
+    def pages_requested(self) -> List[int]:
+        with self._lock:
+            return sorted({page for page, _ in self.requests})
+
+    def retries(self) -> int:
+        with self._lock:
+            return sum(1 for _, status in self.requests if status != 200)
+
+
+def serve(listing: StubListing) -> ThreadingHTTPServer:
+    """Serve the listing on a free localhost port from a daemon thread"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            page = parse_qs(urlparse(self.path).query).get('page', ['1'])[0]
+            status, headers, body = listing.respond(int(page) if page.isdigit() else 1)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, name='devpost-stub', daemon=True).start()
+    return server
+
+
+def run_scenario(name: str, listing: StubListing, check, max_concurrency: int = 4,
+                 delta: DeltaScrape = None, checkpoint: ScrapeCheckpoint = None) -> bool:
+    server = serve(listing)
+    url = f"http://127.0.0.1:{server.server_address[1]}/participants"
+    scraper = DevpostHttpScraper(max_concurrency=max_concurrency, max_retries=3, timeout=5)
+    start = time.perf_counter()
+    try:
+        try:
+            result = scraper.scrape(url, [], delta=delta, checkpoint=checkpoint)
+        except Exception as e:
+            result = e
+        elapsed = time.perf_counter() - start
+        problem = check(result, listing)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    detail = f"pages requested {listing.pages_requested()}, {listing.retries()} retried response(s), {elapsed:.2f}s"
+    if problem:
+        print(f"❌ {name}: {problem} ({detail})")
+        return False
+    print(f"✅ {name} ({detail})")
+    return True
+
+
+def expect_ids(listing: StubListing, pages: range):
+    """Check that the scrape returned exactly the participants on `pages`, in listing order"""
+    expected = [participant_id for page in pages for participant_id in listing.participant_ids(page)]
+
+    def check(result, _):
+        if isinstance(result, Exception):
+            return f"raised {result!r}"
+        got = [p.get('participant_id') for p in result]
+        if got != expected:
+            return f"expected {len(expected)} participants from pages {list(pages)}, got {len(got)}"
+        return None
+    return check
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--serve', action='store_true', help='Only serve a listing until interrupted')
+    parser.add_argument('--pages', type=int, default=10, help='Pages served with --serve')
+    args = parser.parse_args()
+
+    if args.serve:
+        server = serve(StubListing(args.pages, per_page=20, last_page_hint=args.pages))
+        print(f"🧪 Stub listing at http://127.0.0.1:{server.server_address[1]}/participants (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            server.shutdown()
+        return
+
+    results = []
+
+    listing = StubListing(pages=6)
+    results.append(run_scenario('pagination', listing, expect_ids(listing, range(1, 7))))
+
+    listing = StubListing(pages=8, last_page_hint=3)
+
+    def hint_check(result, listing):
+        return expect_ids(listing, range(1, 4))(result, listing) or (
+            "requested pages past the hint" if max(listing.pages_requested()) > 3 else None)
+    results.append(run_scenario('last-page hint', listing, hint_check))
+
+    listing = StubListing(pages=4, failures={2: [429, 429], 3: [503], 4: [502]})
+
+    def backoff_check(result, listing):
+        return expect_ids(listing, range(1, 5))(result, listing) or (
+            "expected 4 retried responses" if listing.retries() != 4 else None)
+    results.append(run_scenario('429/5xx backoff', listing, backoff_check))
+
+    # Pages 1-2 are new sign-ups, everything after is already stored
+    listing = StubListing(pages=10, last_page_hint=10)
+    known = [participant_id for page in range(3, 11) for participant_id in listing.participant_ids(page)]
+
+    def delta_check(result, listing):
+        # Two known pages make the 10-long run that ends the scrape
+        return expect_ids(listing, range(1, 5))(result, listing) or (
+            "kept requesting pages after the known run" if max(listing.pages_requested()) > 4 else None)
+    results.append(run_scenario('delta early stop', listing, delta_check, max_concurrency=1,
+                                delta=DeltaScrape(known, stop_after=10)))
+
+    listing = StubListing(pages=5, last_page_hint=5, reported_total=25)
+    known = [participant_id for page in range(1, 6) for participant_id in listing.participant_ids(page)]
+
+    def unchanged_check(result, listing):
+        return expect_ids(listing, range(1, 2))(result, listing) or (
+            "requested more than page 1" if listing.pages_requested() != [1] else None)
+    results.append(run_scenario('unchanged total', listing, unchanged_check, delta=DeltaScrape(known)))
+
+    # An earlier run recorded pages 1-3 before it was interrupted
+    listing = StubListing(pages=6, last_page_hint=6)
+    checkpoint = ScrapeCheckpoint(os.path.join(tempfile.mkdtemp(), 'stub.checkpoint.json'))
+    checkpoint.add({'participant_id': participant_id} for page in range(1, 4)
+                   for participant_id in listing.participant_ids(page))
+    checkpoint.advance(4)
+
+    def resume_check(result, listing):
+        return expect_ids(listing, range(1, 7))(result, listing) or (
+            "re-fetched checkpointed pages" if set(listing.pages_requested()) & {2, 3} else None)
+    results.append(run_scenario('resume', listing, resume_check, checkpoint=checkpoint))
+
+    def expect_empty_page(result, _):
+        return None if isinstance(result, ListingPageEmpty) else f"expected ListingPageEmpty, got {result!r:.80}"
+    results.append(run_scenario('empty page', StubListing(pages=6, last_page_hint=6, blank_pages=[3]),
+                                expect_empty_page))
+    results.append(run_scenario('empty first page', StubListing(pages=4, reported_total=20, blank_pages=[1]),
+                                expect_empty_page))
+
+    results.append(run_scenario(
+        'login wall', StubListing(pages=3, login_wall=True),
+        lambda result, _: None if isinstance(result, AuthenticationFailed) else f"expected AuthenticationFailed, got {result!r:.80}"
+    ))
+
+    print(f"\n{sum(results)}/{len(results)} scenarios passed")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+from pymongo import DeleteMany, ReplaceOne
+from pymongo.errors import OperationFailure
+from typing import Dict, Iterable, List
+from bulk_loader import BulkWriter, ThroughputReport
+import hashlib
+import json
+
+# Fields managed by the ingest itself, excluded from the content hash
+_SYSTEM_FIELDS = ('_id', 'content_hash')
+
+
+def content_hash(participant: Dict) -> str:
+    """Hash of a participant's scraped content, stable across key order"""
+    content = {k: v for k, v in participant.items() if k not in _SYSTEM_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def ensure_lookup_index(collection):
+    """The (hackathon, participant_id) index sync_hackathon's upserts are keyed on"""
+    try:
+        collection.create_index([('hackathon', 1), ('participant_id', 1)], unique=True)
+    except OperationFailure as e:
+        # Older data loaded with insert_many may hold duplicate cards
+        print(f"⚠️  Could not create unique (hackathon, participant_id) index: {e}")
+        collection.create_index([('hackathon', 1), ('participant_id', 1)])
+
+
+def ensure_indexes(collection):
+    """Indexes the ingest and the matcher rely on"""
+    ensure_lookup_index(collection)
+    collection.create_index('participant_id')
+    collection.create_index('skills')
+
+
+def sync_hackathon(collection, hackathon: str, participants: Iterable[Dict], batch_size: int = 1000,
+                   remove_missing: bool = True, collect_changes: bool = True, workers: int = 1,
+                   max_retries: int = 5, report: ThroughputReport = None) -> Dict:
+    """
+    Make the stored participants of one hackathon match a fresh scrape.
+
+    Only documents whose content hash changed are written (unordered bulk upserts
+    keyed on hackathon + participant_id), and only participants missing from the
+    scrape are deleted. Other hackathons are untouched. Partial scrapes (e.g. a delta
+    re-scrape of the newest sign-ups) pass remove_missing=False so nothing is deleted.
+
+    Participants are consumed as a stream and written every `batch_size` changes
+    through a BulkWriter (`workers` chunks in parallel, transient failures retried up
+    to `max_retries` times, progress fed to `report`), so only the stored ids/hashes
+    and a few chunks are held in memory (plus the changed documents when
+    collect_changes is set).
+
+    Returns:
+        Counts of inserted/updated/unchanged/removed/skipped participants, plus the
+        changed documents (empty unless collect_changes) and removed ids so callers
+        can refresh derived data
+    """
+    existing = {
+        doc['participant_id']: doc.get('content_hash')
+        for doc in collection.find({'hackathon': hackathon}, {'_id': 0, 'participant_id': 1, 'content_hash': 1})
+        if doc.get('participant_id')
+    }
+
+    changed: List[Dict] = []
+    # Hash written for each incoming participant; last card wins if the page listed someone twice
+    written: Dict[str, str] = {}
+
+    with BulkWriter(collection, chunk_size=batch_size, workers=workers, max_retries=max_retries,
+                    report=report) as writer:
+        inserted, updated, unchanged, skipped = _queue_changes(
+            writer, hackathon, participants, existing, written, changed if collect_changes else None
+        )
+
+        removed_ids = [pid for pid in existing if pid not in written] if remove_missing else []
+        for i in range(0, len(removed_ids), batch_size):
+            writer.add(DeleteMany({'hackathon': hackathon, 'participant_id': {'$in': removed_ids[i:i+batch_size]}}))
+
+    if collect_changes:
+        # A participant listed twice with different content is written twice; report it once
+        changed = list({doc['participant_id']: doc for doc in changed}.values())
+
+    return {
+        'inserted': inserted,
+        'updated': updated,
+        'unchanged': unchanged,
+        'removed': len(removed_ids),
+        'skipped': skipped,
+        'changed_documents': changed,
+        'removed_ids': removed_ids
+    }
+
+
+def _queue_changes(writer: BulkWriter, hackathon: str, participants: Iterable[Dict], existing: Dict[str, str],
+                   written: Dict[str, str], changed: List[Dict] = None) -> tuple:
+    """Queue upserts for new/changed participants; returns (inserted, updated, unchanged, skipped)"""
+    inserted = updated = unchanged = skipped = 0
+    for participant in participants:
+        participant_id = participant.get('participant_id')
+        if not participant_id:
+            skipped += 1
+            continue
+        doc = {k: v for k, v in participant.items() if k not in _SYSTEM_FIELDS}
+        doc['hackathon'] = hackathon
+        doc['content_hash'] = content_hash(doc)
+
+        if participant_id in written:
+            if written[participant_id] == doc['content_hash']:
+                continue
+            # Land the earlier version first so parallel chunks can't reorder the two writes
+            writer.flush()
+        elif participant_id not in existing:
+            inserted += 1
+        elif existing[participant_id] != doc['content_hash']:
+            updated += 1
+        else:
+            unchanged += 1
+            written[participant_id] = doc['content_hash']
+            continue
+
+        written[participant_id] = doc['content_hash']
+        if changed is not None:
+            changed.append(doc)
+        writer.add(ReplaceOne({'hackathon': hackathon, 'participant_id': participant_id}, doc, upsert=True), doc)
+
+    return inserted, updated, unchanged, skipped
+
+
+def summarize(counts: Dict) -> Dict:
+    """The JSON-friendly subset of a sync_hackathon result"""
+    return {k: counts[k] for k in ('inserted', 'updated', 'unchanged', 'removed', 'skipped')}
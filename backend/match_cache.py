@@ -0,0 +1,141 @@
+from pymongo import ReplaceOne
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+import hashlib
+import threading
+import time
+
+
+def fingerprint(text: str) -> str:
+    """Stable short hash of a formatted profile or search query"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class MatchScoreCache:
+    """
+    Two-tier cache of Gemini match results.
+
+    Entries are keyed by (current user profile hash, candidate profile hash, query hash)
+    and hold (match_score, reason). The first tier is an in-process LRU with TTL; the
+    optional second tier is a MongoDB collection with a TTL index so warm results
+    survive restarts and are shared between workers.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: int = 86400, persistent_collection=None):
+        """
+        Args:
+            max_entries: Maximum entries kept in memory before evicting least recently used
+            ttl_seconds: Lifetime of an entry in both tiers
+            persistent_collection: Optional pymongo collection used as the second tier
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persistent_collection = persistent_collection
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        if self.persistent_collection is not None:
+            self._ensure_ttl_index()
+
+    def _ensure_ttl_index(self):
+        """
+        Create the created_at TTL index, or retune an existing one with collMod when
+        the TTL setting changed (create_index would fail with IndexOptionsConflict).
+        Failures are logged: entries then just expire late (or not at all) in MongoDB.
+        """
+        collection = self.persistent_collection
+        try:
+            existing = next((info for info in collection.index_information().values()
+                             if info['key'] == [('created_at', 1)]), None)
+            if existing is None:
+                collection.create_index('created_at', expireAfterSeconds=self.ttl_seconds)
+            elif existing.get('expireAfterSeconds') != self.ttl_seconds:
+                collection.database.command('collMod', collection.name, index={
+                    'keyPattern': {'created_at': 1},
+                    'expireAfterSeconds': self.ttl_seconds
+                })
+                print(f"Match cache TTL changed from {existing.get('expireAfterSeconds')}s to {self.ttl_seconds}s")
+        except Exception as e:
+            print(f"Match cache TTL index setup failed: {e}")
+
+    @staticmethod
+    def make_key(user_hash: str, candidate_hash: str, query_hash: str) -> str:
+        return f"{user_hash}:{candidate_hash}:{query_hash}"
+
+    def get_many(self, keys: List[str]) -> Dict[str, Tuple[int, str]]:
+        """Look up several keys at once, consulting MongoDB only for memory misses"""
+        found = {}
+        missing = []
+        now = time.monotonic()
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[1]
+                else:
+                    if entry:
+                        del self._entries[key]
+                    missing.append(key)
+
+        if missing and self.persistent_collection is not None:
+            try:
+                for doc in self.persistent_collection.find({'_id': {'$in': missing}}):
+                    value = (doc['match_score'], doc['reason'])
+                    found[doc['_id']] = value
+                    self._remember(doc['_id'], value)
+            except Exception as e:
+                print(f"Match cache lookup failed: {e}")
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def set_many(self, values: Dict[str, Tuple[int, str]]):
+        """Store several results in memory and, if configured, in MongoDB"""
+        if not values:
+            return
+
+        for key, value in values.items():
+            self._remember(key, value)
+
+        if self.persistent_collection is not None:
+            created_at = datetime.now(timezone.utc)
+            try:
+                self.persistent_collection.bulk_write([
+                    ReplaceOne(
+                        {'_id': key},
+                        {'_id': key, 'match_score': score, 'reason': reason, 'created_at': created_at},
+                        upsert=True
+                    )
+                    for key, (score, reason) in values.items()
+                ], ordered=False)
+            except Exception as e:
+                print(f"Match cache write failed: {e}")
+
+    def _remember(self, key: str, value: Tuple[int, str]):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop the in-memory tier"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'persistent': self.persistent_collection is not None
+            }
@@ -0,0 +1,95 @@
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from typing import Dict, Optional
+import threading
+import time
+import os
+
+
+class MongoConnectionPool:
+    """Process-wide MongoClient shared by every route, the matcher and the uploader"""
+
+    def __init__(self, uri: str, max_pool_size: int = 50, min_pool_size: int = 0,
+                 max_idle_time_ms: Optional[int] = None, connect_timeout_ms: int = 10000,
+                 server_selection_timeout_ms: int = 5000, socket_timeout_ms: Optional[int] = None,
+                 wait_queue_timeout_ms: Optional[int] = None):
+        """
+        Configure the pool. The underlying MongoClient is created lazily on first use
+        so importing the app does not block on DNS/SRV lookups.
+
+        Args:
+            uri: MongoDB connection string
+            max_pool_size: Maximum sockets kept open per server
+            min_pool_size: Sockets kept warm per server even when idle
+            max_idle_time_ms: Close sockets idle for longer than this (None = never)
+            connect_timeout_ms: Timeout for establishing a new socket
+            server_selection_timeout_ms: How long an operation waits for a usable server
+            socket_timeout_ms: Timeout for a single read/write on a socket (None = no timeout)
+            wait_queue_timeout_ms: How long a request waits for a free pooled socket (None = forever)
+        """
+        self.uri = uri
+        self.settings = {
+            'maxPoolSize': max_pool_size,
+            'minPoolSize': min_pool_size,
+            'maxIdleTimeMS': max_idle_time_ms,
+            'connectTimeoutMS': connect_timeout_ms,
+            'serverSelectionTimeoutMS': server_selection_timeout_ms,
+            'socketTimeoutMS': socket_timeout_ms,
+            'waitQueueTimeoutMS': wait_queue_timeout_ms,
+        }
+        self._client = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, uri: Optional[str] = None) -> 'MongoConnectionPool':
+        """Build a pool from the MONGODB_* environment variables"""
+
+        def _int_env(name: str, default: Optional[int]) -> Optional[int]:
+            value = os.getenv(name, '').strip()
+            return int(value) if value else default
+
+        return cls(
+            uri or os.getenv('MONGODB_URI'),
+            max_pool_size=_int_env('MONGODB_MAX_POOL_SIZE', 50),
+            min_pool_size=_int_env('MONGODB_MIN_POOL_SIZE', 0),
+            max_idle_time_ms=_int_env('MONGODB_MAX_IDLE_TIME_MS', None),
+            connect_timeout_ms=_int_env('MONGODB_CONNECT_TIMEOUT_MS', 10000),
+            server_selection_timeout_ms=_int_env('MONGODB_SERVER_SELECTION_TIMEOUT_MS', 5000),
+            socket_timeout_ms=_int_env('MONGODB_SOCKET_TIMEOUT_MS', None),
+            wait_queue_timeout_ms=_int_env('MONGODB_WAIT_QUEUE_TIMEOUT_MS', None),
+        )
+
+    @property
+    def client(self) -> MongoClient:
+        """The shared MongoClient, created on first access"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    options = {k: v for k, v in self.settings.items() if v is not None}
+                    self._client = MongoClient(self.uri, **options)
+        return self._client
+
+    def get_collection(self, database_name: str, collection_name: str):
+        """Return a collection handle backed by the shared pool"""
+        return self.client[database_name][collection_name]
+
+    def health_check(self) -> Dict:
+        """Ping the server and report latency and pool settings"""
+        start = time.perf_counter()
+        try:
+            self.client.admin.command('ping')
+            return {
+                'status': 'ok',
+                'latency_ms': round((time.perf_counter() - start) * 1000, 2),
+                'max_pool_size': self.settings['maxPoolSize'],
+                'min_pool_size': self.settings['minPoolSize']
+            }
+        except PyMongoError as e:
+            return {'status': 'error', 'error': str(e)}
+
+    def close(self):
+        """Close every pooled connection. The next access reconnects lazily."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
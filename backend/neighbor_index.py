@@ -0,0 +1,127 @@
+"""
+Precomputed top-K teammate neighbors per participant.
+
+After each ingest the quick score (the find_teammates prefilter) is computed for
+every pair of participants in the hackathon and each participant's best K
+candidates are stored, so the prefilter becomes one indexed lookup.
+
+Usage:
+    python neighbor_index.py                 # every hackathon
+    python neighbor_index.py hackutd-2025    # just these
+"""
+from datetime import datetime, timezone
+from pymongo import ReplaceOne
+from typing import Dict, List, Optional
+import json
+import sys
+import time
+
+from bulk_loader import BulkWriter
+from match_cache import fingerprint
+from scoring_engine import DEFAULT_QUICK_SCORE_WEIGHTS, SkillMatrix
+
+
+def weights_key(weights: Optional[Dict] = None) -> str:
+    """Identifies the quick score weights the neighbors were ranked with"""
+    return fingerprint(json.dumps({**DEFAULT_QUICK_SCORE_WEIGHTS, **(weights or {})}, sort_keys=True))
+
+
+class NeighborStore:
+    """
+    Each participant's top-K quick-score candidates, one document per participant.
+
+    Documents carry the hackathon's data version (HackathonSnapshots.version_of) and
+    the weights they were ranked with; lookups only use documents matching both, so
+    stale neighbors are never served while a recompute is pending.
+    """
+
+    def __init__(self, collection, k: int = 50, chunk_rows: int = 512):
+        """
+        Args:
+            collection: pymongo collection holding the neighbor documents
+            k: Neighbors stored per participant (at least the prefilter's candidate count)
+            chunk_rows: Participants scored per matrix product, bounding memory
+        """
+        self.collection = collection
+        self.k = k
+        self.chunk_rows = chunk_rows
+        self.collection.create_index([('hackathon', 1), ('participant_id', 1)], unique=True)
+
+    def compute(self, hackathon: str, collection, version: int, weights: Optional[Dict] = None) -> int:
+        """
+        Rank every participant of a hackathon against all others and store the top K.
+
+        Args:
+            hackathon: Hackathon to compute
+            collection: Collection serving the hackathon's participants
+            version: The hackathon's current data version
+            weights: Quick score weights (defaults to DEFAULT_QUICK_SCORE_WEIGHTS)
+
+        Returns:
+            Number of participants stored
+        """
+        start = time.perf_counter()
+        projection = {'_id': 0, 'participant_id': 1, 'skills': 1, 'interests': 1, 'stats.projects': 1}
+        matrix = SkillMatrix.from_participants(collection.find({'hackathon': hackathon}, projection))
+        weights = {**DEFAULT_QUICK_SCORE_WEIGHTS, **(weights or {})}
+        key = weights_key(weights)
+        now = datetime.now(timezone.utc)
+
+        with BulkWriter(self.collection) as writer:
+            for participant_id, neighbors in matrix.top_k_all(self.k, weights, self.chunk_rows):
+                writer.add(ReplaceOne(
+                    {'hackathon': hackathon, 'participant_id': participant_id},
+                    {
+                        'hackathon': hackathon,
+                        'participant_id': participant_id,
+                        'neighbors': [{'participant_id': pid, 'score': score} for pid, score in neighbors],
+                        'version': version,
+                        'weights_key': key,
+                        'computed_at': now
+                    },
+                    upsert=True
+                ))
+        # Participants no longer in the hackathon
+        self.collection.delete_many({'hackathon': hackathon, 'computed_at': {'$ne': now}})
+
+        print(f"🧭 Stored top-{self.k} neighbors for {len(matrix)} {hackathon} participants "
+              f"in {time.perf_counter() - start:.1f}s")
+        return len(matrix)
+
+    def lookup(self, hackathon: str, participant_id: str, version: int, weights: Optional[Dict] = None,
+               limit: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Stored neighbor ids of a participant, best first, or None when there are none
+        for this data version and weights (the caller should score live instead).
+        """
+        doc = self.collection.find_one(
+            {'hackathon': hackathon, 'participant_id': participant_id},
+            {'_id': 0, 'neighbors': 1, 'version': 1, 'weights_key': 1}
+        )
+        if not doc or doc.get('version') != version or doc.get('weights_key') != weights_key(weights):
+            return None
+        if limit is not None and limit > self.k:
+            return None
+        ids = [neighbor['participant_id'] for neighbor in doc.get('neighbors', [])]
+        return ids[:limit] if limit is not None else ids
+
+
+def refresh_neighbors(store: NeighborStore, snapshots, hackathon: str, weights: Optional[Dict] = None) -> int:
+    """Recompute a hackathon's neighbors from the data currently serving it"""
+    return store.compute(hackathon, snapshots.collection_for(hackathon), snapshots.version_of(hackathon), weights)
+
+
+def main():
+    from app import get_neighbor_store, get_snapshots, mongo_pool, QUICK_SCORE_WEIGHTS
+
+    snapshots = get_snapshots()
+    hackathons = sys.argv[1:] or [hackathon for hackathon, _ in snapshots.sources()]
+    try:
+        for hackathon in hackathons:
+            refresh_neighbors(get_neighbor_store(), snapshots, hackathon, QUICK_SCORE_WEIGHTS)
+    finally:
+        mongo_pool.close()
+
+
+if __name__ == "__main__":
+    main()
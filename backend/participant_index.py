@@ -0,0 +1,276 @@
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from scoring_engine import SkillMatrix
+from vector_index import ProfileVectorIndex
+import heapq
+import threading
+import time
+
+
+def search_text(participant: Dict) -> str:
+    """
+    Text a participant is found by in free-text searches: skills, interests and role.
+    Profile labels, names and counts are left out, since words like "projects" or
+    "skills" would otherwise match every profile.
+    """
+    values = (participant.get('skills', []) or []) + (participant.get('interests', []) or []) \
+        + [participant.get('role', '') or '']
+    return '\n'.join(value for value in values if value)
+
+
+class HackathonIndex:
+    """
+    Inverted index over one hackathon's participants.
+
+    Skills, interests and role are indexed by lowercased value so keyword searches
+    can be answered by scanning the (small) vocabulary instead of every participant;
+    the quick score runs on a SkillMatrix built from each participant's exact values.
+    """
+
+    def __init__(self, hackathon: str, profile_formatter: Callable[[Dict], str] = None):
+        self.hackathon = hackathon
+        self.profile_formatter = profile_formatter
+        self.built_at = time.time()
+        # Name of the collection the index was loaded from (snapshot swaps change it)
+        self.source = None
+        # Data version of the hackathon the index reflects (HackathonSnapshots.version_of)
+        self.version = None
+        # Lowercased skill/interest/role value -> {participant id: occurrences}
+        self.term_postings = defaultdict(dict)
+        # Participant id -> per-participant numbers used by both prefilters
+        self.doc_stats = {}
+        self._doc_terms = {}
+        # Search text per participant (only with a profile_formatter)
+        self.profiles = {}
+        # Bitset matrix and TF-IDF vectors, rebuilt lazily after any change
+        self._matrix = None
+        self._vectors = None
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.doc_stats)
+
+    def add(self, participant: Dict):
+        """Index (or re-index) a single participant"""
+        participant_id = participant.get('participant_id')
+        if not participant_id:
+            return
+        with self._lock:
+            self._add(participant_id, participant)
+
+    def _add(self, participant_id: str, participant: Dict):
+        self._matrix = None
+        self._vectors = None
+        if participant_id in self.doc_stats:
+            self._remove(participant_id)
+
+        skills = participant.get('skills', []) or []
+        interests = participant.get('interests', []) or []
+        role = participant.get('role', '') or ''
+        stats = participant.get('stats', {}) or {}
+
+        distinct_skills = set(skills)
+        distinct_interests = set(interests)
+
+        terms = defaultdict(int)
+        for value in skills + interests + [role]:
+            if value:
+                terms[value.lower()] += 1
+        for term, count in terms.items():
+            self.term_postings[term][participant_id] = count
+
+        self.doc_stats[participant_id] = {
+            'skill_count': len(skills),
+            'distinct_skills': len(distinct_skills),
+            'projects': stats.get('projects', 0),
+            'achievements': stats.get('achievements', 0)
+        }
+        self._doc_terms[participant_id] = (distinct_skills, distinct_interests, list(terms))
+        if self.profile_formatter is not None:
+            self.profiles[participant_id] = self.profile_formatter(participant)
+
+    def remove(self, participant_id: str):
+        """Drop a participant from every posting list"""
+        with self._lock:
+            self._remove(participant_id)
+
+    def _remove(self, participant_id: str):
+        if participant_id not in self.doc_stats:
+            return
+        self._matrix = None
+        self._vectors = None
+        self.profiles.pop(participant_id, None)
+        _, _, terms = self._doc_terms.pop(participant_id)
+        for term in terms:
+            postings = self.term_postings.get(term)
+            if postings is not None:
+                postings.pop(participant_id, None)
+                if not postings:
+                    del self.term_postings[term]
+        del self.doc_stats[participant_id]
+
+    def matching(self, substring: str) -> Set[str]:
+        """Union of participants with any skill/interest/role containing the substring"""
+        with self._lock:
+            result = set()
+            for term, postings in self.term_postings.items():
+                if substring in term:
+                    result.update(postings)
+            return result
+
+    @property
+    def matrix(self) -> SkillMatrix:
+        """Packed skill/interest matrix of the indexed participants"""
+        with self._lock:
+            if self._matrix is None:
+                ids = list(self.doc_stats)
+                self._matrix = SkillMatrix(
+                    ids,
+                    [self._doc_terms[pid][0] for pid in ids],
+                    [self._doc_terms[pid][1] for pid in ids],
+                    [self.doc_stats[pid]['projects'] for pid in ids]
+                )
+            return self._matrix
+
+    @property
+    def vectors(self) -> Optional[ProfileVectorIndex]:
+        """TF-IDF vectors of the search texts (None without a profile_formatter)"""
+        with self._lock:
+            if self._vectors is None and self.profiles:
+                ids = list(self.profiles)
+                self._vectors = ProfileVectorIndex(ids, [self.profiles[pid] for pid in ids])
+            return self._vectors
+
+    def top_by_similarity(self, search_query: str, exclude_id: str, limit: int) -> List[str]:
+        """Participants whose profiles are most similar to a free-text query"""
+        vectors = self.vectors
+        if vectors is None:
+            return []
+        return [pid for pid, _ in vectors.top_k(search_query, limit, exclude_id)]
+
+    def top_by_quick_score(self, current_user: Dict, limit: int, weights: Optional[Dict] = None) -> List[str]:
+        """
+        Same ranking as the find_teammates quick score, computed in one NumPy pass:
+        complementary skills * 5 + shared interests * 10 + projects * 2 (by default)
+        """
+        return [pid for pid, _ in self.matrix.top_k(current_user, limit, weights)]
+
+    def top_by_query(self, search_query: str, keywords: List[str], exclude_id: str, limit: int) -> List[str]:
+        """
+        Same ranking as _prefilter_by_query: +10 per known keyword in both query and
+        profile, +5 per long query word in the profile, plus skill/project/achievement boosts.
+        """
+        query_lower = search_query.lower()
+        with self._lock:
+            scores = {
+                participant_id: stats['skill_count'] * 2 + stats['projects'] * 3 + stats['achievements'] * 2
+                for participant_id, stats in self.doc_stats.items()
+                if participant_id != exclude_id
+            }
+
+            for keyword in keywords:
+                if keyword in query_lower:
+                    for participant_id in self.matching(keyword):
+                        if participant_id in scores:
+                            scores[participant_id] += 10
+
+            for word in query_lower.split():
+                if len(word) > 3:
+                    for participant_id in self.matching(word):
+                        if participant_id in scores:
+                            scores[participant_id] += 5
+
+        return heapq.nlargest(limit, scores, key=scores.get)
+
+
+class ParticipantIndexRegistry:
+    """Process-wide collection of HackathonIndex objects, one per hackathon"""
+
+    def __init__(self, max_age_seconds: Optional[float] = 600,
+                 profile_formatter: Callable[[Dict], str] = None):
+        """
+        Args:
+            max_age_seconds: Rebuild an index from MongoDB once it is older than this
+                (catches ingests done by other processes such as upload_to_mongodb.py)
+            profile_formatter: Turns a participant into the text used for semantic
+                search, e.g. search_text (None disables the vector index)
+        """
+        self.max_age_seconds = max_age_seconds
+        self.profile_formatter = profile_formatter
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def build(self, hackathon: str, participants: Iterable[Dict]) -> HackathonIndex:
+        """Build a fresh index from participant documents and publish it"""
+        index = HackathonIndex(hackathon, self.profile_formatter)
+        for participant in participants:
+            index.add(participant)
+        with self._lock:
+            self._indexes[hackathon] = index
+        print(f"Indexed {len(index)} participants for {hackathon}")
+        return index
+
+    def get(self, hackathon: str, collection=None, version: Optional[int] = None) -> Optional[HackathonIndex]:
+        """
+        Return the index for a hackathon, (re)building it from the collection when it
+        is missing, expired, loaded from another collection or behind `version` (the
+        hackathon's data version, bumped by every ingest). Serving an index costs no
+        MongoDB round trip.
+        """
+        with self._lock:
+            index = self._indexes.get(hackathon)
+
+        if collection is None:
+            return index
+
+        expired = index is not None and self.max_age_seconds is not None and \
+            time.time() - index.built_at > self.max_age_seconds
+        swapped = index is not None and index.source is not None and index.source != collection.name
+        stale = index is not None and version is not None and index.version != version
+        if index is not None and not expired and not swapped and not stale:
+            return index
+
+        projection = {'_id': 0, 'participant_id': 1, 'skills': 1, 'interests': 1, 'role': 1, 'stats': 1}
+        index = self.build(hackathon, collection.find({'hackathon': hackathon}, projection))
+        index.source = collection.name
+        index.version = version
+        return index
+
+    def apply_changes(self, hackathon: str, upserted: Iterable[Dict] = (), removed_ids: Iterable[str] = (),
+                      source: Optional[str] = None, version: Optional[int] = None) -> bool:
+        """
+        Incrementally refresh an existing index after a partial ingest.
+        `source` names the collection now holding the data, if it changed, and
+        `version` the hackathon's data version after the ingest.
+        Returns False when there is no index for the hackathon yet, or when it missed
+        an earlier ingest (it is then dropped and rebuilt on the next get()).
+        """
+        with self._lock:
+            index = self._indexes.get(hackathon)
+        if index is None:
+            return False
+        if version is not None and index.version is not None and index.version != version - 1:
+            self.invalidate(hackathon)
+            return False
+        with index._lock:
+            for participant_id in removed_ids:
+                index.remove(participant_id)
+            for participant in upserted:
+                index.add(participant)
+            if source is not None:
+                index.source = source
+            if version is not None:
+                index.version = version
+        return True
+
+    def invalidate(self, hackathon: Optional[str] = None):
+        """Forget one hackathon's index, or all of them"""
+        with self._lock:
+            if hackathon is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(hackathon, None)
+
+    def hackathons(self) -> List[str]:
+        with self._lock:
+            return list(self._indexes)
@@ -0,0 +1,277 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+
+# Control records written after each hackathon's participants and at the end of a stream
+COMPLETE_KEY = '_complete'
+END_KEY = '_end'
+
+
+class IncompleteHackathon(Exception):
+    """A hackathon's participants ended without its completion marker (e.g. the scraper died)"""
+
+
+def is_stream_path(path: str) -> bool:
+    """True for NDJSON participant streams (.ndjson or .ndjson.gz)"""
+    return path.endswith('.ndjson') or path.endswith('.ndjson.gz')
+
+
+def _record_line(hackathon: str, participant: Dict) -> str:
+    return json.dumps(dict(participant, hackathon=hackathon), ensure_ascii=False) + '\n'
+
+
+def _open(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class ParticipantStreamWriter:
+    """
+    Writes participants as NDJSON, one record per line (gzip-compressed for .gz paths).
+
+    Every record carries its 'hackathon'. Records are flushed batch by batch as they
+    are scraped, and after a hackathon's last batch a {"_complete": <hackathon>,
+    "count": n} line is written, so a reader following the file can load that
+    hackathon while later ones are still being scraped; close() writes a final
+    {"_end": true} line.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = _open(path, 'w')
+
+    def write_records(self, hackathon: str, participants: Iterable[Dict]) -> int:
+        """Append a batch of a hackathon's participants (flushed, so followers see it now)"""
+        count = 0
+        for participant in participants:
+            self._file.write(_record_line(hackathon, participant))
+            count += 1
+        self._file.flush()
+        return count
+
+    def write_raw(self, source):
+        """Append NDJSON lines already rendered by write_records (e.g. a spool file)"""
+        shutil.copyfileobj(source, self._file)
+        self._file.flush()
+
+    def complete(self, hackathon: str, count: int):
+        """Mark a hackathon whose records have all been written as complete"""
+        self._file.write(json.dumps({COMPLETE_KEY: hackathon, 'count': count}) + '\n')
+        self._file.flush()
+
+    def write_hackathon(self, hackathon: str, participants: Iterable[Dict]) -> int:
+        """Write one hackathon's participants followed by its completion marker"""
+        count = self.write_records(hackathon, participants)
+        self.complete(hackathon, count)
+        return count
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write(json.dumps({END_KEY: True}) + '\n')
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class SpooledStreamWriter:
+    """
+    Streams batches of several hackathons scraped at once into one participant stream,
+    keeping each hackathon's records contiguous as iter_hackathons requires.
+
+    The first hackathon to send a batch is written straight through. Batches of the
+    others are spooled to temporary NDJSON files on disk (never held in memory) and
+    copied into the stream once the hackathon ahead of them completes; a hackathon
+    still scraping then continues straight through. A failed hackathon is abandoned:
+    its spool is dropped, or, if it was being written through, it is left without a
+    completion marker so readers skip it as incomplete.
+    """
+
+    def __init__(self, writer: ParticipantStreamWriter, spool_dir: Optional[str] = None):
+        """
+        Args:
+            writer: Stream the batches end up in
+            spool_dir: Directory for spool files (a temporary one by default)
+        """
+        self.writer = writer
+        self.spool_dir = spool_dir or tempfile.mkdtemp(prefix='participant-spool-')
+        self.active: Optional[str] = None
+        self.counts: Dict[str, int] = {}
+        self._spools: Dict[str, object] = {}
+        self._completed: List[str] = []
+
+    def _spool(self, hackathon: str):
+        if hackathon not in self._spools:
+            fd, path = tempfile.mkstemp(dir=self.spool_dir, suffix='.ndjson')
+            os.close(fd)
+            self._spools[hackathon] = open(path, 'w+', encoding='utf-8')
+        return self._spools[hackathon]
+
+    def _drop_spool(self, hackathon: str):
+        spool = self._spools.pop(hackathon, None)
+        if spool is not None:
+            spool.close()
+            os.remove(spool.name)
+
+    def _copy_spool(self, hackathon: str):
+        spool = self._spools.get(hackathon)
+        if spool is not None:
+            spool.flush()
+            spool.seek(0)
+            self.writer.write_raw(spool)
+            self._drop_spool(hackathon)
+
+    def _advance(self):
+        """Once nothing is being written through, flush completed spools and pick the next hackathon"""
+        while self.active is None and self._completed:
+            hackathon = self._completed.pop(0)
+            self._copy_spool(hackathon)
+            self.writer.complete(hackathon, self.counts.get(hackathon, 0))
+        if self.active is None and self._spools:
+            # Oldest hackathon still scraping: catch up on its spool, then write it through
+            self.active = next(iter(self._spools))
+            self._copy_spool(self.active)
+
+    def add(self, hackathon: str, participants: List[Dict]):
+        """Stream a batch of a hackathon's participants"""
+        self.counts[hackathon] = self.counts.get(hackathon, 0) + len(participants)
+        if self.active is None and hackathon not in self._completed:
+            self.active = hackathon
+        if hackathon == self.active:
+            self.writer.write_records(hackathon, participants)
+            return
+        spool = self._spool(hackathon)
+        for participant in participants:
+            spool.write(_record_line(hackathon, participant))
+
+    def complete(self, hackathon: str) -> int:
+        """Mark a hackathon whose batches have all been added as complete; returns its participant count"""
+        if hackathon == self.active:
+            self.writer.complete(hackathon, self.counts.get(hackathon, 0))
+            self.active = None
+        else:
+            self._completed.append(hackathon)
+        self._advance()
+        return self.counts.get(hackathon, 0)
+
+    def abandon(self, hackathon: str):
+        """Drop a hackathon whose scrape failed"""
+        if hackathon == self.active:
+            self.active = None
+        else:
+            self._drop_spool(hackathon)
+        self._advance()
+
+    def close(self):
+        """Drop spools of hackathons that never completed (the writer is closed by its owner)"""
+        for hackathon in list(self._spools):
+            self._drop_spool(hackathon)
+        shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+
+def read_records(path: str, follow: bool = False, poll_interval: float = 1.0,
+                 idle_timeout: Optional[float] = None) -> Iterator[Dict]:
+    """
+    Yield the records of an NDJSON stream one line at a time.
+
+    Args:
+        path: .ndjson or .ndjson.gz file
+        follow: Keep reading as the file grows (like tail -f) until the end marker;
+            only plain .ndjson can be followed
+        poll_interval: Seconds between checks for new lines while following
+        idle_timeout: Give up following after this long without new lines
+    """
+    if follow and path.endswith('.gz'):
+        raise ValueError('Compressed streams cannot be followed; write plain .ndjson to upload while scraping')
+
+    with _open(path, 'r') as f:
+        buffer = ''
+        last_data = time.monotonic()
+        while True:
+            try:
+                line = f.readline()
+            except EOFError:
+                # Truncated gzip stream (the writer died); what was read is all there is
+                print(f"⚠️  {path} ends abruptly")
+                return
+            if line:
+                buffer += line
+                if not buffer.endswith('\n') and follow:
+                    # The writer is mid-line; wait for the rest
+                    continue
+                last_data = time.monotonic()
+                text, buffer = buffer.strip(), ''
+                if not text:
+                    continue
+                record = json.loads(text)
+                yield record
+                if record.get(END_KEY):
+                    return
+                continue
+
+            if not follow:
+                if buffer.strip():
+                    yield json.loads(buffer)
+                return
+            if idle_timeout is not None and time.monotonic() - last_data > idle_timeout:
+                return
+            time.sleep(poll_interval)
+
+
+def iter_hackathons(records: Iterable[Dict]) -> Iterator[Tuple[str, Iterator[Dict]]]:
+    """
+    Group a record stream into (hackathon, participants) pairs without buffering.
+
+    Each participants iterator must be consumed before advancing to the next pair. It
+    raises IncompleteHackathon if the hackathon's records stop without a completion
+    marker, so a consumer like HackathonSnapshots.publish abandons it instead of
+    treating a truncated scrape as complete.
+    """
+    records = iter(records)
+    pending: List[Optional[Dict]] = [next(records, None)]
+
+    while pending[0] is not None:
+        first = pending[0]
+        if first.get(END_KEY):
+            return
+        if COMPLETE_KEY in first:
+            # A hackathon with no participants
+            pending[0] = next(records, None)
+            yield first[COMPLETE_KEY], iter(())
+            continue
+
+        hackathon = first.get('hackathon')
+
+        def participants(record=first, hackathon=hackathon):
+            while True:
+                if record is None or record.get(END_KEY):
+                    pending[0] = record
+                    raise IncompleteHackathon(f'{hackathon}: stream ended before the hackathon was complete')
+                if COMPLETE_KEY in record:
+                    pending[0] = next(records, None)
+                    if record[COMPLETE_KEY] != hackathon:
+                        raise IncompleteHackathon(f'{hackathon}: completion marker is for {record[COMPLETE_KEY]}')
+                    return
+                if record.get('hackathon') != hackathon:
+                    pending[0] = record
+                    raise IncompleteHackathon(f'{hackathon}: records of {record.get("hackathon")} started '
+                                              f'before the hackathon was complete')
+                yield record
+                record = next(records, None)
+
+        group = participants()
+        yield hackathon, group
+        # Skip whatever the consumer left unread
+        try:
+            for _ in group:
+                pass
+        except IncompleteHackathon:
+            pass
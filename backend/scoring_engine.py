@@ -0,0 +1,201 @@
+import numpy as np
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Weights of the find_teammates quick score
+DEFAULT_QUICK_SCORE_WEIGHTS = {
+    'complementary_skills': 5,
+    'shared_interests': 10,
+    'projects': 2
+}
+
+# Environment variable overriding each quick score weight
+QUICK_SCORE_WEIGHT_ENV = {
+    'complementary_skills': 'QUICK_SCORE_SKILL_WEIGHT',
+    'shared_interests': 'QUICK_SCORE_INTEREST_WEIGHT',
+    'projects': 'QUICK_SCORE_PROJECT_WEIGHT'
+}
+
+
+def quick_score_weights_from_env() -> Dict[str, float]:
+    """Quick score weights with any QUICK_SCORE_*_WEIGHT overrides from the environment"""
+    return {name: float(os.getenv(variable, DEFAULT_QUICK_SCORE_WEIGHTS[name]))
+            for name, variable in QUICK_SCORE_WEIGHT_ENV.items()}
+
+# Bits set in every byte value, for NumPy builds without np.bitwise_count
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount_rows(bits: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a packed uint8 matrix"""
+    if bits.shape[1] == 0:
+        return np.zeros(bits.shape[0], dtype=np.int32)
+    if hasattr(np, 'bitwise_count'):
+        counts = np.bitwise_count(bits)
+    else:
+        counts = _POPCOUNT_TABLE[bits]
+    return counts.sum(axis=1, dtype=np.int32)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Row indices of the k highest scores, highest first. Ties keep row order, so the
+    result matches a stable sort of the same scores.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        kth = np.partition(scores, n - k)[n - k]
+        above = np.flatnonzero(scores > kth)
+        ties = np.flatnonzero(scores == kth)[:k - len(above)]
+        selected = np.concatenate([above, ties])
+    else:
+        selected = np.arange(n)
+    return selected[np.lexsort((selected, -scores[selected]))]
+
+
+class SkillMatrix:
+    """
+    One hackathon's participants encoded as packed skill/interest bit matrices plus
+    stat arrays, so the quick score for every candidate is a single vectorized pass:
+    popcount(skills AND NOT user_skills), popcount(interests AND user_interests).
+    """
+
+    def __init__(self, participant_ids: List[str], skill_sets: List[Set[str]],
+                 interest_sets: List[Set[str]], projects: List[int]):
+        self.participant_ids = list(participant_ids)
+        self.row_of = {pid: row for row, pid in enumerate(self.participant_ids)}
+        self.skill_vocab = self._vocabulary(skill_sets)
+        self.interest_vocab = self._vocabulary(interest_sets)
+        self.skill_bits = self._pack(skill_sets, self.skill_vocab)
+        self.interest_bits = self._pack(interest_sets, self.interest_vocab)
+        self.projects = np.asarray(projects, dtype=np.int32)
+
+    @classmethod
+    def from_participants(cls, participants: Iterable[Dict]) -> 'SkillMatrix':
+        """Build from participant documents"""
+        ids, skills, interests, projects = [], [], [], []
+        for participant in participants:
+            participant_id = participant.get('participant_id')
+            if not participant_id:
+                continue
+            ids.append(participant_id)
+            skills.append(set(participant.get('skills', []) or []))
+            interests.append(set(participant.get('interests', []) or []))
+            projects.append((participant.get('stats', {}) or {}).get('projects', 0))
+        return cls(ids, skills, interests, projects)
+
+    def __len__(self) -> int:
+        return len(self.participant_ids)
+
+    @staticmethod
+    def _vocabulary(sets: List[Set[str]]) -> Dict[str, int]:
+        vocab = {}
+        for values in sets:
+            for value in values:
+                if value not in vocab:
+                    vocab[value] = len(vocab)
+        return vocab
+
+    @staticmethod
+    def _pack(sets: List[Set[str]], vocab: Dict[str, int]) -> np.ndarray:
+        rows = [row for row, values in enumerate(sets) for _ in values]
+        columns = [vocab[value] for values in sets for value in values]
+        dense = np.zeros((len(sets), len(vocab)), dtype=bool)
+        dense[rows, columns] = True
+        return np.packbits(dense, axis=1)
+
+    def _user_row(self, values: Iterable[str], vocab: Dict[str, int], width: int) -> np.ndarray:
+        dense = np.zeros(len(vocab), dtype=bool)
+        columns = [vocab[v] for v in set(values or []) if v in vocab]
+        dense[columns] = True
+        return np.packbits(dense)[:width]
+
+    def scores(self, current_user: Dict, weights: Optional[Dict] = None) -> np.ndarray:
+        """Quick score of every row against the current user"""
+        weights = weights or DEFAULT_QUICK_SCORE_WEIGHTS
+        user_skills = self._user_row(current_user.get('skills', []), self.skill_vocab, self.skill_bits.shape[1])
+        user_interests = self._user_row(current_user.get('interests', []), self.interest_vocab, self.interest_bits.shape[1])
+
+        complementary = popcount_rows(self.skill_bits & ~user_skills)
+        shared = popcount_rows(self.interest_bits & user_interests)
+
+        return (complementary * weights['complementary_skills']
+                + shared * weights['shared_interests']
+                + self.projects * weights['projects'])
+
+    def top_k(self, current_user: Dict, k: int, weights: Optional[Dict] = None) -> List[Tuple[str, float]]:
+        """(participant_id, score) for the k best candidates, excluding the current user"""
+        scores = self.scores(current_user, weights)
+        own_row = self.row_of.get(current_user.get('participant_id'))
+        if own_row is not None:
+            scores = scores.copy()
+            scores[own_row] = scores.min() - 1
+            k = min(k, len(scores) - 1)
+        rows = top_k_indices(scores, k)
+        return [(self.participant_ids[row], scores[row].item()) for row in rows]
+
+    @staticmethod
+    def _shared_columns(bits: np.ndarray, width: int) -> np.ndarray:
+        """Dense float32 copy of the columns held by at least two rows (only those can overlap)"""
+        dense = np.unpackbits(bits, axis=1, count=width).astype(bool) if width else np.zeros((len(bits), 0), bool)
+        return dense[:, dense.sum(axis=0) >= 2].astype(np.float32)
+
+    def top_k_all(self, k: int, weights: Optional[Dict] = None,
+                  chunk_rows: int = 512) -> Iterator[Tuple[str, List[Tuple[str, float]]]]:
+        """
+        (participant_id, top_k candidates) for every participant: the all-pairs version
+        of top_k, with the same scores and tie order.
+
+        Overlaps come from float32 matrix products (shared = A @ B.T, complementary =
+        |B| - shared) over `chunk_rows` participants at a time, so memory stays at
+        O(chunk_rows x participants) beyond the dense skill/interest matrices.
+        """
+        weights = weights or DEFAULT_QUICK_SCORE_WEIGHTS
+        n = len(self)
+        k = min(k, n - 1)
+        skills = self._shared_columns(self.skill_bits, len(self.skill_vocab))
+        interests = self._shared_columns(self.interest_bits, len(self.interest_vocab))
+        # Score of each candidate before subtracting skills the user already has
+        base = (popcount_rows(self.skill_bits) * weights['complementary_skills']
+                + self.projects * weights['projects']).astype(np.float64)
+
+        for start in range(0, n, max(1, chunk_rows)):
+            stop = min(n, start + max(1, chunk_rows))
+            shared_skills = skills[start:stop] @ skills.T
+            shared_interests = interests[start:stop] @ interests.T
+            scores = (base[None, :]
+                      - shared_skills.astype(np.float64) * weights['complementary_skills']
+                      + shared_interests.astype(np.float64) * weights['shared_interests'])
+
+            for offset, row in enumerate(range(start, stop)):
+                row_scores = scores[offset]
+                row_scores[row] = row_scores.min() - 1
+                rows = top_k_indices(row_scores, k)
+                yield self.participant_ids[row], [(self.participant_ids[r], row_scores[r].item()) for r in rows]
+
+    def compatibility_matrix(self, weights: Optional[Dict] = None, chunk_rows: int = 512) -> np.ndarray:
+        """
+        Symmetric (participants x participants) float32 matrix of pair compatibility:
+        the quick score of j for i plus that of i for j, i.e. skills either one brings
+        that the other lacks, interests they share (counted from both sides) and both
+        project counts. The diagonal is 0.
+        """
+        weights = weights or DEFAULT_QUICK_SCORE_WEIGHTS
+        n = len(self)
+        skills = self._shared_columns(self.skill_bits, len(self.skill_vocab))
+        interests = self._shared_columns(self.interest_bits, len(self.interest_vocab))
+        skill_counts = popcount_rows(self.skill_bits).astype(np.float32)
+        # Per-participant part of the pair score: own skills and projects
+        own = (skill_counts * weights['complementary_skills'] + self.projects * weights['projects']).astype(np.float32)
+
+        matrix = np.empty((n, n), dtype=np.float32)
+        for start in range(0, n, max(1, chunk_rows)):
+            stop = min(n, start + max(1, chunk_rows))
+            block = matrix[start:stop]
+            block[:] = own[start:stop, None] + own[None, :]
+            block -= (skills[start:stop] @ skills.T) * (2 * weights['complementary_skills'])
+            block += (interests[start:stop] @ interests.T) * (2 * weights['shared_interests'])
+        np.fill_diagonal(matrix, 0)
+        return matrix
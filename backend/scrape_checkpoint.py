@@ -0,0 +1,125 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List
+import json
+import os
+import re
+import time
+
+
+class ScrapeCheckpoint:
+    """
+    On-disk record of the participants a scrape has extracted so far.
+
+    Participants are keyed by participant_id (cards without one are kept in order) and
+    written atomically at most every `interval_seconds`, so a crash loses at most that
+    much work. Loading a checkpoint gives back the known ids so a resumed scrape can
+    skip those cards, and `next_page`, the first ?page=N listing page not yet fully
+    recorded, so paginated (HTTP) scrapes can resume from there. Scrolled (Selenium)
+    scrapes leave it at 1: the infinite scroll can only load the listing from the top.
+    """
+
+    def __init__(self, path: str, url: str = None, interval_seconds: float = 30.0):
+        """
+        Args:
+            path: Checkpoint JSON file
+            url: Participants URL being scraped (stored for reference)
+            interval_seconds: Minimum time between automatic writes
+        """
+        self.path = path
+        self.url = url
+        self.interval_seconds = interval_seconds
+        self.participants: Dict[str, Dict] = {}
+        self.anonymous: List[Dict] = []
+        self.next_page = 1
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    @staticmethod
+    def path_for(directory: str, hackathon_name: str) -> str:
+        """Checkpoint file for a hackathon inside `directory`"""
+        safe_name = re.sub(r'[^A-Za-z0-9_-]', '_', hackathon_name)
+        return os.path.join(directory, f"{safe_name}.checkpoint.json")
+
+    def load(self, max_age_seconds: float = None) -> int:
+        """
+        Reload a previous checkpoint if there is one; returns the participants restored.
+        Checkpoints older than max_age_seconds are ignored (the listing may have changed).
+        """
+        if not os.path.exists(self.path):
+            return 0
+        if max_age_seconds is not None and time.time() - os.path.getmtime(self.path) > max_age_seconds:
+            print(f"⚠️  Ignoring checkpoint {self.path} older than {max_age_seconds:.0f}s")
+            return 0
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable checkpoint {self.path}: {e}")
+            return 0
+
+        self.participants = {}
+        self.anonymous = []
+        self.add(data.get('participants', []))
+        self.next_page = max(1, int(data.get('next_page') or 1))
+        self._dirty = False
+        return len(self)
+
+    def add(self, participants: Iterable[Dict]) -> int:
+        """Record extracted participants; returns how many were new"""
+        added = 0
+        for participant in participants:
+            participant_id = participant.get('participant_id')
+            if not participant_id:
+                self.anonymous.append(participant)
+            elif participant_id not in self.participants:
+                self.participants[participant_id] = participant
+            else:
+                continue
+            added += 1
+        self._dirty = self._dirty or added > 0
+        return added
+
+    def advance(self, next_page: int):
+        """Record that every listing page before `next_page` is in the checkpoint"""
+        if next_page > self.next_page:
+            self.next_page = next_page
+            self._dirty = True
+
+    def known_ids(self) -> List[str]:
+        return list(self.participants)
+
+    def all(self) -> List[Dict]:
+        return list(self.participants.values()) + self.anonymous
+
+    def __len__(self) -> int:
+        return len(self.participants) + len(self.anonymous)
+
+    def maybe_save(self):
+        """Write the checkpoint if it changed and the interval has passed"""
+        if self._dirty and time.monotonic() - self._last_save >= self.interval_seconds:
+            self.save()
+
+    def save(self):
+        """Write the checkpoint now (atomically)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'url': self.url,
+                'updated_at': datetime.now(timezone.utc).isoformat(),
+                'next_page': self.next_page,
+                'participants': self.all()
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+        self._last_save = time.monotonic()
+        print(f"💾 Checkpointed {len(self)} participants to {self.path}")
+
+    def clear(self):
+        """Remove the checkpoint once the scrape's results are safely stored"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
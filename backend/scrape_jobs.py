@@ -0,0 +1,183 @@
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+import uuid
+
+# Job statuses
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class ScrapeCancelled(Exception):
+    """Raised inside a running scrape when its job has been cancelled"""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ScrapeJobStore:
+    """
+    Persistent scrape job records in MongoDB.
+
+    While a job is queued or running it carries an `active_url` field covered by a
+    unique index, so a second request for the same hackathon URL gets the existing
+    job back instead of starting another scrape.
+    """
+
+    def __init__(self, collection, retention_days: int = 7):
+        """
+        Args:
+            collection: pymongo collection holding the job documents
+            retention_days: Finished jobs are removed by a TTL index after this many days
+        """
+        self.collection = collection
+        self.collection.create_index('active_url', unique=True, sparse=True)
+        self.collection.create_index([('status', 1), ('created_at', 1)])
+        self.collection.create_index('finished_at', expireAfterSeconds=retention_days * 86400)
+
+    def submit(self, url: str, hackathon: str, mode: str = 'full') -> Dict:
+        """
+        Create a queued job for the URL, or return the job already active for it.
+        mode is 'full' or 'delta' (only new sign-ups of an already stored hackathon).
+        """
+        now = _now()
+        job = {
+            '_id': uuid.uuid4().hex,
+            'url': url,
+            'active_url': url,
+            'hackathon': hackathon,
+            'mode': mode,
+            'status': QUEUED,
+            'phase': 'queued',
+            'participants_loaded': 0,
+            'cancel_requested': False,
+            'created_at': now,
+            'updated_at': now
+        }
+        try:
+            self.collection.insert_one(job)
+            job['created'] = True
+            return job
+        except DuplicateKeyError:
+            existing = self.collection.find_one({'active_url': url})
+            if existing is None:
+                # The active job finished between our insert and lookup
+                return self.submit(url, hackathon, mode)
+            existing['created'] = False
+            return existing
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        return self.collection.find_one({'_id': job_id})
+
+    def claim_next(self, worker_id: str) -> Optional[Dict]:
+        """Atomically move the oldest queued job to running and return it"""
+        now = _now()
+        return self.collection.find_one_and_update(
+            {'status': QUEUED},
+            {'$set': {'status': RUNNING, 'phase': 'starting', 'worker_id': worker_id,
+                      'started_at': now, 'updated_at': now}},
+            sort=[('created_at', 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    def update_progress(self, job_id: str, phase: str, participants_loaded: Optional[int] = None) -> bool:
+        """
+        Record progress and heartbeat for a running job.
+
+        Returns False when cancellation has been requested, or the job is no longer
+        running (e.g. it was failed as stale), so the caller can stop.
+        """
+        fields = {'phase': phase, 'updated_at': _now()}
+        if participants_loaded is not None:
+            fields['participants_loaded'] = participants_loaded
+        job = self.collection.find_one_and_update(
+            {'_id': job_id, 'status': RUNNING},
+            {'$set': fields},
+            projection={'cancel_requested': 1},
+            return_document=ReturnDocument.AFTER
+        )
+        return job is not None and not job.get('cancel_requested', False)
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """Refresh a running job's heartbeat; False once the worker no longer owns it"""
+        result = self.collection.update_one(
+            {'_id': job_id, 'status': RUNNING, 'worker_id': worker_id},
+            {'$set': {'updated_at': _now()}}
+        )
+        return result.matched_count > 0
+
+    def finish(self, job_id: str, worker_id: str, status: str, result: Optional[Dict] = None,
+               error: Optional[str] = None) -> bool:
+        """
+        Mark a job finished and release its URL for future scrapes.
+
+        Only the worker still running the job can finish it, so a job already failed
+        as stale (or claimed elsewhere) keeps its outcome. Returns whether it applied.
+        """
+        now = _now()
+        fields = {'status': status, 'phase': 'done', 'finished_at': now, 'updated_at': now}
+        if result is not None:
+            fields['result'] = result
+        if error is not None:
+            fields['error'] = error
+        updated = self.collection.update_one(
+            {'_id': job_id, 'status': RUNNING, 'worker_id': worker_id},
+            {'$set': fields, '$unset': {'active_url': ''}}
+        )
+        return updated.modified_count > 0
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """Cancel a queued job immediately, or ask the worker to stop a running one"""
+        job = self.collection.find_one_and_update(
+            {'_id': job_id, 'status': QUEUED},
+            {'$set': {'status': CANCELLED, 'phase': 'done', 'cancel_requested': True,
+                      'finished_at': _now(), 'updated_at': _now()},
+             '$unset': {'active_url': ''}},
+            return_document=ReturnDocument.AFTER
+        )
+        if job is not None:
+            return job
+        return self.collection.find_one_and_update(
+            {'_id': job_id, 'status': RUNNING},
+            {'$set': {'cancel_requested': True, 'updated_at': _now()}},
+            return_document=ReturnDocument.AFTER
+        ) or self.get(job_id)
+
+    def fail_stale(self, heartbeat_timeout_seconds: int) -> int:
+        """Fail running jobs whose worker stopped heartbeating (e.g. it crashed)"""
+        cutoff = _now() - timedelta(seconds=heartbeat_timeout_seconds)
+        result = self.collection.update_many(
+            {'status': RUNNING, 'updated_at': {'$lt': cutoff}},
+            {'$set': {'status': FAILED, 'phase': 'done', 'error': 'Worker stopped responding',
+                      'finished_at': _now()},
+             '$unset': {'active_url': ''}}
+        )
+        return result.modified_count
+
+    @staticmethod
+    def to_response(job: Dict) -> Dict:
+        """Public JSON view of a job"""
+        response = {
+            'job_id': job['_id'],
+            'url': job.get('url'),
+            'hackathon': job.get('hackathon'),
+            'mode': job.get('mode', 'full'),
+            'status': job.get('status'),
+            'phase': job.get('phase'),
+            'participants_loaded': job.get('participants_loaded', 0),
+            'cancel_requested': job.get('cancel_requested', False)
+        }
+        for field in ('created_at', 'started_at', 'finished_at'):
+            if job.get(field):
+                response[field] = job[field].isoformat()
+        if job.get('result') is not None:
+            response['result'] = job['result']
+        if job.get('error'):
+            response['error'] = job['error']
+        return response
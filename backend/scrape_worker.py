@@ -0,0 +1,171 @@
+import os
+import socket
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from typing import Dict
+from dotenv import load_dotenv
+
+from app import (DevpostScraperService, DEVPOST_COOKIES, SCRAPE_CHECKPOINT_DIR, get_collection, get_driver_pool,
+                 get_scrape_jobs, get_snapshots, mongo_pool, refresh_teammate_neighbors, scrape_checkpoint_for,
+                 store_participants)
+from scrape_jobs import SUCCEEDED, FAILED, CANCELLED
+
+# Load environment variables
+load_dotenv()
+
+POLL_INTERVAL_SECONDS = float(os.getenv('SCRAPE_WORKER_POLL_INTERVAL', '2'))
+HEARTBEAT_TIMEOUT_SECONDS = int(os.getenv('SCRAPE_WORKER_HEARTBEAT_TIMEOUT', '300'))
+# Write progress to MongoDB at most this often while scrolling
+PROGRESS_INTERVAL_SECONDS = float(os.getenv('SCRAPE_WORKER_PROGRESS_INTERVAL', '2'))
+# Heartbeat a running job this often whatever phase it is in (storing, neighbors, ...)
+HEARTBEAT_INTERVAL_SECONDS = HEARTBEAT_TIMEOUT_SECONDS / 3
+
+
+@contextmanager
+def heartbeat(job_id: str, worker_id: str):
+    """Keep a running job's heartbeat fresh from a background thread while the body runs"""
+    jobs = get_scrape_jobs()
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(HEARTBEAT_INTERVAL_SECONDS):
+            try:
+                if not jobs.heartbeat(job_id, worker_id):
+                    return
+            except Exception as e:
+                print(f"⚠️  Job {job_id}: heartbeat failed: {e}")
+
+    thread = threading.Thread(target=beat, name=f'heartbeat-{job_id}', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_job(job: Dict, scraper: DevpostScraperService):
+    """Run one claimed scrape job and record its outcome"""
+    jobs = get_scrape_jobs()
+    job_id, worker_id = job['_id'], job['worker_id']
+    last_report = {'phase': None, 'at': 0.0, 'active': True}
+
+    def finish(status: str, **outcome) -> bool:
+        if not jobs.finish(job_id, worker_id, status, **outcome):
+            print(f"⚠️  Job {job_id}: no longer running on this worker, keeping its recorded outcome")
+            return False
+        return True
+
+    def on_progress(phase: str, participants_loaded: int) -> bool:
+        # Always report phase changes; throttle the per-scroll count updates
+        now = time.monotonic()
+        if phase != last_report['phase'] or now - last_report['at'] >= PROGRESS_INTERVAL_SECONDS:
+            last_report.update(phase=phase, at=now,
+                               active=jobs.update_progress(job_id, phase, participants_loaded))
+        return last_report['active']
+
+    print(f"▶️  Job {job_id}: scraping {job['url']}")
+    start = time.perf_counter()
+
+    try:
+        with heartbeat(job_id, worker_id):
+            known_ids = None
+            if job.get('mode') == 'delta':
+                known_ids = get_collection(job['hackathon']).distinct('participant_id', {'hackathon': job['hackathon']})
+                if known_ids:
+                    print(f"   Delta scrape against {len(known_ids)} stored participants")
+                else:
+                    # Nothing stored yet, so a delta scrape is a full one
+                    known_ids = None
+
+            participants, hackathon_name, error = scraper.scrape_participants(
+                job['url'], DEVPOST_COOKIES, on_progress, known_ids=known_ids
+            )
+
+            if not last_report['active']:
+                if finish(CANCELLED, error='Cancelled by request'):
+                    print(f"⏹️  Job {job_id}: cancelled")
+                return
+
+            if error:
+                finish(FAILED, error=error)
+                print(f"❌ Job {job_id}: {error}")
+                return
+
+            if not participants:
+                finish(FAILED, error='No participants found')
+                print(f"⚠️  Job {job_id}: no participants found")
+                return
+
+            jobs.update_progress(job_id, 'storing', len(participants))
+            counts = store_participants(hackathon_name, participants, partial=known_ids is not None)
+            if SCRAPE_CHECKPOINT_DIR:
+                # Stored; the next scrape of this hackathon starts fresh
+                scrape_checkpoint_for(hackathon_name).clear()
+
+            # A full scrape always publishes a new version; a delta only when it changed something
+            if known_ids is None or counts['inserted'] or counts['updated']:
+                jobs.update_progress(job_id, 'neighbors', len(participants))
+                refresh_teammate_neighbors(hackathon_name)
+
+        if finish(SUCCEEDED, result={
+            'success': True,
+            'hackathon': hackathon_name,
+            'participants_count': len(participants),
+            'mode': 'delta' if known_ids is not None else 'full',
+            'changes': counts,
+            'duration_seconds': round(time.perf_counter() - start, 1),
+            'message': f"Successfully scraped {len(participants)} participants "
+                       f"({counts['inserted']} new, {counts['updated']} updated, {counts['removed']} removed)!"
+        }):
+            print(f"✅ Job {job_id}: synced {len(participants)} participants from {hackathon_name}: {counts}")
+
+    except Exception as e:
+        traceback.print_exc()
+        finish(FAILED, error=str(e))
+
+
+def run_worker():
+    """Poll the job collection and run queued scrapes one at a time"""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    jobs = get_scrape_jobs()
+    driver_pool = get_driver_pool()
+    scraper = DevpostScraperService(driver_pool=driver_pool)
+    if driver_pool is not None and scraper.engine == 'selenium':
+        # Have Chrome up and authenticated before the first job arrives
+        driver_pool.start()
+
+    print(f"🚀 Scrape worker {worker_id} started (polling every {POLL_INTERVAL_SECONDS}s)")
+
+    last_gc = 0.0
+
+    try:
+        while True:
+            # Drop hackathon snapshots whose grace period has ended
+            if time.monotonic() - last_gc > 60:
+                get_snapshots().collect_garbage()
+                last_gc = time.monotonic()
+
+            stale = jobs.fail_stale(HEARTBEAT_TIMEOUT_SECONDS)
+            if stale:
+                print(f"⚠️  Marked {stale} stale job(s) as failed")
+
+            job = jobs.claim_next(worker_id)
+            if job is None:
+                time.sleep(POLL_INTERVAL_SECONDS)
+                continue
+
+            run_job(job, scraper)
+
+    except KeyboardInterrupt:
+        print("\n🛑 Scrape worker stopped")
+    finally:
+        if driver_pool is not None:
+            driver_pool.close()
+        mongo_pool.close()
+
+
+if __name__ == "__main__":
+    run_worker()
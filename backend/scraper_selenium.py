@@ -1,230 +1,225 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from card_parser import extract_participants
+from chrome_profile import launch_chrome
+from scroll_loader import scroll_to_end, wait_for_initial_cards
+from dom_extractor import drain_cards, preload_known_ids, reported_total
+from delta_scrape import DeltaScrape
+from scrape_checkpoint import ScrapeCheckpoint
+from participant_stream import ParticipantStreamWriter, SpooledStreamWriter, is_stream_path
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import argparse
 import json
-import time
+import multiprocessing
 import os
-from typing import List, Dict
+import queue
+import time
+from typing import Callable, Iterable, List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 class DevpostSeleniumScraper:
-    def __init__(self):
-        # Setup Chrome options
-        self.options = Options()
-        self.options.add_argument('--headless')  # Run in background
-        self.options.add_argument('--no-sandbox')
-        self.options.add_argument('--disable-dev-shm-usage')
-        self.options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-
-    def scrape_with_cookies(self, url: str, cookies: List[Dict]) -> List[Dict]:
+    def __init__(self, lean: bool = None):
+        # Lean mode skips images, fonts and trackers (only card HTML is parsed)
+        if lean is None:
+            lean = os.getenv('SCRAPE_LEAN_BROWSER', 'false').lower() in ('1', 'true', 'yes')
+        self.lean = lean
+
+    def scrape_with_cookies(self, url: str, cookies: List[Dict], checkpoint: ScrapeCheckpoint = None,
+                            delta: DeltaScrape = None) -> List[Dict]:
         """
         Scrape participants using Selenium with infinite scroll support.
 
         Args:
             url: The Devpost participants page URL
             cookies: List of cookie dictionaries with 'name' and 'value' keys
+            checkpoint: If given, cards are extracted while scrolling and periodically
+                saved to it; participants it already holds (from load()) are skipped
+            delta: If given, only the newest part of the listing is read, stopping once
+                it has seen enough already-known participants (the result is partial)
 
         Returns:
             List of participant data dictionaries
         """
-        driver = webdriver.Chrome(options=self.options)
+        driver = launch_chrome(self.lean)
 
         try:
-            # First, navigate to the domain to set cookies
-            base_url = url.split('/participants')[0]
-            driver.get(base_url)
-
-            # Add cookies
-            for cookie in cookies:
-                if 'name' in cookie and 'value' in cookie:
-                    cookie_dict = {
-                        'name': cookie['name'],
-                        'value': cookie['value'],
-                        'domain': cookie.get('domain', '.devpost.com')
-                    }
-                    try:
-                        driver.add_cookie(cookie_dict)
-                    except Exception as e:
-                        print(f"Failed to add cookie {cookie['name']}: {e}")
-
-            # Now navigate to the participants page
-            driver.get(url)
-            time.sleep(3)  # Wait for initial load
-
-            # Check if we're logged in
-            if "Please log in" in driver.page_source:
-                print("⚠️  Authentication failed - cookies may be expired")
+            if not self._open_listing(driver, url, cookies):
                 return []
 
-            print("✓ Successfully authenticated")
+            if delta is not None:
+                return self._scroll_delta(driver, delta)
 
-            # Scroll to load all participants
-            last_height = driver.execute_script("return document.body.scrollHeight")
-            participants_count = 0
+            if checkpoint is not None:
+                return self._scroll_with_checkpoint(driver, checkpoint)
 
+            # Scroll to load all participants
             print("Scrolling to load all participants...")
-
-            while True:
-                # Scroll down to bottom
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-
-                # Wait for new content to load
-                time.sleep(2)
-
-                # Count participants
-                current_count = len(driver.find_elements(By.CLASS_NAME, "participant"))
-                if current_count > participants_count:
-                    print(f"Loaded {current_count} participants...")
-                    participants_count = current_count
-                else:
-                    # No new participants loaded, we might be done
-                    # Try scrolling one more time to be sure
-                    new_height = driver.execute_script("return document.body.scrollHeight")
-                    if new_height == last_height:
-                        break
-                    last_height = new_height
-                    continue
-
-                last_height = driver.execute_script("return document.body.scrollHeight")
+            participants_count = scroll_to_end(driver)
 
             print(f"Finished scrolling. Total participants found: {participants_count}")
 
             # Parse the fully loaded page
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            participants = self._extract_all_participants(soup)
+            participants = extract_participants(driver.page_source)
+            print(f"Extracted data from {len(participants)} participants")
 
             return participants
 
         finally:
             driver.quit()
 
-    def _extract_all_participants(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract all participant data from the page."""
-        participants = []
-        participant_cards = soup.find_all('div', class_='participant')
+    def stream_with_cookies(self, url: str, cookies: List[Dict], on_batch: Callable[[List[Dict]], None],
+                            checkpoint: ScrapeCheckpoint = None) -> int:
+        """
+        Scrape participants, handing them over batch by batch as cards are extracted
+        while scrolling instead of returning them all at the end.
+
+        Args:
+            url: The Devpost participants page URL
+            cookies: List of cookie dictionaries with 'name' and 'value' keys
+            on_batch: Called with each batch of newly extracted participants
+            checkpoint: If given, batches are also recorded and periodically saved to it;
+                participants it already holds (from load()) are handed over first
+
+        Returns:
+            Number of participants handed to on_batch
+        """
+        driver = launch_chrome(self.lean)
+
+        try:
+            if not self._open_listing(driver, url, cookies):
+                return 0
+            return self._scroll_streaming(driver, on_batch, checkpoint)
+
+        finally:
+            driver.quit()
+
+    def _open_listing(self, driver, url: str, cookies: List[Dict]) -> bool:
+        """Load the participants page with the cookies set; False if Devpost asks to log in"""
+        # First, navigate to the domain to set cookies
+        base_url = url.split('/participants')[0]
+        driver.get(base_url)
+
+        # Add cookies
+        for cookie in cookies:
+            if 'name' in cookie and 'value' in cookie:
+                cookie_dict = {
+                    'name': cookie['name'],
+                    'value': cookie['value'],
+                    'domain': cookie.get('domain', '.devpost.com')
+                }
+                try:
+                    driver.add_cookie(cookie_dict)
+                except Exception as e:
+                    print(f"Failed to add cookie {cookie['name']}: {e}")
+
+        # Now navigate to the participants page
+        driver.get(url)
+        wait_for_initial_cards(driver)
+
+        # Check if we're logged in
+        if "Please log in" in driver.page_source:
+            print("⚠️  Authentication failed - cookies may be expired")
+            return False
+
+        print("✓ Successfully authenticated")
+        return True
+
+    def _scroll_streaming(self, driver, on_batch: Callable[[List[Dict]], None],
+                          checkpoint: ScrapeCheckpoint = None) -> int:
+        """Scroll while handing each drained batch of cards to on_batch (and the checkpoint)"""
+        seen = set()
+        count = 0
+        if checkpoint is not None and len(checkpoint):
+            print(f"↩️  Resuming with {len(checkpoint)} participants from {checkpoint.path}")
+            preload_known_ids(driver, checkpoint.known_ids())
+            seen.update(checkpoint.known_ids())
+            count = len(checkpoint)
+            on_batch(checkpoint.all())
+
+        def drain(keep: int = 20):
+            nonlocal count
+            batch = []
+            for record in drain_cards(driver, keep=keep):
+                participant_id = record.get('participant_id')
+                if participant_id and participant_id in seen:
+                    continue
+                seen.add(participant_id)
+                batch.append(record)
+            if not batch:
+                return
+            if checkpoint is not None:
+                checkpoint.add(batch)
+                checkpoint.maybe_save()
+            on_batch(batch)
+            count += len(batch)
 
-        print(f"Extracting data from {len(participant_cards)} participants...")
+        try:
+            print("Scrolling to load all participants...")
+            participants_count = scroll_to_end(driver, on_new_cards=drain)
+            print(f"Finished scrolling. Total participants found: {participants_count}")
 
-        for i, card in enumerate(participant_cards, 1):
-            if i % 50 == 0:
-                print(f"  Processed {i} participants...")
+            drain(keep=0)
+            print(f"Extracted data from {count} participants")
+            return count
+        finally:
+            # Keep whatever was extracted, even if the browser or network failed
+            if checkpoint is not None:
+                checkpoint.save()
+
+    def _scroll_delta(self, driver, delta: DeltaScrape) -> List[Dict]:
+        """Extract cards while scrolling until the listing reaches known participants"""
+        participants = []
 
-            participant_data = self._extract_participant_data(card)
-            if participant_data:
-                participants.append(participant_data)
+        def drain(keep: int = 20):
+            records = drain_cards(driver, keep=keep)
+            delta.observe(records)
+            participants.extend(records)
 
+        if delta.nothing_new(reported_total(driver)):
+            print("Participant count unchanged; only re-reading the first cards")
+        else:
+            print("Scrolling until known participants are reached...")
+            scroll_to_end(driver, on_new_cards=drain, should_stop=lambda: delta.done)
+
+        drain(keep=0)
+        print(f"Extracted data from {len(participants)} participants ({delta.summary()})")
         return participants
 
-    def _extract_participant_data(self, card) -> Dict:
-        """Extract participant information from a card element."""
-        data = {}
+    def _scroll_with_checkpoint(self, driver, checkpoint: ScrapeCheckpoint) -> List[Dict]:
+        """Scroll while extracting cards into the checkpoint, so an interruption keeps them"""
+        if len(checkpoint):
+            print(f"↩️  Resuming with {len(checkpoint)} participants from {checkpoint.path}")
+            preload_known_ids(driver, checkpoint.known_ids())
+
+        def drain(keep: int = 20):
+            checkpoint.add(drain_cards(driver, keep=keep))
+            checkpoint.maybe_save()
 
         try:
-            # Extract participant ID
-            participant_id = card.get('data-participant-id')
-            if participant_id:
-                data['participant_id'] = participant_id
-
-            # Extract name
-            name_elem = card.find('div', class_='user-name')
-            if name_elem:
-                h5 = name_elem.find('h5')
-                if h5:
-                    data['name'] = h5.get_text().strip()
-
-            # Extract profile link
-            profile_link = card.find('a', class_='user-profile-link')
-            if profile_link:
-                data['profile_url'] = profile_link['href']
-
-            # Extract role
-            role_elem = card.find('span', class_='role')
-            if role_elem:
-                data['role'] = role_elem.get_text().strip()
-
-            # Extract stats
-            stats = {}
-            projects_elem = card.find('li', class_='participant-software-count')
-            if projects_elem:
-                strong = projects_elem.find('strong')
-                if strong:
-                    stats['projects'] = int(strong.get_text().strip())
-
-            followers_elem = card.find('li', class_='participant-followers-count')
-            if followers_elem:
-                strong = followers_elem.find('strong')
-                if strong:
-                    stats['followers'] = int(strong.get_text().strip())
-
-            achievements_elem = card.find('li', class_='participant-achievements-count')
-            if achievements_elem:
-                strong = achievements_elem.find('strong')
-                if strong:
-                    stats['achievements'] = int(strong.get_text().strip())
-
-            if stats:
-                data['stats'] = stats
-
-            # Extract skills
-            skills_section = card.find_all('span', class_='cp-tag')
-            if skills_section:
-                skills = []
-                for skill_tag in skills_section:
-                    skill_link = skill_tag.find('a')
-                    if skill_link:
-                        skills.append(skill_link.get_text().strip())
-                if skills:
-                    data['skills'] = skills
-
-            # Extract interests
-            main_content = card.find('div', class_='main-content')
-            if main_content:
-                headers = main_content.find_all('h6')
-                for header in headers:
-                    header_text = header.get_text().strip().lower()
-
-                    if 'interest' in header_text:
-                        interests_list = header.find_next('ul')
-                        if interests_list:
-                            interests = []
-                            for li in interests_list.find_all('li'):
-                                interest_tag = li.find('span', class_='cp-tag')
-                                if interest_tag:
-                                    interest_link = interest_tag.find('a')
-                                    if interest_link:
-                                        interests.append(interest_link.get_text().strip())
-                            if interests:
-                                data['interests'] = interests
-
-            # Extract photo URL
-            photo_elem = card.find('img', class_='user-photo')
-            if photo_elem and photo_elem.get('src'):
-                photo_url = photo_elem['src']
-                if photo_url.startswith('//'):
-                    photo_url = 'https:' + photo_url
-                data['photo_url'] = photo_url
-
-        except Exception as e:
-            print(f"Error extracting participant data: {e}")
-
-        return data
+            print("Scrolling to load all participants...")
+            participants_count = scroll_to_end(driver, on_new_cards=drain)
+            print(f"Finished scrolling. Total participants found: {participants_count}")
 
+            drain(keep=0)
+            print(f"Extracted data from {len(checkpoint)} participants")
+            return checkpoint.all()
+        finally:
+            # Keep whatever was extracted, even if the browser or network failed
+            checkpoint.save()
 
-def main():
-    # URLs to scrape
-    urls = [
-        'https://hacktx2025.devpost.com/participants',
-        'https://hackutd-2025.devpost.com/participants'
-    ]
 
-    # Cookies for authentication (loaded from environment variables)
-    cookies = [
+DEFAULT_URLS = [
+    'https://hacktx2025.devpost.com/participants',
+    'https://hackutd-2025.devpost.com/participants'
+]
+
+
+def cookies_from_env() -> List[Dict]:
+    """Cookies for authentication (loaded from environment variables)"""
+    return [
         {'name': 'jwt', 'value': os.getenv('DEVPOST_JWT', '')},
         {'name': 'remember_user_token', 'value': os.getenv('DEVPOST_REMEMBER_USER_TOKEN', '')},
         {'name': '_devpost', 'value': os.getenv('DEVPOST_SESSION', '')},
@@ -232,40 +227,316 @@ def main():
         {'name': '_ga', 'value': os.getenv('DEVPOST_GA', '')},
     ]
 
-    scraper = DevpostSeleniumScraper()
-    results = {}
 
-    print("🚀 Starting Devpost Selenium scraper...")
-    print("=" * 70)
+def hackathon_name_from_url(url: str) -> str:
+    return url.split('//')[-1].split('/')[0].split('.')[0]
+
+
+def read_urls(path: str) -> List[str]:
+    """One URL per line; blank lines and # comments are ignored"""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+
+def participants_url(url: str) -> str:
+    if not url.rstrip('/').endswith('/participants'):
+        url = url.rstrip('/') + '/participants'
+    return url
+
+
+def scrape_one(url: str, cookies: List[Dict], lean: bool = None, checkpoint_dir: Optional[str] = None,
+               resume: bool = False, known_ids: Iterable[str] = None,
+               known_run: int = 40) -> Tuple[str, List[Dict], float, Optional[str]]:
+    """
+    Scrape one hackathon in this process with its own driver.
+
+    With a checkpoint_dir, progress is checkpointed there while scrolling, and with
+    resume an existing checkpoint for the hackathon is picked up. With known_ids, only
+    new sign-ups are scraped (see DeltaScrape) and checkpoints are not used.
+
+    Returns:
+        (hackathon_name, participants, seconds, error_message)
+    """
+    url = participants_url(url)
+    hackathon_name = hackathon_name_from_url(url)
+
+    checkpoint = None
+    delta = DeltaScrape(known_ids, known_run) if known_ids else None
+    if checkpoint_dir and delta is None:
+        checkpoint = ScrapeCheckpoint(ScrapeCheckpoint.path_for(checkpoint_dir, hackathon_name), url=url)
+        if resume:
+            checkpoint.load()
+
+    start = time.perf_counter()
+    try:
+        participants = DevpostSeleniumScraper(lean=lean).scrape_with_cookies(url, cookies, checkpoint, delta)
+        return hackathon_name, participants, time.perf_counter() - start, None
+    except Exception as e:
+        return hackathon_name, [], time.perf_counter() - start, str(e)
+
+
+class ResultsFileWriter:
+    """
+    Writes a per-hackathon results file ({hackathon: [participants]}) batch by batch,
+    so a streaming scrape never holds the whole list. The file only replaces the
+    previous one on commit(), so a failed scrape leaves the old results in place.
+    """
+
+    def __init__(self, path: str, hackathon_name: str):
+        self.path = path
+        self.count = 0
+        self._tmp_path = f"{path}.tmp"
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write('{' + json.dumps(hackathon_name, ensure_ascii=False) + ': [')
+
+    def add(self, participants: List[Dict]):
+        for participant in participants:
+            self._file.write((',\n' if self.count else '\n') + json.dumps(participant, ensure_ascii=False))
+            self.count += 1
+
+    def commit(self):
+        self._file.write('\n]}\n')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self):
+        self._file.close()
+        os.remove(self._tmp_path)
+
+
+def stream_one(url: str, cookies: List[Dict], batches, results_dir: str, lean: bool = None,
+               checkpoint_dir: Optional[str] = None,
+               resume: bool = False) -> Tuple[str, int, Optional[Dict], float, Optional[str]]:
+    """
+    Scrape one hackathon in this process with its own driver, sending each extracted
+    batch to the parent as (hackathon_name, participants) on the `batches` queue and
+    writing it to the hackathon's results file as it arrives.
+
+    Checkpoints work as in scrape_one (the checkpoint itself still collects every
+    participant in this process, to be saved on an interruption).
+
+    Returns:
+        (hackathon_name, participant_count, first_participant, seconds, error_message)
+    """
+    url = participants_url(url)
+    hackathon_name = hackathon_name_from_url(url)
+
+    checkpoint = None
+    if checkpoint_dir:
+        checkpoint = ScrapeCheckpoint(ScrapeCheckpoint.path_for(checkpoint_dir, hackathon_name), url=url)
+        if resume:
+            checkpoint.load()
+
+    results_file = ResultsFileWriter(os.path.join(results_dir, f"{hackathon_name}.json"), hackathon_name)
+    first = []
+
+    def on_batch(participants: List[Dict]):
+        if not first:
+            first.extend(participants[:1])
+        results_file.add(participants)
+        batches.put((hackathon_name, participants))
+
+    start = time.perf_counter()
+    try:
+        count = DevpostSeleniumScraper(lean=lean).stream_with_cookies(url, cookies, on_batch, checkpoint)
+        results_file.commit()
+        return hackathon_name, count, first[0] if first else None, time.perf_counter() - start, None
+    except Exception as e:
+        results_file.discard()
+        return hackathon_name, 0, None, time.perf_counter() - start, str(e)
+
+
+def write_json(path: str, data):
+    """Write JSON atomically so a crash never leaves a half-written results file"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def read_results(path: str, hackathon_name: str) -> List[Dict]:
+    """Participants of a previous per-hackathon results file, or [] if there is none"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f).get(hackathon_name, [])
+    except (OSError, ValueError):
+        return []
+
+
+def merge_delta(previous: List[Dict], scraped: List[Dict]) -> List[Dict]:
+    """Apply a delta scrape to previous results: new participants first, changed ones replaced"""
+    scraped_ids = {p.get('participant_id') for p in scraped if p.get('participant_id')}
+    return scraped + [p for p in previous if p.get('participant_id') not in scraped_ids]
 
-    for url in urls:
-        hackathon_name = url.split('/')[2].split('.')[0]
-        print(f"\n🔍 Scraping {hackathon_name}...")
-        print("-" * 70)
 
-        participants = scraper.scrape_with_cookies(url, cookies)
-        results[hackathon_name] = participants
+def main():
+    parser = argparse.ArgumentParser(description='Scrape Devpost hackathon participants with Selenium')
+    parser.add_argument('urls', nargs='*', help='Hackathon or participants URLs')
+    parser.add_argument('-f', '--file', help='File with one hackathon URL per line')
+    parser.add_argument('-w', '--workers', type=int, default=int(os.getenv('SCRAPE_PARALLEL_WORKERS', '3')),
+                        help='Hackathons scraped at once, each in its own process and browser')
+    parser.add_argument('-o', '--output', default='participants_full.ndjson',
+                        help='Combined results: .ndjson/.ndjson.gz streams records while each hackathon '
+                             'is scraped, .json writes one document at the end')
+    parser.add_argument('--results-dir', default='scrape_results',
+                        help='Directory for per-hackathon results, written as each scrape finishes')
+    parser.add_argument('--lean', action='store_true', default=None, help='Block images, fonts and trackers (experimental, unbenchmarked)')
+    parser.add_argument('--checkpoint-dir', default='scrape_checkpoints',
+                        help='Where progress is checkpointed while scrolling ("" to disable)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue from existing checkpoints instead of starting over')
+    parser.add_argument('--delta', action='store_true',
+                        help='Only pick up new sign-ups, merged into the existing --results-dir files')
+    parser.add_argument('--known-run', type=int, default=int(os.getenv('SCRAPE_DELTA_KNOWN_RUN', '40')),
+                        help='With --delta, stop after this many already-scraped participants in a row')
+    args = parser.parse_args()
+
+    urls = list(args.urls)
+    if args.file:
+        urls += read_urls(args.file)
+    urls = list(dict.fromkeys(urls or DEFAULT_URLS))
+
+    cookies = cookies_from_env()
+    workers = max(1, min(args.workers, len(urls)))
+    os.makedirs(args.results_dir, exist_ok=True)
 
-        print(f"✅ Collected {len(participants)} participants from {hackathon_name}")
+    print("🚀 Starting Devpost Selenium scraper...")
+    print(f"   {len(urls)} hackathon(s), {workers} at a time")
+    print("=" * 70)
 
-    # Save results
-    output_file = 'participants_full.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    # Streamed outputs are written batch by batch; only a legacy .json output keeps everything
+    stream = ParticipantStreamWriter(args.output) if is_stream_path(args.output) else None
+    # Hackathons scraped at once are spooled so each one's records stay contiguous
+    mux = SpooledStreamWriter(stream) if stream is not None else None
+    # Full scrapes into a stream send each extracted batch back while they scroll
+    # (delta scrapes are merged with the previous results first, so they still return at the end)
+    streaming = stream is not None and not args.delta
+    manager = multiprocessing.Manager() if streaming else None
+    batches = manager.Queue() if streaming else None
+    results = {}
+    counts = {}
+    sample = None
+    timings = {}
+    failures = {}
+    start = time.perf_counter()
+
+    def result_file_for(hackathon_name: str) -> str:
+        return os.path.join(args.results_dir, f"{hackathon_name}.json")
+
+    def forward_batches():
+        while True:
+            try:
+                hackathon_name, participants = batches.get_nowait()
+            except queue.Empty:
+                return
+            mux.add(hackathon_name, participants)
+
+    previous = {}
+    if args.delta:
+        for url in urls:
+            hackathon_name = hackathon_name_from_url(url)
+            previous[hackathon_name] = read_results(result_file_for(hackathon_name), hackathon_name)
+            if not previous[hackathon_name]:
+                print(f"   {hackathon_name}: no previous results, scraping everything")
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            if stream is not None:
+                print(f"   Streaming results to {args.output} (upload_to_mongodb.py --follow can load them now)")
+            for url in urls:
+                if streaming:
+                    futures[pool.submit(stream_one, url, cookies, batches, args.results_dir, args.lean,
+                                        args.checkpoint_dir, args.resume)] = url
+                    continue
+                known_ids = [p['participant_id'] for p in previous.get(hackathon_name_from_url(url), [])
+                             if p.get('participant_id')]
+                futures[pool.submit(scrape_one, url, cookies, args.lean, args.checkpoint_dir, args.resume,
+                                    known_ids, args.known_run)] = url
+
+            pending = set(futures)
+            done = 0
+            while pending:
+                finished, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                if streaming:
+                    # A finished worker's batches are all queued by now; write them before its marker
+                    forward_batches()
+                for future in finished:
+                    done += 1
+                    url = futures[future]
+                    participants = []
+                    first = None
+                    try:
+                        if streaming:
+                            hackathon_name, count, first, seconds, error = future.result()
+                        else:
+                            hackathon_name, participants, seconds, error = future.result()
+                    except Exception as e:
+                        # The worker process itself died
+                        hackathon_name, seconds, error = hackathon_name_from_url(url), 0.0, str(e)
+
+                    timings[hackathon_name] = seconds
+                    if error:
+                        failures[hackathon_name] = error
+                        if mux is not None:
+                            mux.abandon(hackathon_name)
+                        print(f"❌ [{done}/{len(urls)}] {hackathon_name} failed after {seconds:.1f}s: {error}")
+                        if args.checkpoint_dir:
+                            print("   Progress is checkpointed; rerun with --resume to continue")
+                        continue
+
+                    result_file = result_file_for(hackathon_name)
+                    scraped_note = ""
+                    if streaming:
+                        # Records and the results file were written while the worker scrolled
+                        mux.complete(hackathon_name)
+                    else:
+                        scraped = len(participants)
+                        if previous.get(hackathon_name):
+                            participants = merge_delta(previous[hackathon_name], participants)
+                            scraped_note = f" ({scraped} re-scraped)"
+                        count = len(participants)
+                        first = participants[0] if participants else None
+                        write_json(result_file, {hackathon_name: participants})
+                        if mux is not None:
+                            mux.add(hackathon_name, participants)
+                            mux.complete(hackathon_name)
+                        else:
+                            results[hackathon_name] = participants
+                    counts[hackathon_name] = count
+                    if sample is None and first is not None:
+                        sample = (hackathon_name, first)
+                    if args.checkpoint_dir:
+                        ScrapeCheckpoint(ScrapeCheckpoint.path_for(args.checkpoint_dir, hackathon_name)).clear()
+                    print(f"✅ [{done}/{len(urls)}] {hackathon_name}: {count} participants{scraped_note} "
+                          f"in {seconds:.1f}s -> {result_file} (elapsed {time.perf_counter() - start:.1f}s)")
+    finally:
+        # Mark the end of the stream even if scraping was interrupted, so a following upload stops
+        if stream is not None:
+            mux.close()
+            stream.close()
+        if manager is not None:
+            manager.shutdown()
+
+    elapsed = time.perf_counter() - start
+
+    # Save combined results (both formats are read by upload_to_mongodb.py)
+    if stream is None:
+        write_json(args.output, results)
 
     print("\n" + "=" * 70)
     print("📊 Summary:")
-    for hackathon, participants in results.items():
-        print(f"  {hackathon}: {len(participants)} participants")
+    for hackathon, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        status = f"{counts[hackathon]} participants" if hackathon in counts else f"failed ({failures[hackathon]})"
+        print(f"  {hackathon}: {status} in {seconds:.1f}s")
+    print(f"\n⏱️  {elapsed:.1f}s wall time for {sum(timings.values()):.1f}s of scraping")
 
-    print(f"\n✅ Data saved to {output_file}")
+    print(f"\n✅ Data saved to {args.output}")
 
     # Print sample
-    for hackathon, participants in results.items():
-        if participants:
-            print(f"\n📝 Sample participant from {hackathon}:")
-            print(json.dumps(participants[0], indent=2))
-            break
+    if sample is not None:
+        print(f"\n📝 Sample participant from {sample[0]}:")
+        print(json.dumps(sample[1], indent=2))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from typing import Callable
+
+# Resolves as soon as a MutationObserver sees the card count pass `previous`, or
+# after `timeoutMs` with whatever is on the page then. Counts include cards already
+# pruned from the DOM by dom_extractor.drain_cards.
+# Returns [card count, body height, time waited in ms].
+_WAIT_FOR_CARDS_JS = """
+const className = arguments[0], previous = arguments[1], timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const cards = document.getElementsByClassName(className);
+const total = () => (window.__matchaPruned || 0) + cards.length;
+const start = performance.now();
+let observer = null, timer = null;
+const finish = () => {
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done([total(), document.body.scrollHeight, performance.now() - start]);
+};
+if (total() > previous) { finish(); return; }
+observer = new MutationObserver(() => { if (total() > previous) finish(); });
+observer.observe(document.body, {childList: true, subtree: true});
+timer = setTimeout(finish, timeoutMs);
+"""
+
+_PAGE_STATE_JS = """
+return [(window.__matchaPruned || 0) + document.getElementsByClassName(arguments[0]).length,
+        document.body.scrollHeight];
+"""
+
+_INITIAL_LOAD_JS = """
+return document.readyState === 'complete' && (
+    document.getElementsByClassName(arguments[0]).length > 0 ||
+    document.body.innerText.indexOf('Please log in') !== -1
+);
+"""
+
+
+def wait_for_initial_cards(driver, card_class: str = 'participant', timeout: float = 10.0) -> bool:
+    """
+    Wait until the first cards (or the login wall) have rendered instead of sleeping
+    a fixed time after navigation. Returns False if neither appeared in time.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(_INITIAL_LOAD_JS, card_class)
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def scroll_to_end(driver, card_class: str = 'participant', progress: Callable[[int], None] = None,
+                  on_new_cards: Callable[[], None] = None, should_stop: Callable[[], bool] = None,
+                  min_wait: float = 0.75, max_wait: float = 8.0, idle_rounds: int = 2) -> int:
+    """
+    Scroll an infinite-scroll listing until no more cards load.
+
+    Each step scrolls to the bottom and waits on a MutationObserver for new cards, so
+    it returns as soon as they land. The wait budget adapts: after a step that loaded
+    cards it is a few times the observed load time (at least `min_wait`), and every
+    step that loads nothing doubles it (up to `max_wait`). Loading is considered done
+    after `idle_rounds` consecutive steps in which neither the card count nor the page
+    height changed, or twice that many steps without new cards.
+
+    Args:
+        driver: Selenium WebDriver on the listing page
+        card_class: CSS class of one card
+        progress: Called with the card count after each step; exceptions it raises abort
+        on_new_cards: Called after each step that loaded cards, e.g. to extract and prune them
+        should_stop: Checked after each step; returning True ends scrolling early
+        min_wait: Lower bound on a step's wait, in seconds
+        max_wait: Upper bound on a step's wait, in seconds
+        idle_rounds: Consecutive unchanged steps before stopping
+
+    Returns:
+        Number of cards on the page
+    """
+    count, height = driver.execute_script(_PAGE_STATE_JS, card_class)
+    wait_seconds = min_wait
+    idle = 0
+    without_cards = 0
+    driver.set_script_timeout(max_wait + 5)
+
+    while idle < idle_rounds and without_cards < 2 * idle_rounds:
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        new_count, new_height, waited_ms = driver.execute_async_script(
+            _WAIT_FOR_CARDS_JS, card_class, count, int(wait_seconds * 1000)
+        )
+
+        grew = new_count > count
+        if grew:
+            print(f"Found {new_count} participants so far ({waited_ms / 1000:.2f}s)...")
+            idle = without_cards = 0
+            wait_seconds = min(max_wait, max(min_wait, 3 * waited_ms / 1000))
+        else:
+            # A height change means something is still rendering (e.g. a spinner)
+            idle = 0 if new_height != height else idle + 1
+            without_cards += 1
+            wait_seconds = min(max_wait, wait_seconds * 2)
+            print(f"No new participants found (attempt {idle}/{idle_rounds})")
+
+        count, height = max(count, new_count), new_height
+        if on_new_cards is not None and grew:
+            on_new_cards()
+            # Pruning cards shrinks the page; measure from the new height
+            height = driver.execute_script(_PAGE_STATE_JS, card_class)[1]
+        if progress is not None:
+            progress(count)
+        if should_stop is not None and should_stop():
+            print(f"Stopping early at {count} participants")
+            break
+
+    return count
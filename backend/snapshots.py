@@ -0,0 +1,223 @@
+from pymongo import ReturnDocument
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Tuple
+from ingest import ensure_indexes, ensure_lookup_index, sync_hackathon
+from hackathon_stats import HackathonStatsStore
+import re
+import threading
+import time
+
+
+class HackathonSnapshots:
+    """
+    Versioned per-hackathon participant collections behind an atomic read pointer.
+
+    Each ingest builds a new snapshot collection (seeded from the current data, synced
+    with the fresh scrape and indexed) and only then flips the hackathon's pointer
+    document to it in a single update. Readers resolve the pointer, so they never see
+    an empty or half-written hackathon, and a failed ingest leaves the old snapshot
+    serving. Retired snapshots are dropped after a grace period so requests that
+    resolved the old pointer can finish, and snapshot collections that never went
+    live (the process died mid-ingest) are swept once they are old enough that no
+    ingest can still be building them.
+
+    Hackathons without a pointer (data loaded before snapshots existed) are read from
+    the base collection.
+    """
+
+    def __init__(self, db, base_collection_name: str = 'participants',
+                 pointer_collection_name: str = 'hackathon_snapshots',
+                 retire_grace_seconds: int = 300, pointer_cache_seconds: float = 2.0,
+                 stats_collection_name: str = 'hackathon_stats', staging_grace_seconds: int = 3600):
+        """
+        Args:
+            db: pymongo database holding the participant collections
+            base_collection_name: Legacy single participants collection
+            pointer_collection_name: Collection of {_id: hackathon, collection: name, version: n}
+                pointers (legacy hackathons changed by apply_delta have a version only)
+            retire_grace_seconds: How long a replaced snapshot stays readable before it is dropped
+            pointer_cache_seconds: How long pointer lookups are cached in-process
+            stats_collection_name: Collection of per-hackathon stats refreshed on every ingest
+            staging_grace_seconds: Age after which a snapshot that was never published is
+                treated as abandoned and dropped (keep it above the longest ingest)
+        """
+        self.db = db
+        self.base_collection_name = base_collection_name
+        self.base = db[base_collection_name]
+        self.pointers = db[pointer_collection_name]
+        self.retire_grace_seconds = retire_grace_seconds
+        self.staging_grace_seconds = staging_grace_seconds
+        self.pointer_cache_seconds = pointer_cache_seconds
+        self._pointer_cache = {}
+        self._lock = threading.Lock()
+        self.stats = HackathonStatsStore(db, stats_collection_name)
+
+    def _snapshot_name(self, hackathon: str) -> str:
+        safe_name = re.sub(r'[^A-Za-z0-9_-]', '_', hackathon)
+        return f"{self.base_collection_name}__{safe_name}__{int(time.time() * 1000)}"
+
+    def _pointer(self, hackathon: str) -> Tuple[str, int]:
+        """(active collection name, data version) of a hackathon"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._pointer_cache.get(hackathon)
+            if cached and cached[0] > now:
+                return cached[1], cached[2]
+
+        pointer = self.pointers.find_one({'_id': hackathon}, {'collection': 1, 'version': 1})
+        # A pointer without a collection only versions a legacy hackathon (see apply_delta)
+        name = (pointer or {}).get('collection') or self.base_collection_name
+        version = pointer.get('version', 0) if pointer else 0
+
+        with self._lock:
+            self._pointer_cache[hackathon] = (now + self.pointer_cache_seconds, name, version)
+        return name, version
+
+    def _active_name(self, hackathon: str) -> str:
+        return self._pointer(hackathon)[0]
+
+    def collection_for(self, hackathon: str):
+        """Collection currently serving reads for a hackathon"""
+        return self.db[self._active_name(hackathon)]
+
+    def version_of(self, hackathon: str) -> int:
+        """Counter bumped on every ingest of the hackathon (0 for legacy data), for derived data"""
+        return self._pointer(hackathon)[1]
+
+    def active_collections(self) -> Dict[str, object]:
+        """Hackathon -> active snapshot collection, for every published hackathon"""
+        return {doc['_id']: self.db[doc['collection']]
+                for doc in self.pointers.find({'collection': {'$exists': True}}, {'collection': 1})}
+
+    def all_collections(self) -> List:
+        """Every collection currently serving reads (active snapshots plus the base collection)"""
+        return list(self.active_collections().values()) + [self.base]
+
+    def publish(self, hackathon: str, participants: Iterable[Dict], collect_changes: bool = True,
+                extra_indexes: Iterable = (), **load_options) -> Dict:
+        """
+        Build a new snapshot for the hackathon from a fresh scrape and switch reads to it.
+        `participants` may be a generator; if it raises, the snapshot is dropped and
+        reads stay on the previous one.
+
+        Only the lookup index the upserts need exists while the snapshot is loaded; the
+        other indexes (plus `extra_indexes`) are built once the data is in, before the
+        snapshot goes live. `load_options` (batch_size, workers, max_retries, report)
+        are passed to sync_hackathon.
+
+        Returns the sync_hackathon counts relative to the previously served data.
+        """
+        name = self._snapshot_name(hackathon)
+        staging = self.db[name]
+        source = self.collection_for(hackathon)
+
+        try:
+            # Seed server-side with the current data so the sync stays incremental
+            source.aggregate([{'$match': {'hackathon': hackathon}}, {'$project': {'_id': 0}}, {'$out': name}])
+            ensure_lookup_index(staging)
+            counts = sync_hackathon(staging, hackathon, participants, collect_changes=collect_changes,
+                                    **load_options)
+            ensure_indexes(staging)
+            for index in extra_indexes:
+                staging.create_index(index)
+        except Exception:
+            staging.drop()
+            raise
+
+        self._switch(hackathon, name)
+
+        # Legacy rows in the base collection are now shadowed by the snapshot
+        if source.name == self.base_collection_name:
+            self.base.delete_many({'hackathon': hackathon})
+
+        self._refresh_stats(hackathon, staging)
+
+        self.collect_garbage()
+        return counts
+
+    def apply_delta(self, hackathon: str, participants: Iterable[Dict]) -> Dict:
+        """
+        Upsert new and changed participants into the snapshot currently serving the
+        hackathon, without building a new snapshot or removing anyone. Meant for
+        partial scrapes; each write is a single-document upsert, so readers never see
+        the hackathon half-empty.
+        """
+        collection = self.collection_for(hackathon)
+        counts = sync_hackathon(collection, hackathon, participants, remove_missing=False)
+        if counts['inserted'] or counts['updated']:
+            # Upserted so legacy hackathons (no pointer yet) get a version too; without a
+            # collection the pointer still resolves to the base collection
+            self.pointers.update_one({'_id': hackathon}, {'$inc': {'version': 1}}, upsert=True)
+            with self._lock:
+                self._pointer_cache.pop(hackathon, None)
+        self._refresh_stats(hackathon, collection)
+        return counts
+
+    def _refresh_stats(self, hackathon: str, collection):
+        """Rematerialize a hackathon's stats after an ingest; the data is stored either way"""
+        try:
+            self.stats.refresh(hackathon, collection)
+        except Exception as e:
+            print(f"⚠️  Could not refresh stats for {hackathon}: {e}")
+            self.stats.bump_version()
+
+    def sources(self) -> List:
+        """(hackathon, collection) for every hackathon with data, published or legacy"""
+        active = self.active_collections()
+        legacy = [(h, self.base) for h in self.base.distinct('hackathon') if h and h not in active]
+        return list(active.items()) + legacy
+
+    def _switch(self, hackathon: str, name: str):
+        """Atomically point reads at the new snapshot and retire the old one"""
+        now = datetime.now(timezone.utc)
+        previous = self.pointers.find_one_and_update(
+            {'_id': hackathon},
+            {'$set': {'collection': name, 'updated_at': now}, '$inc': {'version': 1}},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
+        )
+        if previous and previous.get('collection'):
+            self.pointers.update_one(
+                {'_id': hackathon},
+                {'$push': {'retired': {'collection': previous['collection'], 'retired_at': now}}}
+            )
+
+        with self._lock:
+            self._pointer_cache.pop(hackathon, None)
+        print(f"🔀 {hackathon} now served from {name}")
+
+    def collect_garbage(self):
+        """
+        Drop snapshots retired longer ago than the grace period, and snapshot
+        collections older than the staging grace period that are neither active nor
+        retired (left behind by an ingest that died before switching to them).
+        """
+        # Listed before the pointers are read, so a snapshot published meanwhile is known
+        snapshot_names = [name for name in self.db.list_collection_names()
+                          if name.startswith(f"{self.base_collection_name}__")]
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.retire_grace_seconds)
+        known = set()
+        for pointer in self.pointers.find({}, {'collection': 1, 'retired': 1}):
+            known.add(pointer.get('collection'))
+            known.update(retired['collection'] for retired in pointer.get('retired', []))
+        for pointer in self.pointers.find({'retired.0': {'$exists': True}}):
+            for retired in pointer['retired']:
+                retired_at = retired['retired_at']
+                if retired_at.tzinfo is None:
+                    retired_at = retired_at.replace(tzinfo=timezone.utc)
+                if retired_at >= cutoff or retired['collection'] == pointer.get('collection'):
+                    continue
+                self.db.drop_collection(retired['collection'])
+                self.pointers.update_one(
+                    {'_id': pointer['_id']},
+                    {'$pull': {'retired': {'collection': retired['collection']}}}
+                )
+                print(f"🗑️  Dropped retired snapshot {retired['collection']}")
+
+        staging_cutoff = (time.time() - self.staging_grace_seconds) * 1000
+        for name in snapshot_names:
+            created_ms = re.search(r'__(\d+)$', name)
+            if name in known or not created_ms or int(created_ms.group(1)) >= staging_cutoff:
+                continue
+            self.db.drop_collection(name)
+            print(f"🗑️  Dropped orphaned snapshot {name}")
@@ -1,26 +1,82 @@
 import google.generativeai as genai
 from pymongo import MongoClient
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
+from match_cache import MatchScoreCache, fingerprint
+from neighbor_index import NeighborStore
+from participant_index import ParticipantIndexRegistry
+from scoring_engine import DEFAULT_QUICK_SCORE_WEIGHTS
+from snapshots import HackathonSnapshots
 import json
-from typing import List, Dict
+import time
 import os
 
 class TeammateMatcher:
     """Use Gemini AI to find compatible teammates based on participant data"""
 
-    def __init__(self, api_key: str, mongodb_uri: str):
+    # Participant fields needed to build prompts and match records
+    CANDIDATE_FIELDS = ('participant_id', 'name', 'role', 'profile_url', 'skills',
+                        'interests', 'stats', 'photo_url')
+
+    # Common tech keywords recognised by the search query prefilter
+    COMMON_KEYWORDS = ['python', 'javascript', 'java', 'react', 'node', 'typescript', 'go', 'rust',
+                       'machine learning', 'ml', 'ai', 'data science', 'backend', 'frontend',
+                       'fullstack', 'full stack', 'mobile', 'ios', 'android', 'flutter', 'web',
+                       'blockchain', 'solidity', 'ethereum', 'web3', 'docker', 'kubernetes',
+                       'aws', 'cloud', 'devops', 'database', 'sql', 'mongodb', 'postgres',
+                       'ui/ux', 'design', 'figma', 'css', 'tailwind', 'django', 'flask',
+                       'express', 'nestjs', 'graphql', 'rest', 'api']
+
+    def __init__(self, api_key: str, mongodb_uri: str = None, client: MongoClient = None,
+                 database_name: str = 'devpost_data', collection_name: str = 'participants',
+                 max_concurrent_batches: int = 4, batch_timeout: float = 60.0,
+                 cache: MatchScoreCache = None, index_registry: ParticipantIndexRegistry = None,
+                 quick_score_weights: Dict = None, semantic_candidates: int = 30,
+                 snapshots: HackathonSnapshots = None, neighbor_store: NeighborStore = None):
         """
         Initialize the matcher with Gemini API and MongoDB connection.
 
         Args:
             api_key: Google Gemini API key
-            mongodb_uri: MongoDB connection string
+            mongodb_uri: MongoDB connection string (used only when no client is given)
+            client: Shared MongoClient to reuse instead of opening a new one
+            database_name: Name of the database to read participants from
+            collection_name: Name of the participants collection
+            max_concurrent_batches: Maximum Gemini batch requests in flight at once
+            batch_timeout: Seconds to wait for a batch before using fallback scoring
+            cache: Score cache shared across requests (defaults to an in-memory LRU)
+            index_registry: Per-hackathon inverted indexes used by the prefilters
+                (None = prefilter with MongoDB queries instead)
+            quick_score_weights: Weights for complementary_skills, shared_interests and
+                projects in the find_teammates prefilter
+            semantic_candidates: Candidates sent to Gemini when the search query prefilter
+                can rank by profile similarity (one batch by default)
+            snapshots: Resolves the collection currently serving each hackathon
+                (None = read everything from the participants collection)
+            neighbor_store: Top-K neighbors precomputed after each ingest; when they are
+                current they replace the live quick-score prefilter (needs snapshots)
         """
         genai.configure(api_key=api_key)
         # Use the latest Gemini model
         self.model = genai.GenerativeModel('gemini-2.5-flash')
-        self.client = MongoClient(mongodb_uri)
-        self.db = self.client['devpost_data']
-        self.collection = self.db['participants']
+        # Only close the client on close() if we opened it ourselves
+        self._owns_client = client is None
+        self.client = client if client is not None else MongoClient(mongodb_uri)
+        self.db = self.client[database_name]
+        self.collection = self.db[collection_name]
+        # Shared across requests so the cap bounds total in-flight Gemini calls
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self.batch_timeout = batch_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_batches,
+            thread_name_prefix='gemini-batch'
+        )
+        self.cache = cache if cache is not None else MatchScoreCache()
+        self.index_registry = index_registry
+        self.quick_score_weights = {**DEFAULT_QUICK_SCORE_WEIGHTS, **(quick_score_weights or {})}
+        self.semantic_candidates = semantic_candidates
+        self.snapshots = snapshots
+        self.neighbor_store = neighbor_store
 
     def find_teammates_with_query(self, current_user_id: str, hackathon: str, search_query: str, top_n: int = 5) -> List[Dict]:
         """
@@ -35,74 +91,84 @@ class TeammateMatcher:
         Returns:
             List of matched participants with match scores and reasons
         """
-        # Get current user data
-        current_user = self.collection.find_one({
-            'participant_id': current_user_id,
-            'hackathon': hackathon
-        })
+        return self._collect(self.stream_teammates_with_query(current_user_id, hackathon, search_query, top_n))
 
-        if not current_user:
-            raise ValueError(f"User with ID {current_user_id} not found in {hackathon}")
-
-        # Get all other participants from the same hackathon
-        all_participants = list(self.collection.find({
-            'hackathon': hackathon,
-            'participant_id': {'$ne': current_user_id}
-        }))
+    def find_teammates(self, current_user_id: str, hackathon: str, top_n: int = 5) -> List[Dict]:
+        """
+        Find the best teammates for a user using Gemini AI.
 
-        if not all_participants:
-            return []
+        Args:
+            current_user_id: Participant ID of the current user
+            hackathon: Hackathon name to search within
+            top_n: Number of top matches to return
 
-        print(f"Total participants to analyze: {len(all_participants)}")
-        print(f"Custom search query: {search_query}")
+        Returns:
+            List of matched participants with match scores and reasons
+        """
+        return self._collect(self.stream_teammates(current_user_id, hackathon, top_n))
 
-        # PRE-FILTER: Use basic keyword matching to reduce candidates
-        # Extract keywords from search query and filter participants
-        max_candidates = 50  # Limit to 50 best candidates before AI analysis
+    def stream_teammates_with_query(self, current_user_id: str, hackathon: str, search_query: str,
+                                    top_n: int = 5) -> Iterator[Dict]:
+        """
+        Incremental version of find_teammates_with_query.
 
-        if len(all_participants) > max_candidates:
-            print(f"Pre-filtering from {len(all_participants)} to {max_candidates} candidates...")
-            filtered_participants = self._prefilter_by_query(all_participants, search_query, max_candidates)
-        else:
-            filtered_participants = all_participants
+        Yields a 'start' event, a 'matches' event for cached results and for each
+        Gemini batch as soon as it completes, then a 'done' event carrying the
+        deduplicated, sorted top N.
+        """
+        current_user = self._get_current_user(current_user_id, hackathon)
+        print(f"Custom search query: {search_query}")
 
+        filtered_participants = self._select_query_candidates(current_user, hackathon, search_query)
         print(f"Analyzing {len(filtered_participants)} candidates with AI...")
 
         # Prepare data for Gemini
-        current_user_profile = self._format_profile(current_user)
+        current_user_profile = self.format_profile(current_user)
 
         # Process in ONE batch if possible (faster), or two batches max
-        batch_size = 30  # Increased batch size for fewer API calls
-        all_matches = []
-
-        total_batches = (len(filtered_participants) + batch_size - 1) // batch_size
-        for i in range(0, len(filtered_participants), batch_size):
-            batch_num = (i // batch_size) + 1
-            print(f"Processing batch {batch_num}/{total_batches}...")
-            batch = filtered_participants[i:i+batch_size]
-            matches = self._analyze_batch_with_query(current_user_profile, batch, search_query)
-            all_matches.extend(matches)
+        yield from self._stream_matches(
+            lambda batch: self._analyze_batch_with_query(current_user_profile, batch, search_query),
+            current_user_profile, filtered_participants, search_query,
+            batch_size=30,  # Increased batch size for fewer API calls
+            top_n=top_n
+        )
 
-        # Sort by match score and return top N
-        all_matches.sort(key=lambda x: x['match_score'], reverse=True)
+    def stream_teammates(self, current_user_id: str, hackathon: str, top_n: int = 5) -> Iterator[Dict]:
+        """
+        Incremental version of find_teammates; yields the same events as
+        stream_teammates_with_query.
+        """
+        current_user = self._get_current_user(current_user_id, hackathon)
 
-        print(f"Returning top {top_n} matches")
-        return all_matches[:top_n]
+        all_participants = self._select_candidates(current_user, hackathon)
+        print(f"Selected {len(all_participants)} top candidates for AI analysis")
 
-    def find_teammates(self, current_user_id: str, hackathon: str, top_n: int = 5) -> List[Dict]:
-        """
-        Find the best teammates for a user using Gemini AI.
+        # Prepare data for Gemini
+        current_user_profile = self.format_profile(current_user)
 
-        Args:
-            current_user_id: Participant ID of the current user
-            hackathon: Hackathon name to search within
-            top_n: Number of top matches to return
+        # Analyze in batches to avoid token limits
+        yield from self._stream_matches(
+            lambda batch: self._analyze_batch(current_user_profile, batch),
+            current_user_profile, all_participants, None,
+            batch_size=20,
+            top_n=top_n
+        )
 
-        Returns:
-            List of matched participants with match scores and reasons
-        """
-        # Get current user data
-        current_user = self.collection.find_one({
+    def collection_for(self, hackathon: str):
+        """Collection holding the hackathon's participants"""
+        if self.snapshots is not None:
+            return self.snapshots.collection_for(hackathon)
+        return self.collection
+
+    def _index_for(self, hackathon: str):
+        """In-memory index of the hackathon, kept current with its data version"""
+        if self.index_registry is None:
+            return None
+        version = self.snapshots.version_of(hackathon) if self.snapshots is not None else None
+        return self.index_registry.get(hackathon, self.collection_for(hackathon), version)
+
+    def _get_current_user(self, current_user_id: str, hackathon: str) -> Dict:
+        current_user = self.collection_for(hackathon).find_one({
             'participant_id': current_user_id,
             'hackathon': hackathon
         })
@@ -110,63 +176,96 @@ class TeammateMatcher:
         if not current_user:
             raise ValueError(f"User with ID {current_user_id} not found in {hackathon}")
 
+        return current_user
+
+    def _select_candidates(self, current_user: Dict, hackathon: str) -> List[Dict]:
+        """Quick-score prefilter: the top candidates for find_teammates"""
+        # Only the top candidates (trimmed to the fields we use) cross the wire
+        max_candidates_for_ai = 50
+        if self.neighbor_store is not None and self.snapshots is not None:
+            top_ids = self.neighbor_store.lookup(
+                hackathon, current_user['participant_id'], self.snapshots.version_of(hackathon),
+                self.quick_score_weights, max_candidates_for_ai
+            )
+            if top_ids is not None:
+                return self._fetch_candidates(hackathon, top_ids)
+
+        index = self._index_for(hackathon)
+        if index is not None:
+            top_ids = index.top_by_quick_score(current_user, max_candidates_for_ai, self.quick_score_weights)
+            return self._fetch_candidates(hackathon, top_ids)
+
+        return list(self.collection_for(hackathon).aggregate(
+            self._quick_score_pipeline(current_user, hackathon, max_candidates_for_ai)
+        ))
+
+    def _select_query_candidates(self, current_user: Dict, hackathon: str, search_query: str) -> List[Dict]:
+        """Search query prefilter: the top candidates for find_teammates_with_query"""
+        current_user_id = current_user.get('participant_id')
+        max_candidates = 50  # Limit to 50 best candidates before AI analysis
+
+        index = self._index_for(hackathon)
+        if index is not None:
+            # Rank by TF-IDF similarity to the query; semantic ranking is sharper than keyword
+            # counts, so fewer candidates (and Gemini batches) are needed
+            top_ids = index.top_by_similarity(search_query, current_user_id, self.semantic_candidates)
+            limit = self.semantic_candidates if index.vectors is not None else max_candidates
+            if len(top_ids) < limit:
+                # Top up with posting-list keyword ranking when few profiles are similar
+                selected = set(top_ids)
+                keyword_ids = index.top_by_query(search_query, self.COMMON_KEYWORDS, current_user_id, limit)
+                top_ids += [pid for pid in keyword_ids if pid not in selected][:limit - len(top_ids)]
+            return self._fetch_candidates(hackathon, top_ids)
+
         # Get all other participants from the same hackathon
-        all_participants = list(self.collection.find({
+        all_participants = list(self.collection_for(hackathon).find({
             'hackathon': hackathon,
             'participant_id': {'$ne': current_user_id}
         }))
-
-        if not all_participants:
-            return []
-
         print(f"Total participants to analyze: {len(all_participants)}")
 
-        # PRE-FILTER: Quick scoring to reduce candidates before AI analysis
-        # Only send top 50 candidates to AI for detailed analysis
-        max_candidates_for_ai = 50
-
-        if len(all_participants) > max_candidates_for_ai:
-            print(f"Pre-filtering from {len(all_participants)} to {max_candidates_for_ai} candidates...")
-            # Quick score based on skills, interests, and projects
-            scored_participants = []
-            current_skills = set(current_user.get('skills', []))
-            current_interests = set(current_user.get('interests', []))
-
-            for participant in all_participants:
-                p_skills = set(participant.get('skills', []))
-                p_interests = set(participant.get('interests', []))
-                p_projects = participant.get('stats', {}).get('projects', 0)
-
-                # Score: complementary skills + shared interests + experience
-                complementary_skills = len(p_skills - current_skills)  # Different skills
-                shared_interests = len(p_interests & current_interests)  # Common interests
-                quick_score = (complementary_skills * 5) + (shared_interests * 10) + (p_projects * 2)
-
-                scored_participants.append((quick_score, participant))
-
-            # Sort by quick score and take top candidates
-            scored_participants.sort(reverse=True, key=lambda x: x[0])
-            all_participants = [p for _, p in scored_participants[:max_candidates_for_ai]]
-            print(f"Reduced to {len(all_participants)} top candidates for AI analysis")
-
-        # Prepare data for Gemini
-        current_user_profile = self._format_profile(current_user)
-
-        # Analyze in batches to avoid token limits
-        batch_size = 20
-        all_matches = []
-
-        total_batches = (len(all_participants) + batch_size - 1) // batch_size
-        for i in range(0, len(all_participants), batch_size):
-            batch_num = (i // batch_size) + 1
-            print(f"Processing batch {batch_num}/{total_batches}...")
-            batch = all_participants[i:i+batch_size]
-            matches = self._analyze_batch(current_user_profile, batch)
-            all_matches.extend(matches)
-
-        # Deduplicate matches by participant_id (keep highest score for each person)
+        if len(all_participants) > max_candidates:
+            print(f"Pre-filtering from {len(all_participants)} to {max_candidates} candidates...")
+            return self._prefilter_by_query(all_participants, search_query, max_candidates)
+        return all_participants
+
+    def _stream_matches(self, analyze: Callable[[List[Dict]], List[Dict]], current_user_profile: str,
+                        candidates: List[Dict], search_query: Optional[str], batch_size: int,
+                        top_n: int) -> Iterator[Dict]:
+        """Serve cached scores, fan the rest out to Gemini and yield events as batches land"""
+        cached_matches, uncached = self._split_cached(current_user_profile, candidates, search_query)
+        batches = [uncached[i:i+batch_size] for i in range(0, len(uncached), batch_size)]
+
+        yield {
+            'event': 'start',
+            'candidates': len(candidates),
+            'cached': len(cached_matches),
+            'total_batches': len(batches)
+        }
+
+        if cached_matches:
+            yield {'event': 'matches', 'source': 'cache', 'matches': self._rank_matches(cached_matches, top_n)}
+
+        # Keep batch order for the final merge so ties rank the same however batches finish
+        batch_results = [[] for _ in batches]
+        for completed, (batch_index, matches) in enumerate(self._iter_batches(analyze, batches), 1):
+            batch_results[batch_index] = matches
+            yield {
+                'event': 'matches',
+                'source': 'ai',
+                'batch': batch_index + 1,
+                'completed_batches': completed,
+                'total_batches': len(batches),
+                'matches': self._rank_matches(matches, top_n)
+            }
+
+        all_matches = cached_matches + [match for matches in batch_results for match in matches]
+        yield {'event': 'done', 'matches': self._rank_matches(all_matches, top_n)}
+
+    def _rank_matches(self, matches: List[Dict], top_n: int) -> List[Dict]:
+        """Deduplicate by participant_id (keeping the highest score) and return the top N"""
         seen_ids = {}
-        for match in all_matches:
+        for match in matches:
             participant_id = match.get('participant_id')
             if participant_id:
                 if participant_id not in seen_ids or match['match_score'] > seen_ids[participant_id]['match_score']:
@@ -175,12 +274,166 @@ class TeammateMatcher:
         # Convert back to list and sort by match score
         deduplicated_matches = list(seen_ids.values())
         deduplicated_matches.sort(key=lambda x: x['match_score'], reverse=True)
-
-        print(f"Total matches after deduplication: {len(deduplicated_matches)}")
-        print(f"Returning top {top_n} matches")
         return deduplicated_matches[:top_n]
 
-    def _format_profile(self, participant: Dict) -> str:
+    @staticmethod
+    def _collect(events: Iterator[Dict]) -> List[Dict]:
+        """Drain a match stream and return the final ranked matches"""
+        matches = []
+        for event in events:
+            if event['event'] == 'done':
+                matches = event['matches']
+        print(f"Returning top {len(matches)} matches")
+        return matches
+
+    def _fetch_candidates(self, hackathon: str, participant_ids: List[str]) -> List[Dict]:
+        """Load the given participants (trimmed to CANDIDATE_FIELDS) in the given order"""
+        if not participant_ids:
+            return []
+        projection = {'_id': 0, **{field: 1 for field in self.CANDIDATE_FIELDS}}
+        docs = self.collection_for(hackathon).find({'hackathon': hackathon, 'participant_id': {'$in': participant_ids}}, projection)
+        by_id = {doc['participant_id']: doc for doc in docs}
+        return [by_id[pid] for pid in participant_ids if pid in by_id]
+
+    def _quick_score_pipeline(self, current_user: Dict, hackathon: str, limit: int) -> List[Dict]:
+        """
+        Aggregation computing the prefilter score server-side:
+        complementary skills * 5 + shared interests * 10 + projects * 2 (by default)
+        """
+        weights = self.quick_score_weights
+        current_skills = list(set(current_user.get('skills', [])))
+        current_interests = list(set(current_user.get('interests', [])))
+
+        return [
+            {'$match': {
+                'hackathon': hackathon,
+                'participant_id': {'$ne': current_user.get('participant_id')}
+            }},
+            {'$project': {
+                '_id': 0,
+                **{field: 1 for field in self.CANDIDATE_FIELDS},
+                'quick_score': {'$add': [
+                    {'$multiply': [{'$size': {'$setDifference': [{'$ifNull': ['$skills', []]}, current_skills]}},
+                                   weights['complementary_skills']]},
+                    {'$multiply': [{'$size': {'$setIntersection': [{'$ifNull': ['$interests', []]}, current_interests]}},
+                                   weights['shared_interests']]},
+                    {'$multiply': [{'$ifNull': ['$stats.projects', 0]}, weights['projects']]}
+                ]}
+            }},
+            {'$sort': {'quick_score': -1, 'participant_id': 1}},
+            {'$limit': limit},
+            {'$unset': 'quick_score'}
+        ]
+
+    def _iter_batches(self, analyze: Callable[[List[Dict]], List[Dict]],
+                      batches: List[List[Dict]]) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        Dispatch all batches to the executor at once and yield (batch index, matches)
+        in completion order.
+
+        Batches that run longer than batch_timeout fall back to local scoring so one
+        slow Gemini call cannot stall the whole request.
+        """
+        if not batches:
+            return
+
+        total_batches = len(batches)
+        print(f"Dispatching {total_batches} batch(es) with concurrency {self.max_concurrent_batches}...")
+        start = time.perf_counter()
+        for index, matches in self._iter_completed(analyze, batches):
+            if matches is None:
+                print(f"Batch {index + 1}/{total_batches} timed out, using fallback scoring")
+                matches = self._fallback_scoring(batches[index])
+            else:
+                print(f"Batch {index + 1}/{total_batches} finished ({len(matches)} matches)")
+            yield index, matches
+
+        print(f"All batches finished in {time.perf_counter() - start:.2f}s")
+
+    def _iter_completed(self, function: Callable, items: List) -> Iterator[Tuple[int, Optional[object]]]:
+        """
+        Run function(item) for every item on the shared executor and yield (index,
+        result) in completion order, with None for calls that ran past batch_timeout.
+
+        Each call's clock starts when a worker picks it up, not when it is queued:
+        the executor is shared by all requests, so time spent waiting behind other
+        users' batches does not count against this request.
+        """
+        started: Dict[int, float] = {}
+
+        def run(index: int, item):
+            started[index] = time.perf_counter()
+            return function(item)
+
+        futures = {self._executor.submit(run, index, item): index for index, item in enumerate(items)}
+        pending = set(futures)
+        try:
+            while pending:
+                running = [started[futures[f]] for f in pending if futures[f] in started]
+                timeout = (max(0.0, min(running) + self.batch_timeout - time.perf_counter())
+                           if running else self.batch_timeout)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    yield futures[future], future.result()
+
+                now = time.perf_counter()
+                for future in [f for f in pending
+                               if futures[f] in started and now - started[futures[f]] >= self.batch_timeout]:
+                    pending.discard(future)
+                    yield futures[future], None
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _generate(self, prompt: str):
+        """Gemini call bounded by batch_timeout on the request itself"""
+        return self.model.generate_content(prompt, request_options={'timeout': self.batch_timeout})
+
+    def _cache_key(self, current_user_profile: str, candidate: Dict, search_query: Optional[str]) -> str:
+        """Cache key from the exact profile texts and query the model would see"""
+        query_text = f"query:{search_query.strip().lower()}" if search_query else "complementary"
+        return MatchScoreCache.make_key(
+            fingerprint(current_user_profile),
+            fingerprint(self.format_profile(candidate)),
+            fingerprint(query_text)
+        )
+
+    def _split_cached(self, current_user_profile: str, candidates: List[Dict],
+                      search_query: Optional[str]) -> Tuple[List[Dict], List[Dict]]:
+        """Return (matches served from cache, candidates that still need the model)"""
+        keys = [self._cache_key(current_user_profile, c, search_query) for c in candidates]
+        cached = self.cache.get_many(keys)
+
+        cached_matches = []
+        uncached = []
+        for key, candidate in zip(keys, candidates):
+            if key in cached:
+                score, reason = cached[key]
+                cached_matches.append(self._build_match(candidate, score, reason))
+            else:
+                uncached.append(candidate)
+
+        print(f"Score cache: {len(cached_matches)} hit(s), {len(uncached)} candidate(s) need AI analysis")
+        return cached_matches, uncached
+
+    def _build_match(self, candidate: Dict, match_score: int, match_reason: str) -> Dict:
+        """Public match record returned to the API for a scored candidate"""
+        return {
+            'participant_id': candidate.get('participant_id'),
+            'name': candidate.get('name'),
+            'role': candidate.get('role'),
+            'profile_url': candidate.get('profile_url'),
+            'skills': candidate.get('skills', []),
+            'interests': candidate.get('interests', []),
+            'stats': candidate.get('stats', {}),
+            'photo_url': candidate.get('photo_url'),
+            'match_score': match_score,
+            'match_reason': match_reason
+        }
+
+    @staticmethod
+    def format_profile(participant: Dict) -> str:
         """Format participant data into a readable profile"""
         profile = f"Name: {participant.get('name', 'Unknown')}\n"
         profile += f"Role: {participant.get('role', 'Not specified')}\n"
@@ -206,15 +459,6 @@ class TeammateMatcher:
         """
         query_lower = search_query.lower()
 
-        # Extract common tech keywords
-        common_keywords = ['python', 'javascript', 'java', 'react', 'node', 'typescript', 'go', 'rust',
-                          'machine learning', 'ml', 'ai', 'data science', 'backend', 'frontend',
-                          'fullstack', 'full stack', 'mobile', 'ios', 'android', 'flutter', 'web',
-                          'blockchain', 'solidity', 'ethereum', 'web3', 'docker', 'kubernetes',
-                          'aws', 'cloud', 'devops', 'database', 'sql', 'mongodb', 'postgres',
-                          'ui/ux', 'design', 'figma', 'css', 'tailwind', 'django', 'flask',
-                          'express', 'nestjs', 'graphql', 'rest', 'api']
-
         # Score each participant based on keyword matches
         scored_participants = []
 
@@ -229,7 +473,7 @@ class TeammateMatcher:
             searchable_text = ' '.join(skills + interests + [role]).lower()
 
             # Count keyword matches in the query
-            for keyword in common_keywords:
+            for keyword in self.COMMON_KEYWORDS:
                 if keyword in query_lower:
                     # This keyword is in the search query
                     if keyword in searchable_text:
@@ -262,7 +506,7 @@ class TeammateMatcher:
         candidates_text = ""
         for idx, candidate in enumerate(candidates):
             candidates_text += f"\n--- Candidate {idx + 1} (ID: {candidate.get('participant_id')}) ---\n"
-            candidates_text += self._format_profile(candidate)
+            candidates_text += self.format_profile(candidate)
 
         # Create prompt for Gemini with custom search query
         prompt = f"""You are a hackathon teammate matching expert. Analyze the following participant profiles based on the user's CUSTOM SEARCH CRITERIA.
@@ -301,7 +545,7 @@ Respond ONLY with a valid JSON array:
 Return ONLY the JSON array, no markdown formatting, no explanatory text before or after."""
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
 
             # Extract JSON from response
             response_text = response.text.strip()
@@ -324,6 +568,7 @@ Return ONLY the JSON array, no markdown formatting, no explanatory text before o
 
             # Enhance with full participant data
             enhanced_matches = []
+            to_cache = {}
             for match in matches:
                 candidate_id = match.get('candidate_id')
                 candidate = next((c for c in candidates if c.get('participant_id') == candidate_id), None)
@@ -335,23 +580,16 @@ Return ONLY the JSON array, no markdown formatting, no explanatory text before o
                         # Fallback reason if AI didn't provide one
                         ai_reason = f"Compatible teammate with {len(candidate.get('skills', []))} skills and {candidate.get('stats', {}).get('projects', 0)} projects."
 
-                    enhanced_match = {
-                        'participant_id': candidate.get('participant_id'),
-                        'name': candidate.get('name'),
-                        'role': candidate.get('role'),
-                        'profile_url': candidate.get('profile_url'),
-                        'skills': candidate.get('skills', []),
-                        'interests': candidate.get('interests', []),
-                        'stats': candidate.get('stats', {}),
-                        'photo_url': candidate.get('photo_url'),
-                        'match_score': match.get('match_score', 0),
-                        'match_reason': ai_reason
-                    }
+                    enhanced_match = self._build_match(candidate, match.get('match_score', 0), ai_reason)
                     enhanced_matches.append(enhanced_match)
+                    to_cache[self._cache_key(current_user_profile, candidate, search_query)] = (enhanced_match['match_score'], ai_reason)
 
                     # Debug: Print match info
                     print(f"Match: {candidate.get('name')} - Score: {match.get('match_score')} - Reason: {ai_reason[:100]}...")
 
+            # Only successful model answers are cached, never fallback scores
+            self.cache.set_many(to_cache)
+
             return enhanced_matches
 
         except Exception as e:
@@ -368,7 +606,7 @@ Return ONLY the JSON array, no markdown formatting, no explanatory text before o
         candidates_text = ""
         for idx, candidate in enumerate(candidates):
             candidates_text += f"\n--- Candidate {idx + 1} (ID: {candidate.get('participant_id')}) ---\n"
-            candidates_text += self._format_profile(candidate)
+            candidates_text += self.format_profile(candidate)
 
         # Create prompt for Gemini
         prompt = f"""You are a hackathon teammate matching expert. Analyze the following participant profiles and determine compatibility.
@@ -403,7 +641,7 @@ Respond ONLY with a valid JSON array:
 Return ONLY the JSON array, no markdown formatting, no explanatory text before or after."""
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self._generate(prompt)
 
             # Extract JSON from response
             response_text = response.text.strip()
@@ -426,6 +664,7 @@ Return ONLY the JSON array, no markdown formatting, no explanatory text before o
 
             # Enhance with full participant data
             enhanced_matches = []
+            to_cache = {}
             for match in matches:
                 candidate_id = match.get('candidate_id')
                 candidate = next((c for c in candidates if c.get('participant_id') == candidate_id), None)
@@ -437,23 +676,16 @@ Return ONLY the JSON array, no markdown formatting, no explanatory text before o
                         # Fallback reason if AI didn't provide one
                         ai_reason = f"Compatible teammate with {len(candidate.get('skills', []))} skills and {candidate.get('stats', {}).get('projects', 0)} projects."
 
-                    enhanced_match = {
-                        'participant_id': candidate.get('participant_id'),
-                        'name': candidate.get('name'),
-                        'role': candidate.get('role'),
-                        'profile_url': candidate.get('profile_url'),
-                        'skills': candidate.get('skills', []),
-                        'interests': candidate.get('interests', []),
-                        'stats': candidate.get('stats', {}),
-                        'photo_url': candidate.get('photo_url'),
-                        'match_score': match.get('match_score', 0),
-                        'match_reason': ai_reason
-                    }
+                    enhanced_match = self._build_match(candidate, match.get('match_score', 0), ai_reason)
                     enhanced_matches.append(enhanced_match)
+                    to_cache[self._cache_key(current_user_profile, candidate, None)] = (enhanced_match['match_score'], ai_reason)
 
                     # Debug: Print match info
                     print(f"Match: {candidate.get('name')} - Score: {match.get('match_score')} - Reason: {ai_reason[:100]}...")
 
+            # Only successful model answers are cached, never fallback scores
+            self.cache.set_many(to_cache)
+
             return enhanced_matches
 
         except Exception as e:
@@ -503,9 +735,89 @@ Return ONLY the JSON array, no markdown formatting, no explanatory text before o
 
         return matches
 
+    def summarize_teams(self, teams: List[List[Dict]], hackathon: str, batch_size: int = 10) -> List[Optional[str]]:
+        """
+        One Gemini-written summary per team (members given as participant documents),
+        `batch_size` teams per request on the shared batch executor. Teams whose batch
+        fails or runs past batch_timeout get None.
+        """
+        summaries: List[Optional[str]] = [None] * len(teams)
+        batches = [list(range(start, min(len(teams), start + batch_size)))
+                   for start in range(0, len(teams), batch_size)]
+        if not batches:
+            return summaries
+
+        start = time.perf_counter()
+        team_batches = [[teams[i] for i in batch] for batch in batches]
+        for index, batch_summaries in self._iter_completed(
+                lambda team_batch: self._summarize_team_batch(team_batch, hackathon), team_batches):
+            if batch_summaries is None:
+                print(f"Team summary batch {index + 1}/{len(batches)} timed out")
+                continue
+            for offset, summary in batch_summaries.items():
+                if 0 <= offset < len(batches[index]):
+                    summaries[batches[index][offset]] = summary
+
+        print(f"Summarized {sum(s is not None for s in summaries)}/{len(teams)} teams "
+              f"in {time.perf_counter() - start:.2f}s")
+        return summaries
+
+    def _summarize_team_batch(self, teams: List[List[Dict]], hackathon: str) -> Dict[int, str]:
+        """Use Gemini to summarize a batch of teams; returns {team index in batch: summary}"""
+        teams_text = ""
+        for idx, members in enumerate(teams):
+            teams_text += f"\n=== Team {idx + 1} ===\n"
+            for member in members:
+                teams_text += self.format_profile(member) + "\n"
+
+        prompt = f"""You are a hackathon organizer introducing newly formed teams for {hackathon}.
+
+TEAMS:
+{teams_text}
+
+For each team, write a short summary (2-3 sentences) of what the members bring together:
+how their skills complement each other, the interests they share and what kind of project
+they are well placed to build.
+
+Respond ONLY with a valid JSON array:
+[
+  {{
+    "team": 1,
+    "summary": "Pairs two backend developers experienced with Python and Flask with a React frontend specialist. All three share an interest in Machine Learning/AI, making them a natural fit for a data-driven web app."
+  }},
+  ...
+]
+
+Return ONLY the JSON array, no markdown formatting, no explanatory text before or after."""
+
+        try:
+            response = self._generate(prompt)
+            response_text = response.text.strip()
+
+            # Remove markdown code blocks if present
+            if response_text.startswith('```json'):
+                response_text = response_text[7:]
+            if response_text.startswith('```'):
+                response_text = response_text[3:]
+            if response_text.endswith('```'):
+                response_text = response_text[:-3]
+
+            summaries = {}
+            for entry in json.loads(response_text.strip()):
+                team = entry.get('team')
+                if isinstance(team, int) and entry.get('summary'):
+                    summaries[team - 1] = entry['summary']
+            return summaries
+
+        except Exception as e:
+            print(f"Error summarizing teams: {e}")
+            return {}
+
     def close(self):
-        """Close MongoDB connection"""
-        self.client.close()
+        """Stop the batch executor and close MongoDB connection if this matcher owns it"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._owns_client:
+            self.client.close()
 
 
 # Example usage
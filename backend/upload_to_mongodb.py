@@ -1,4 +1,13 @@
 from pymongo import MongoClient
+from ingest import summarize
+from bulk_loader import ThroughputReport
+from snapshots import HackathonSnapshots
+from neighbor_index import NeighborStore, refresh_neighbors
+from scoring_engine import quick_score_weights_from_env
+from participant_stream import IncompleteHackathon, is_stream_path, iter_hackathons, read_records
+from collections import Counter
+from itertools import chain
+import argparse
 import json
 from typing import Dict, List
 import os
@@ -14,68 +23,106 @@ class MongoDBUploader:
         self.client = MongoClient(connection_string)
 
     def upload_participants(self, json_file: str, database_name: str = "devpost_data",
-                          collection_name: str = "participants"):
+                          collection_name: str = "participants", follow: bool = False,
+                          chunk_size: int = 1000, workers: int = 4, max_retries: int = 5,
+                          neighbors_k: int = 50, neighbors_collection: str = "teammate_neighbors",
+                          quick_score_weights: Dict = None):
         """
         Upload participants data to MongoDB Atlas.
 
         Args:
-            json_file: Path to the JSON file containing participant data
+            json_file: Path to the participant data: an NDJSON stream (.ndjson or
+                .ndjson.gz, read one record at a time) or a legacy JSON file
+                mapping hackathon name to participants
             database_name: Name of the database to use
             collection_name: Name of the collection to use
+            follow: Keep reading an NDJSON file the scraper is still writing and
+                upload each hackathon as soon as it is complete
+            chunk_size: Documents per unordered bulk write
+            workers: Bulk writes in flight at once
+            max_retries: Retries per chunk on transient errors (failovers, timeouts, throttling)
+            neighbors_k: Teammate neighbors precomputed per participant after each
+                hackathon is published (0 = skip; find_teammates then scores live)
+            neighbors_collection: Collection of precomputed teammate neighbors
+            quick_score_weights: Prefilter weights the neighbors are ranked with (must
+                match the app's QUICK_SCORE_* settings to be used)
         """
-        # Read JSON data
-        print(f"📖 Reading data from {json_file}...")
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        print(f"📖 Reading data from {json_file}{' (following)' if follow else ''}...")
+        if is_stream_path(json_file):
+            hackathons = iter_hackathons(read_records(json_file, follow=follow))
+        else:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                hackathons = json.load(f).items()
 
-        # Get database and collection
+        # Get database and snapshot pointers
         db = self.client[database_name]
-        collection = db[collection_name]
-
-        # Prepare documents for insertion
-        all_participants = []
-
-        for hackathon_name, participants in data.items():
-            print(f"\n📦 Processing {hackathon_name}: {len(participants)} participants")
-
-            # Add hackathon name to each participant document
-            for participant in participants:
-                participant['hackathon'] = hackathon_name
-                all_participants.append(participant)
-
-        # Clear existing data (optional - comment out if you want to keep existing data)
-        print(f"\n🗑️  Clearing existing data in {collection_name}...")
-        collection.delete_many({})
-
-        # Insert all participants
-        print(f"\n⬆️  Uploading {len(all_participants)} participants to MongoDB Atlas...")
-
-        if all_participants:
-            result = collection.insert_many(all_participants)
-            print(f"✅ Successfully inserted {len(result.inserted_ids)} documents!")
-        else:
+        snapshots = HackathonSnapshots(db, base_collection_name=collection_name)
+        neighbor_store = NeighborStore(db[neighbors_collection], k=neighbors_k) if neighbors_k > 0 else None
+
+        # Each hackathon is synced into a new snapshot (indexed before it goes live)
+        # and readers switch to it atomically, so the app never sees partial data
+        totals = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'removed': 0, 'skipped': 0}
+        uploaded = {}
+        report = ThroughputReport('Written')
+
+        for hackathon_name, participants in hackathons:
+            print(f"\n📦 Processing {hackathon_name}")
+            participants = iter(participants)
+            first = next(participants, None)
+
+            if first is None:
+                # An empty scrape is far more likely a failure than a hackathon with no one left
+                print("  ⚠️  No participants in file, keeping stored data")
+                continue
+
+            try:
+                counts = summarize(snapshots.publish(
+                    hackathon_name, chain([first], participants),
+                    collect_changes=False,
+                    extra_indexes=('name', 'interests'),
+                    batch_size=chunk_size,
+                    workers=workers,
+                    max_retries=max_retries,
+                    report=report
+                ))
+            except IncompleteHackathon as e:
+                print(f"  ⚠️  {e}; keeping stored data")
+                continue
+
+            for key, value in counts.items():
+                totals[key] += value
+            uploaded[hackathon_name] = counts['inserted'] + counts['updated'] + counts['unchanged']
+
+            print(f"  ➕ {counts['inserted']} inserted, ✏️  {counts['updated']} updated, "
+                  f"= {counts['unchanged']} unchanged, ➖ {counts['removed']} removed")
+            if counts['skipped']:
+                print(f"  ⚠️  {counts['skipped']} participants without participant_id skipped")
+
+            if neighbor_store is not None:
+                try:
+                    refresh_neighbors(neighbor_store, snapshots, hackathon_name, quick_score_weights)
+                except Exception as e:
+                    print(f"  ⚠️  Could not precompute teammate neighbors: {e}")
+
+        if not uploaded:
             print("⚠️  No participants to upload")
             return
 
-        # Create indexes for better query performance
-        print("\n🔍 Creating indexes...")
-        collection.create_index("hackathon")
-        collection.create_index("participant_id")
-        collection.create_index("name")
-        collection.create_index("skills")
-        collection.create_index("interests")
-        print("✅ Indexes created!")
+        print(f"\n✅ Upload complete: {totals['inserted']} inserted, {totals['updated']} updated, "
+              f"{totals['unchanged']} unchanged, {totals['removed']} removed")
+        print(f"⏱️  {report.summary()}")
 
         # Display statistics
         print("\n" + "=" * 70)
         print("📊 Database Statistics:")
         print("=" * 70)
 
-        for hackathon_name in data.keys():
-            count = collection.count_documents({"hackathon": hackathon_name})
+        for hackathon_name, count in uploaded.items():
             print(f"  {hackathon_name}: {count} participants")
 
-        total = collection.count_documents({})
+        # Collection metadata counts; no scans
+        collections = snapshots.all_collections()
+        total = sum(c.estimated_document_count() for c in collections)
         print(f"  Total: {total} participants")
 
         # Sample queries
@@ -84,15 +131,15 @@ class MongoDBUploader:
         print("=" * 70)
 
         # Find participants with Python skills
-        python_devs = collection.count_documents({"skills": "python"})
+        python_devs = sum(c.count_documents({"skills": "python"}) for c in collections)
         print(f"  Participants with Python skills: {python_devs}")
 
         # Find participants with ML/AI interests
-        ml_interested = collection.count_documents({"interests": "Machine Learning/AI"})
+        ml_interested = sum(c.count_documents({"interests": "Machine Learning/AI"}) for c in collections)
         print(f"  Participants interested in ML/AI: {ml_interested}")
 
         # Find full-stack developers
-        fullstack = collection.count_documents({"role": "Full-stack developer"})
+        fullstack = sum(c.count_documents({"role": "Full-stack developer"}) for c in collections)
         print(f"  Full-stack developers: {fullstack}")
 
         print("\n✅ Upload complete!")
@@ -103,7 +150,7 @@ class MongoDBUploader:
         Demonstrate some example queries.
         """
         db = self.client[database_name]
-        collection = db[collection_name]
+        collections = HackathonSnapshots(db, base_collection_name=collection_name).all_collections()
 
         print("\n" + "=" * 70)
         print("📝 Example Query Results:")
@@ -111,9 +158,11 @@ class MongoDBUploader:
 
         # Example 1: Find participants with specific skills
         print("\n1. Top 3 participants with 'python' and 'javascript' skills:")
-        results = collection.find({
-            "skills": {"$all": ["python", "javascript"]}
-        }).limit(3)
+        results = [
+            participant
+            for collection in collections
+            for participant in collection.find({"skills": {"$all": ["python", "javascript"]}}).limit(3)
+        ][:3]
 
         for i, participant in enumerate(results, 1):
             print(f"   {i}. {participant['name']} - {participant.get('role', 'No role')} ({participant['hackathon']})")
@@ -121,9 +170,13 @@ class MongoDBUploader:
 
         # Example 2: Find participants with most projects
         print("\n2. Top 5 participants by number of projects:")
-        results = collection.find({
-            "stats.projects": {"$exists": True}
-        }).sort("stats.projects", -1).limit(5)
+        results = sorted(
+            (participant
+             for collection in collections
+             for participant in collection.find({"stats.projects": {"$exists": True}}).sort("stats.projects", -1).limit(5)),
+            key=lambda p: p.get('stats', {}).get('projects', 0),
+            reverse=True
+        )[:5]
 
         for i, participant in enumerate(results, 1):
             projects = participant.get('stats', {}).get('projects', 0)
@@ -132,15 +185,16 @@ class MongoDBUploader:
         # Example 3: Aggregate by role
         print("\n3. Participant count by role:")
         pipeline = [
-            {"$group": {"_id": "$role", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": 5}
+            {"$group": {"_id": "$role", "count": {"$sum": 1}}}
         ]
-        results = collection.aggregate(pipeline)
+        role_counts = Counter()
+        for collection in collections:
+            for result in collection.aggregate(pipeline):
+                role_counts[result['_id']] += result['count']
 
-        for i, result in enumerate(results, 1):
-            role = result['_id'] if result['_id'] else 'No role specified'
-            print(f"   {i}. {role}: {result['count']} participants")
+        for i, (role, count) in enumerate(role_counts.most_common(5), 1):
+            role = role if role else 'No role specified'
+            print(f"   {i}. {role}: {count} participants")
 
     def close(self):
         """Close the MongoDB connection."""
@@ -149,6 +203,23 @@ class MongoDBUploader:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Upload scraped Devpost participants to MongoDB')
+    parser.add_argument('file', nargs='?',
+                        default='participants_full.ndjson' if os.path.exists('participants_full.ndjson')
+                        else 'participants_full.json',
+                        help='NDJSON stream (.ndjson/.ndjson.gz) or JSON file written by scraper_selenium.py')
+    parser.add_argument('--follow', action='store_true',
+                        help='Upload hackathons from an .ndjson file as the scraper finishes them')
+    parser.add_argument('--chunk-size', type=int, default=int(os.getenv('UPLOAD_CHUNK_SIZE', '1000')),
+                        help='Documents per unordered bulk write')
+    parser.add_argument('--workers', type=int, default=int(os.getenv('UPLOAD_WORKERS', '4')),
+                        help='Bulk writes in flight at once')
+    parser.add_argument('--max-retries', type=int, default=int(os.getenv('UPLOAD_MAX_RETRIES', '5')),
+                        help='Retries per chunk on transient errors')
+    parser.add_argument('--neighbors-k', type=int, default=int(os.getenv('TEAMMATE_NEIGHBORS_K', '50')),
+                        help='Teammate neighbors precomputed per participant (0 = skip)')
+    args = parser.parse_args()
+
     # MongoDB Atlas connection string
     # Format: mongodb+srv://<username>:<password>@<cluster-url>/<database>?retryWrites=true&w=majority
 
@@ -170,9 +241,16 @@ def main():
 
         # Upload data
         uploader.upload_participants(
-            json_file='participants_full.json',
+            json_file=args.file,
             database_name='devpost_data',
-            collection_name='participants'
+            collection_name='participants',
+            follow=args.follow,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            max_retries=args.max_retries,
+            neighbors_k=args.neighbors_k,
+            neighbors_collection=os.getenv('TEAMMATE_NEIGHBORS_COLLECTION', 'teammate_neighbors'),
+            quick_score_weights=quick_score_weights_from_env()
         )
 
         # Run example queries
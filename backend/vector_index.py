@@ -0,0 +1,100 @@
+import numpy as np
+from collections import Counter
+from typing import List, Tuple
+import re
+import zlib
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#/.]+")
+
+
+def extract_features(text: str) -> Counter:
+    """
+    Hashed-feature bag for a profile or query: word unigrams, word bigrams and
+    character trigrams (so 'react' also matches 'reactjs', 'postgres' matches 'postgresql').
+    """
+    words = _TOKEN_PATTERN.findall(text.lower())
+    features = Counter()
+    for word in words:
+        features['w:' + word] += 1
+        padded = f"^{word}$"
+        for i in range(len(padded) - 2):
+            features['c:' + padded[i:i + 3]] += 1
+    for first, second in zip(words, words[1:]):
+        features[f"b:{first} {second}"] += 1
+    return features
+
+
+class ProfileVectorIndex:
+    """
+    TF-IDF vectors over hashed features, stored column-wise (feature -> rows, weights)
+    as NumPy arrays so a query touches only the columns of its own features.
+    Rows are L2-normalised, so the accumulated dot product is the cosine similarity.
+    """
+
+    def __init__(self, participant_ids: List[str], texts: List[str], n_features: int = 1 << 18):
+        self.participant_ids = list(participant_ids)
+        self.row_of = {pid: row for row, pid in enumerate(self.participant_ids)}
+        self.n_features = n_features
+
+        rows, columns, counts = [], [], []
+        for row, text in enumerate(texts):
+            for feature, count in self._hashed(extract_features(text)).items():
+                rows.append(row)
+                columns.append(feature)
+                counts.append(count)
+
+        rows = np.asarray(rows, dtype=np.int32)
+        columns = np.asarray(columns, dtype=np.int64)
+        tf = 1.0 + np.log(np.asarray(counts, dtype=np.float32))
+
+        n_docs = max(len(self.participant_ids), 1)
+        document_frequency = np.bincount(columns, minlength=n_features)
+        self.idf = (np.log((1 + n_docs) / (1 + document_frequency)) + 1.0).astype(np.float32)
+        weights = tf * self.idf[columns]
+
+        norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=n_docs)).astype(np.float32)
+        norms[norms == 0] = 1.0
+        weights = weights / norms[rows]
+
+        order = np.argsort(columns, kind='stable')
+        self.rows = rows[order]
+        self.weights = weights[order]
+        self.indptr = np.searchsorted(columns[order], np.arange(n_features + 1))
+
+    def __len__(self) -> int:
+        return len(self.participant_ids)
+
+    def _hashed(self, features: Counter) -> Counter:
+        hashed = Counter()
+        for feature, count in features.items():
+            hashed[zlib.crc32(feature.encode('utf-8')) % self.n_features] += count
+        return hashed
+
+    def similarities(self, query: str) -> np.ndarray:
+        """Cosine similarity of the query to every profile"""
+        scores = np.zeros(len(self.participant_ids), dtype=np.float32)
+        query_features = self._hashed(extract_features(query))
+        if not query_features:
+            return scores
+
+        columns = np.fromiter(query_features.keys(), dtype=np.int64)
+        weights = (1.0 + np.log(np.fromiter(query_features.values(), dtype=np.float32))) * self.idf[columns]
+        weights /= np.linalg.norm(weights) or 1.0
+
+        for column, weight in zip(columns, weights):
+            start, end = self.indptr[column], self.indptr[column + 1]
+            scores[self.rows[start:end]] += weight * self.weights[start:end]
+        return scores
+
+    def top_k(self, query: str, k: int, exclude_id: str = None) -> List[Tuple[str, float]]:
+        """(participant_id, similarity) for the k most similar profiles with similarity > 0"""
+        scores = self.similarities(query)
+        excluded = self.row_of.get(exclude_id)
+        if excluded is not None:
+            scores[excluded] = 0.0
+
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [(self.participant_ids[row], float(scores[row])) for row in candidates]
@@ -9,6 +9,7 @@ function Brewing() {
   const [progress, setProgress] = useState(0)
   const [currentStep, setCurrentStep] = useState('Initializing...')
   const [error, setError] = useState(null)
+  const [matchesFound, setMatchesFound] = useState(0)
   const hasCalledAPI = useRef(false)
 
   const hackathonUrl = location.state?.hackathonUrl
@@ -43,7 +44,8 @@ function Brewing() {
         const result = await brewTeammates(
           hackathonUrl,
           (progressValue) => setProgress(progressValue),
-          (stepText) => setCurrentStep(stepText)
+          (stepText) => setCurrentStep(stepText),
+          (matches) => setMatchesFound((found) => found + matches.length)
         )
 
         // Save results to sessionStorage for BrewResults page
@@ -121,6 +123,9 @@ function Brewing() {
               <p className="text-primary font-semibold mb-4">STATUS: ACTIVE</p>
               <div className="mb-2">
                 <p className="text-white mb-2">{currentStep}</p>
+                {matchesFound > 0 && (
+                  <p className="text-[#9db9a6] text-sm mb-2">{matchesFound} potential teammates scored so far</p>
+                )}
               <div className="flex items-center gap-4">
                 <div className="flex-1 bg-[#102216] rounded-full h-3 overflow-hidden">
                   <div
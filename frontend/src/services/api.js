@@ -9,10 +9,12 @@ const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://127.0.0.1:5000/api'
 
 /**
  * Scrape participants from a Devpost hackathon
+ * Queues a background scrape job and polls it until it finishes.
  * @param {string} hackathonUrl - Full Devpost URL (e.g., https://hackutd-2025.devpost.com/)
+ * @param {Function} onProgress - Optional, called with each job status ({ phase, participants_loaded, ... })
  * @returns {Promise<Object>} { success, hackathon, participants_count, message }
  */
-export const scrapeHackathon = async (hackathonUrl) => {
+export const scrapeHackathon = async (hackathonUrl, onProgress) => {
   try {
     const response = await fetch(`${API_BASE_URL}/scrape`, {
       method: 'POST',
@@ -27,13 +29,45 @@ export const scrapeHackathon = async (hackathonUrl) => {
       throw new Error(error.error || 'Failed to scrape hackathon')
     }
 
-    return await response.json()
+    let job = await response.json()
+
+    while (job.status === 'queued' || job.status === 'running') {
+      if (onProgress) onProgress(job)
+      await new Promise((resolve) => setTimeout(resolve, 2000))
+
+      const statusResponse = await fetch(`${API_BASE_URL}/scrape/${job.job_id}`)
+      job = await statusResponse.json()
+
+      if (!statusResponse.ok) {
+        throw new Error(job.error || 'Failed to get scrape status')
+      }
+    }
+
+    if (job.status !== 'succeeded') {
+      throw new Error(job.error || `Scrape ${job.status}`)
+    }
+
+    return job.result
   } catch (error) {
     console.error('Scrape hackathon error:', error)
     throw error
   }
 }
 
+/**
+ * Cancel a queued or running scrape job
+ * @param {string} jobId - Job id returned by the scrape endpoint
+ * @returns {Promise<Object>} Updated job status
+ */
+export const cancelScrape = async (jobId) => {
+  const response = await fetch(`${API_BASE_URL}/scrape/${jobId}`, { method: 'DELETE' })
+  const job = await response.json()
+  if (!response.ok) {
+    throw new Error(job.error || 'Failed to cancel scrape')
+  }
+  return job
+}
+
 /**
  * Find AI-matched teammates for a hackathon
  * @param {string} hackathon - Hackathon name (e.g., "hackutd-2025")
@@ -61,6 +95,48 @@ export const findTeammates = async (hackathon) => {
   }
 }
 
+/**
+ * Stream AI-matched teammates as each Gemini batch completes (Server-Sent Events)
+ * @param {string} hackathon - Hackathon name (e.g., "hackutd-2025")
+ * @param {Function} onEvent - Called with (eventName, data) for 'start', 'matches' and 'done'
+ * @returns {Promise<Object>} Resolves with the final { success, current_user, matches }.
+ *   Rejects with an error whose `connectionLost` is true when the stream could not be
+ *   opened or dropped, and false when the server reported a failure.
+ */
+export const streamTeammates = (hackathon, onEvent) => {
+  return new Promise((resolve, reject) => {
+    const params = new URLSearchParams({ hackathon })
+    const source = new EventSource(`${API_BASE_URL}/find-teammates/stream?${params}`)
+
+    const fail = (message, connectionLost) => {
+      source.close()
+      console.error('Stream teammates error:', message)
+      const error = new Error(message)
+      error.connectionLost = connectionLost
+      reject(error)
+    }
+
+    const forward = (name) => (event) => {
+      const data = JSON.parse(event.data)
+      if (onEvent) onEvent(name, data)
+      if (name === 'done') {
+        source.close()
+        resolve(data)
+      }
+    }
+
+    source.addEventListener('start', forward('start'))
+    source.addEventListener('matches', forward('matches'))
+    source.addEventListener('done', forward('done'))
+    // Failure reported by the server while streaming
+    source.addEventListener('failed', (event) => {
+      fail(JSON.parse(event.data).error || 'Teammate stream failed', false)
+    })
+    // Native EventSource error: the connection could not be opened or dropped
+    source.onerror = () => fail('Lost connection to the teammate stream', true)
+  })
+}
+
 /**
  * Get database statistics
  * @returns {Promise<Object>} { total_participants, hackathons }
@@ -87,15 +163,20 @@ export const getStats = async () => {
  * @param {string} hackathonUrl - Full Devpost URL
  * @param {function} onProgress - Callback for progress updates (0-100)
  * @param {function} onStepChange - Callback for step description updates
+ * @param {function} onMatches - Optional, called with each batch of matches as it streams in
  * @returns {Promise<Object>} Match results with current_user and matches
  */
-export const brewTeammates = async (hackathonUrl, onProgress, onStepChange) => {
+export const brewTeammates = async (hackathonUrl, onProgress, onStepChange, onMatches) => {
   try {
     // Step 1: Scrape hackathon (0-50%)
     if (onStepChange) onStepChange('Scraping participant data from Devpost...')
     if (onProgress) onProgress(10)
 
-    const scrapeResult = await scrapeHackathon(hackathonUrl)
+    const scrapeResult = await scrapeHackathon(hackathonUrl, (job) => {
+      if (onStepChange && job.participants_loaded) {
+        onStepChange(`Scraping participant data from Devpost... (${job.participants_loaded} loaded)`)
+      }
+    })
 
     if (onProgress) onProgress(50)
 
@@ -103,7 +184,25 @@ export const brewTeammates = async (hackathonUrl, onProgress, onStepChange) => {
     if (onStepChange) onStepChange(`Analyzing compatibility for ${scrapeResult.participants_count} participants...`)
     if (onProgress) onProgress(60)
 
-    const matchResult = await findTeammates(scrapeResult.hackathon)
+    // Stream matches as Gemini batches land (60-90%); fall back to the plain request
+    // if the stream cannot be used (e.g. a proxy that buffers or blocks SSE)
+    let matchResult
+    try {
+      matchResult = await streamTeammates(scrapeResult.hackathon, (name, data) => {
+        if (name === 'start' && onStepChange) {
+          onStepChange(`Analyzing compatibility of ${data.candidates} candidates with AI...`)
+        }
+        if (name === 'matches') {
+          if (onMatches) onMatches(data.matches)
+          if (onProgress && data.total_batches) {
+            onProgress(60 + Math.round((30 * data.completed_batches) / data.total_batches))
+          }
+        }
+      })
+    } catch (error) {
+      if (!error.connectionLost) throw error
+      matchResult = await findTeammates(scrapeResult.hackathon)
+    }
 
     if (onProgress) onProgress(90)
     if (onStepChange) onStepChange('Finalizing your perfect matches...')
@@ -123,7 +222,9 @@ export const brewTeammates = async (hackathonUrl, onProgress, onStepChange) => {
 
 export default {
   scrapeHackathon,
+  cancelScrape,
   findTeammates,
+  streamTeammates,
   getStats,
   brewTeammates,
 }